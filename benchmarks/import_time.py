@@ -0,0 +1,98 @@
+"""Import-time regression check for the longshot entry points.
+
+Imports each module in a fresh ``python -X importtime`` subprocess with the
+Kalshi/AWS settings removed from the environment, then fails if the import
+raised (i.e. needed credentials), pulled in a dependency that should only be
+loaded on first use, or exceeded ``--budget-ms``.
+
+Usage:
+    uv run python benchmarks/import_time.py
+    uv run python benchmarks/import_time.py --budget-ms 400 --top 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+# Deferred to first use everywhere in longshot
+HEAVY = frozenset({"boto3", "botocore", "s3fs", "aiobotocore", "duckdb", "pandas"})
+
+# Module → top-level packages it must not import
+TARGETS = {
+    "longshot.cli": HEAVY | {"pyarrow", "httpx", "pydantic"},
+    "longshot.config": HEAVY | {"pyarrow", "httpx", "pydantic", "dotenv"},
+    "longshot.api.client": HEAVY | {"pyarrow", "cryptography"},
+    "longshot.storage.s3": HEAVY,
+    "longshot.storage.athena": HEAVY,
+    "longshot.storage.db": HEAVY,
+}
+
+SETTINGS_ENV = (
+    "S3_BUCKET", "S3_PREFIX", "AWS_REGION", "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY", "KALSHI_API_KEY_ID", "KALSHI_PRIVATE_KEY",
+)
+
+
+def measure(module: str) -> tuple[int, dict[str, int], str | None]:
+    """Import *module* in a subprocess.
+
+    Returns ``(total_us, cumulative_us_by_top_level_package, error)``; every
+    package imported at any depth appears in the dict.
+    """
+    env = {k: v for k, v in os.environ.items() if k not in SETTINGS_ENV}
+    # Run outside the repo so no .env file can be picked up
+    with tempfile.TemporaryDirectory() as cwd:
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True, text=True, env=env, cwd=cwd,
+        )
+    packages: dict[str, int] = {}
+    total = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, raw_name = line.removeprefix("import time:").split("|")
+        name, us = raw_name.strip(), int(cumulative)
+        # Each nesting level adds two spaces; depth 0 has a single space
+        if not raw_name.startswith("  "):
+            total += us
+        top = name.split(".")[0]
+        packages[top] = max(packages.get(top, 0), us)
+    error = None if proc.returncode == 0 else proc.stderr.strip().splitlines()[-1]
+    return total, packages, error
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check import time and lazy imports of longshot modules.")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail if any import exceeds this")
+    parser.add_argument("--top", type=int, default=5, help="Heaviest packages to show per module")
+    args = parser.parse_args()
+
+    failures = []
+    for module, forbidden in TARGETS.items():
+        total_us, packages, error = measure(module)
+        imported = sorted(forbidden & packages.keys())
+        heaviest = sorted(packages.items(), key=lambda kv: kv[1], reverse=True)[: args.top]
+        print(f"{module:<26}{total_us / 1000:>8.1f} ms   " + ", ".join(f"{p} {us / 1000:.0f}" for p, us in heaviest))
+
+        if error:
+            failures.append(f"{module}: import failed without settings: {error}")
+        if imported:
+            failures.append(f"{module}: imports {', '.join(imported)} at module load")
+        if args.budget_ms is not None and total_us / 1000 > args.budget_ms:
+            failures.append(f"{module}: {total_us / 1000:.0f} ms > budget {args.budget_ms:.0f} ms")
+
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
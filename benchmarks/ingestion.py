@@ -0,0 +1,300 @@
+"""Ingestion throughput benchmarks against the mock Kalshi API.
+
+Each case runs in a fresh subprocess (so peak RSS is per case) at each
+requested size, and writes to a temporary local directory instead of S3, so
+no S3 or Kalshi credentials are needed:
+
+    markets_to_table     _markets_to_table over 1000-market pages
+    stream_markets       iter_market_pages → stream_all_markets_parquet
+    fetch_trades         fetch_all_trades over enough tickers for N trades
+    write_trades         write_trades_parquet of N trades
+
+Results (rows/s, pages/s, per-page or per-request latency percentiles, peak
+RSS) are printed and saved as JSON tagged with the git commit, so runs from
+different commits can be compared:
+
+Usage:
+    uv run python benchmarks/ingestion.py
+    uv run python benchmarks/ingestion.py --sizes 10000 100000 --case stream_markets
+    uv run python benchmarks/ingestion.py --latency-ms 20 --compare benchmarks/results/<baseline>.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+
+CASES = ("markets_to_table", "stream_markets", "fetch_trades", "write_trades")
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Mock universe shape: markets_per_event is a mean, so universes are ~N markets
+MARKETS_PER_EVENT = 5
+TRADES_PER_MARKET = 40
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _percentiles(latencies_s: list[float]) -> dict[str, float]:
+    if not latencies_s:
+        return {}
+    ms = np.asarray(latencies_s) * 1000
+    return {
+        "p50": round(float(np.percentile(ms, 50)), 3),
+        "p90": round(float(np.percentile(ms, 90)), 3),
+        "p99": round(float(np.percentile(ms, 99)), 3),
+        "max": round(float(ms.max()), 3),
+    }
+
+
+def _git_commit() -> tuple[str, bool]:
+    try:
+        sha = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True,
+        ).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+    return sha, dirty
+
+
+# ---------------------------------------------------------------------------
+# Cases (run inside the worker process)
+# ---------------------------------------------------------------------------
+
+def _use_local_storage(root: str) -> None:
+    from longshot.storage.backend import local_backend, set_backend
+
+    set_backend(local_backend(root))
+
+
+def _mock_api(size: int, latency_ms: float):
+    from longshot.testing.mock_api import MockConfig, MockKalshiAPI
+
+    return MockKalshiAPI(MockConfig(
+        n_events=max(1, size // MARKETS_PER_EVENT),
+        markets_per_event=MARKETS_PER_EVENT,
+        trades_per_market=TRADES_PER_MARKET,
+        latency_s=latency_ms / 1000,
+    ))
+
+
+class _TimedTransport:
+    """Wraps an httpx transport and records per-request latency."""
+
+    def __init__(self, inner) -> None:
+        self._inner = inner
+        self.latencies: list[float] = []
+
+    def handle_request(self, request):
+        start = time.perf_counter()
+        response = self._inner.handle_request(request)
+        self.latencies.append(time.perf_counter() - start)
+        return response
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+def _case_markets_to_table(size: int, latency_ms: float, workdir: str) -> dict:
+    from longshot.api.models import Market
+    from longshot.storage.s3 import _markets_to_table
+
+    api = _mock_api(size, latency_ms)
+    latencies, rows = [], 0
+    for start in range(0, min(size, api.universe.n_markets), 1000):
+        idx = np.arange(start, min(start + 1000, size, api.universe.n_markets))
+        page = [Market.model_validate(m) for m in api.universe.markets(idx)]
+        t0 = time.perf_counter()
+        _markets_to_table(page)
+        latencies.append(time.perf_counter() - t0)
+        rows += len(page)
+    return {"rows": rows, "pages": len(latencies), "elapsed_s": sum(latencies), "latencies": latencies}
+
+
+def _case_stream_markets(size: int, latency_ms: float, workdir: str) -> dict:
+    from longshot.api.client import KalshiClient
+    from longshot.ingestion.markets import iter_market_pages
+    from longshot.storage.s3 import stream_all_markets_parquet
+    from longshot.testing.mock_api import MOCK_BASE_URL
+
+    _use_local_storage(workdir)
+    api = _mock_api(size, latency_ms)
+    transport = _TimedTransport(api.transport())
+    with KalshiClient(base_url=MOCK_BASE_URL, transport=transport, auth=False) as client:
+        t0 = time.perf_counter()
+        _, rows, stages = stream_all_markets_parquet(iter_market_pages(client))
+        elapsed = time.perf_counter() - t0
+    return {
+        "rows": rows, "pages": len(transport.latencies), "elapsed_s": elapsed, "latencies": transport.latencies,
+        "stages": [s.as_dict() for s in stages],
+    }
+
+
+def _case_fetch_trades(size: int, latency_ms: float, workdir: str) -> dict:
+    from longshot.api.client import KalshiClient
+    from longshot.api.rate_limiter import TokenBucket
+    from longshot.ingestion.trades import fetch_all_trades
+    from longshot.testing.mock_api import MOCK_BASE_URL
+
+    api = _mock_api(size // TRADES_PER_MARKET, latency_ms)
+    counts = np.cumsum(api.universe.trade_counts)
+    n_tickers = int(np.searchsorted(counts, size)) + 1
+    tickers = [api.universe.market_ticker(m) for m in range(min(n_tickers, api.universe.n_markets))]
+
+    # Unthrottled: measures client + decode overhead, not the live rate limit
+    limiter = TokenBucket(rate=1e9)
+    transport = _TimedTransport(api.transport())
+    with KalshiClient(limiter, base_url=MOCK_BASE_URL, transport=transport, auth=False) as client:
+        t0 = time.perf_counter()
+        trades = fetch_all_trades(client, limiter, tickers, max_ts=api.config.now_ts)
+        elapsed = time.perf_counter() - t0
+    return {"rows": len(trades), "pages": len(transport.latencies), "elapsed_s": elapsed, "latencies": transport.latencies}
+
+
+def _case_write_trades(size: int, latency_ms: float, workdir: str) -> dict:
+    from longshot.api.models import Trade
+    from longshot.storage.s3 import write_trades_parquet
+
+    _use_local_storage(workdir)
+    api = _mock_api(size // TRADES_PER_MARKET, latency_ms)
+    trades: list[Trade] = []
+    for m in range(api.universe.n_markets):
+        trades.extend(Trade.model_validate(t) for t in api.universe.trades(m)[1])
+        if len(trades) >= size:
+            break
+    trades = trades[:size]
+    t0 = time.perf_counter()
+    write_trades_parquet(trades, api.config.now_ts)
+    elapsed = time.perf_counter() - t0
+    return {"rows": len(trades), "pages": 1, "elapsed_s": elapsed, "latencies": [elapsed]}
+
+
+_CASE_FUNCS = {
+    "markets_to_table": _case_markets_to_table,
+    "stream_markets": _case_stream_markets,
+    "fetch_trades": _case_fetch_trades,
+    "write_trades": _case_write_trades,
+}
+
+
+def _run_case(case: str, size: int, latency_ms: float) -> dict:
+    import logging
+
+    logging.disable(logging.WARNING)
+    with tempfile.TemporaryDirectory(prefix="longshot-bench-") as workdir:
+        # Set before any longshot import: settings resolve to local storage
+        # even if a module loads them eagerly or a .env points at S3
+        os.environ.update(STORAGE_BACKEND="local", LOCAL_STORAGE_ROOT=workdir)
+        rss_before = _peak_rss_mb()
+        out = _CASE_FUNCS[case](size, latency_ms, workdir)
+    elapsed = out["elapsed_s"]
+    return {
+        "case": case,
+        "size": size,
+        "rows": out["rows"],
+        "pages": out["pages"],
+        "elapsed_s": round(elapsed, 4),
+        "rows_per_s": round(out["rows"] / elapsed, 1) if elapsed else None,
+        "pages_per_s": round(out["pages"] / elapsed, 2) if elapsed else None,
+        "latency_ms": _percentiles(out["latencies"]),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "setup_rss_mb": round(rss_before, 1),
+        **({"stages": out["stages"]} if "stages" in out else {}),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+def _print_results(results: list[dict]) -> None:
+    print(f"\n{'case':<18}{'size':>10}{'rows':>10}{'rows/s':>13}{'pages/s':>10}{'p50 ms':>9}{'p99 ms':>9}{'peak MB':>9}")
+    for r in results:
+        lat = r["latency_ms"]
+        print(
+            f"{r['case']:<18}{r['size']:>10,}{r['rows']:>10,}{r['rows_per_s'] or 0:>13,.0f}"
+            f"{r['pages_per_s'] or 0:>10,.1f}{lat.get('p50', 0):>9.2f}{lat.get('p99', 0):>9.2f}{r['peak_rss_mb']:>9.0f}"
+        )
+
+
+def _print_comparison(results: list[dict], baseline_path: Path) -> None:
+    baseline = json.loads(baseline_path.read_text())
+    old = {(r["case"], r["size"]): r for r in baseline["results"]}
+    print(f"\nvs {baseline_path.name} ({baseline['meta']['commit']}):")
+    print(f"{'case':<18}{'size':>10}{'rows/s':>12}{'peak MB':>12}")
+    for r in results:
+        prev = old.get((r["case"], r["size"]))
+        if prev is None or not prev["rows_per_s"] or not r["rows_per_s"]:
+            continue
+        speed = r["rows_per_s"] / prev["rows_per_s"]
+        mem = r["peak_rss_mb"] / prev["peak_rss_mb"]
+        print(f"{r['case']:<18}{r['size']:>10,}{speed:>11.2f}x{mem:>11.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ingestion throughput against the mock Kalshi API.")
+    parser.add_argument("--case", choices=CASES, action="append", default=None, help="Case to run (repeatable; default: all)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Row counts (default: %(default)s)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mock API latency per request (default: 0)")
+    parser.add_argument("--output", type=Path, default=None, help="Results JSON (default: benchmarks/results/<timestamp>-<commit>.json)")
+    parser.add_argument("--compare", type=Path, default=None, help="Earlier results JSON to compare against")
+    args = parser.parse_args()
+
+    commit, dirty = _git_commit()
+    started = datetime.now(timezone.utc)
+    results = []
+    ctx = get_context("spawn")
+    for case in args.case or CASES:
+        for size in args.sizes:
+            print(f"Running {case} @ {size:,} ...", flush=True)
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                results.append(pool.submit(_run_case, case, size, args.latency_ms).result())
+
+    _print_results(results)
+
+    import pyarrow
+
+    payload = {
+        "meta": {
+            "commit": commit,
+            "dirty": dirty,
+            "started_at": started.isoformat(),
+            "python": platform.python_version(),
+            "pyarrow": pyarrow.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "latency_ms": args.latency_ms,
+        },
+        "results": results,
+    }
+    output = args.output or RESULTS_DIR / f"{started:%Y%m%dT%H%M%S}-{commit}{'-dirty' if dirty else ''}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(payload, indent=2))
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        _print_comparison(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
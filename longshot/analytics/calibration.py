@@ -0,0 +1,575 @@
+"""Calibration curves of settled markets: implied probability vs realised win rate.
+
+Replaces the Athena ``CASE``-binned win rates of the descriptive notebook
+(``calibration_analysis``) with a NumPy group-by over ``(group, price bin)``
+cells for arbitrary bin edges, with bootstrap confidence intervals.
+
+The bootstrap resamples markets with replacement *within each cell* (bin
+counts held fixed).  For 0/1 outcomes the number of wins in a resample of a
+cell with ``n`` markets and win rate ``r`` is exactly ``Binomial(n, r)``, so
+all replicates of all cells are drawn as one ``(cells, n_boot)`` matrix
+whose cost is independent of the number of markets; a grouped curve over
+millions of settled markets is dominated by a few ``bincount`` passes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+logger = logging.getLogger(__name__)
+
+# Price bins in cents, right-closed ``(lo, hi]``: the notebook's CASE bins
+DEFAULT_EDGES = np.array([0, 5, 10, 15, 20, 30, 40, 50, 60, 70, 80, 90, 100], dtype=np.float64)
+
+
+def _to_numpy(values: Any, dtype=np.float64) -> np.ndarray:
+    if isinstance(values, (pa.Array, pa.ChunkedArray)):
+        values = pc.cast(values, pa.float64()).fill_null(np.nan).to_numpy(zero_copy_only=False)
+    return np.asarray(values, dtype=dtype)
+
+
+def outcomes_from_result(result: Any) -> np.ndarray:
+    """``result`` strings → 1.0 for ``"yes"``, 0.0 for ``"no"``, NaN otherwise (unsettled, void)."""
+    arr = result if isinstance(result, (pa.Array, pa.ChunkedArray)) else pa.array(result, pa.string())
+    yes = pc.fill_null(pc.equal(arr, "yes"), False).to_numpy(zero_copy_only=False)
+    no = pc.fill_null(pc.equal(arr, "no"), False).to_numpy(zero_copy_only=False)
+    return np.where(yes, 1.0, np.where(no, 0.0, np.nan))
+
+
+def bin_index(prices: Any, edges: Any = DEFAULT_EDGES) -> np.ndarray:
+    """Bin of each price for right-closed bins ``(edges[i], edges[i + 1]]``; -1 outside or NaN."""
+    edges = np.asarray(edges, dtype=np.float64)
+    if edges.ndim != 1 or len(edges) < 2 or np.any(np.diff(edges) <= 0):
+        raise ValueError("edges must be a 1-D strictly increasing array of at least two values")
+    prices = _to_numpy(prices)
+    idx = np.searchsorted(edges, prices, side="left") - 1
+    outside = (idx < 0) | (idx >= len(edges) - 1) | np.isnan(prices)
+    return np.where(outside, -1, idx)
+
+
+def calibration_curve(
+    prices: Any,
+    outcomes: Any,
+    edges: Any = DEFAULT_EDGES,
+    *,
+    groups: Any | None = None,
+    n_boot: int = 1000,
+    ci: float = 0.95,
+    seed: int | None = 0,
+) -> pa.Table:
+    """Win rate per price bin (and group) with bootstrap confidence intervals.
+
+    Parameters
+    ----------
+    prices:
+        Per-market price in cents (e.g. ``yes_ask``), Arrow or NumPy.
+    outcomes:
+        Per-market 1/0 (YES/NO), NaN for markets to ignore; see
+        ``outcomes_from_result``.
+    edges:
+        Bin edges in cents; bins are ``(edges[i], edges[i + 1]]``.  Prices
+        outside ``(edges[0], edges[-1]]`` are ignored.
+    groups:
+        Optional per-market label (category, series, ...).  Nulls form their
+        own group.
+    n_boot, ci:
+        Bootstrap replicates and confidence level; ``n_boot=0`` skips the
+        intervals (returned as null).
+    seed:
+        Seed for the bootstrap draws, so curves are reproducible.
+
+    Returns one row per non-empty cell, sorted by ``group`` (if grouped) and
+    bin: ``bin_lo``, ``bin_hi``, ``n``, ``wins``, ``mean_price``,
+    ``implied_prob`` (``mean_price / 100``), ``win_rate``, ``ci_low``,
+    ``ci_high`` and ``edge`` (``implied_prob - win_rate``, positive where
+    contracts are overpriced) with its interval ``edge_ci_low`` /
+    ``edge_ci_high``.
+    """
+    if not 0 < ci < 1:
+        raise ValueError(f"ci must be in (0, 1), got {ci}")
+    edges = np.asarray(edges, dtype=np.float64)
+    price = _to_numpy(prices)
+    won = _to_numpy(outcomes)
+    n = len(price)
+    if len(won) != n:
+        raise ValueError(f"prices has {n} rows but outcomes has {len(won)}")
+    bins = bin_index(price, edges)
+    n_bins = len(edges) - 1
+
+    if groups is not None:
+        groups = groups if isinstance(groups, (pa.Array, pa.ChunkedArray)) else pa.array(groups)
+        if isinstance(groups, pa.ChunkedArray):
+            groups = groups.combine_chunks()
+        encoded = groups.dictionary_encode(null_encoding="encode")
+        if len(encoded) != n:
+            raise ValueError(f"groups has {len(encoded)} rows but prices have {n}")
+        labels = encoded.dictionary
+        # Codes ranked by label, so output is sorted by group (nulls last)
+        order = pc.array_sort_indices(labels, null_placement="at_end").to_numpy()
+        rank = np.empty(len(labels), dtype=np.int64)
+        rank[order] = np.arange(len(labels))
+        codes = rank[encoded.indices.to_numpy(zero_copy_only=False)]
+        labels = labels.take(pa.array(order))
+        n_groups = len(labels)
+    else:
+        codes = np.zeros(n, dtype=np.int64)
+        labels = None
+        n_groups = 1
+
+    valid = (bins >= 0) & ~np.isnan(won)
+    cell = codes[valid] * n_bins + bins[valid]
+    size = n_groups * n_bins
+    counts = np.bincount(cell, minlength=size)
+    wins = np.bincount(cell, weights=won[valid], minlength=size)
+    price_sum = np.bincount(cell, weights=price[valid], minlength=size)
+
+    cells = np.flatnonzero(counts)
+    count = counts[cells]
+    win_rate = wins[cells] / count
+    implied = price_sum[cells] / count / 100.0
+
+    if n_boot > 0:
+        rng = np.random.default_rng(seed)
+        boot = rng.binomial(count[:, None], win_rate[:, None], size=(len(cells), n_boot)) / count[:, None]
+        alpha = (1 - ci) / 2
+        ci_low, ci_high = np.quantile(boot, [alpha, 1 - alpha], axis=1)
+        valid_ci = np.ones(len(cells), dtype=bool)
+    else:
+        ci_low = ci_high = np.full(len(cells), np.nan)
+        valid_ci = np.zeros(len(cells), dtype=bool)
+
+    def _nullable(values: np.ndarray) -> pa.Array:
+        return pa.array(values, pa.float64(), mask=~valid_ci)
+
+    b = cells % n_bins
+    columns: dict[str, Any] = {}
+    if labels is not None:
+        columns["group"] = labels.take(pa.array(cells // n_bins))
+    columns.update(
+        {
+            "bin_lo": edges[b],
+            "bin_hi": edges[b + 1],
+            "n": count,
+            "wins": wins[cells].astype(np.int64),
+            "mean_price": implied * 100.0,
+            "implied_prob": implied,
+            "win_rate": win_rate,
+            "ci_low": _nullable(ci_low),
+            "ci_high": _nullable(ci_high),
+            "edge": implied - win_rate,
+            "edge_ci_low": _nullable(implied - ci_high),
+            "edge_ci_high": _nullable(implied - ci_low),
+        }
+    )
+    return pa.table(columns)
+
+
+def market_calibration(
+    markets: pa.Table,
+    edges: Any = DEFAULT_EDGES,
+    *,
+    price: str = "yes_ask",
+    group_by: str | None = None,
+    **kwargs,
+) -> pa.Table:
+    """``calibration_curve`` over settled rows of a ``MARKETS_SCHEMA``-style table.
+
+    Outcomes come from ``result``; rows not settled ``yes``/``no`` are
+    ignored.  *group_by* is a markets column, or ``series_ticker`` /
+    ``series_category`` / ``series_title`` / ``series_frequency``, resolved
+    through the series dimension table (``longshot.storage.series``).
+    Remaining keyword arguments go to ``calibration_curve``.
+    """
+    groups = None
+    if group_by is not None:
+        if group_by not in markets.column_names or group_by == "series_ticker":
+            from longshot.storage.series import join_series
+
+            markets = join_series(markets)
+        groups = markets.column(group_by)
+    return calibration_curve(
+        markets.column(price),
+        outcomes_from_result(markets.column("result")),
+        edges,
+        groups=groups,
+        **kwargs,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Fitted calibration model
+# ---------------------------------------------------------------------------
+
+# Becker (2026) base rates: market price (cents) -> true probability
+ACADEMIC_CALIBRATION = {1: 0.0043, 3: 0.020, 5: 0.0418, 10: 0.075, 15: 0.12}
+
+CALIBRATION_METHODS = ("logistic", "isotonic")
+
+_CENTS = np.arange(1, 100, dtype=np.float64)
+_LOGIT_CENTS = np.log(_CENTS / (100.0 - _CENTS))
+
+
+def _isotonic(y: np.ndarray, w: np.ndarray) -> np.ndarray:
+    """Weighted pool-adjacent-violators fit of a non-decreasing sequence."""
+    values, weights, sizes = [], [], []
+    for yi, wi in zip(y.tolist(), w.tolist()):
+        values.append(yi)
+        weights.append(wi)
+        sizes.append(1)
+        while len(values) > 1 and values[-2] > values[-1]:
+            wsum = weights[-2] + weights[-1]
+            values[-2] = (values[-2] * weights[-2] + values[-1] * weights[-1]) / wsum
+            weights[-2] = wsum
+            sizes[-2] += sizes[-1]
+            del values[-1], weights[-1], sizes[-1]
+    return np.repeat(values, sizes)
+
+
+def _sigmoid(z: np.ndarray) -> np.ndarray:
+    return 0.5 * (1.0 + np.tanh(0.5 * z))
+
+
+def _fit_logistic(wins: np.ndarray, counts: np.ndarray, l2: float, n_iter: int = 100) -> np.ndarray:
+    """``(G, 2)`` intercept/slope of ``logit(p) = a + b * logit(price)`` per row of cell counts.
+
+    Batched damped Newton steps on the binomial log-likelihood with an L2
+    pull towards ``a = 0, b = 1`` (a perfectly calibrated market), which
+    keeps sparse or separable groups finite.
+    """
+    x = _LOGIT_CENTS[None, :]
+    prior = np.array([0.0, 1.0])
+
+    def _objective(beta: np.ndarray) -> np.ndarray:
+        eta = beta[:, :1] + beta[:, 1:] * x
+        ll = (wins * eta - counts * np.logaddexp(0.0, eta)).sum(axis=1)
+        return ll - 0.5 * l2 * ((beta - prior) ** 2).sum(axis=1)
+
+    beta = np.tile(prior, (len(counts), 1))
+    current = _objective(beta)
+    for _ in range(n_iter):
+        mu = _sigmoid(beta[:, :1] + beta[:, 1:] * x)
+        resid = wins - counts * mu
+        v = counts * mu * (1.0 - mu)
+        grad = np.stack([resid.sum(axis=1), (resid * x).sum(axis=1)], axis=1) - l2 * (beta - prior)
+        hess = np.empty((len(counts), 2, 2))
+        hess[:, 0, 0] = v.sum(axis=1) + l2
+        hess[:, 0, 1] = hess[:, 1, 0] = (v * x).sum(axis=1)
+        hess[:, 1, 1] = (v * x * x).sum(axis=1) + l2
+        step = np.linalg.solve(hess, grad[:, :, None])[:, :, 0]
+
+        # Halve the step of every group whose objective would not improve
+        scale = np.ones(len(counts))
+        for _ in range(40):
+            trial = beta + scale[:, None] * step
+            value = _objective(trial)
+            worse = value < current
+            if not worse.any():
+                break
+            scale[worse] /= 2
+        else:
+            trial, value = np.where(worse[:, None], beta, trial), np.where(worse, current, value)
+        beta, current = trial, value
+        if np.abs(scale[:, None] * step).max() < 1e-10:
+            break
+    return beta
+
+
+class CalibrationModel:
+    """Market price → true YES probability, per category with a pooled fallback.
+
+    Either ``logistic`` (``logit(p) = a + b * logit(price / 100)``, one
+    ``(a, b)`` per category) or a piecewise-linear ``table`` over price knots
+    (isotonic fits, and the five-point ``ACADEMIC_CALIBRATION``), interpolated
+    like ``np.interp`` — flat beyond the end knots.  Row 0 of the parameters
+    is the pooled fit, used for categories that are unknown, null, or had
+    fewer than ``min_count`` observations when fitted.
+
+    Build with ``fit`` / ``fit_markets`` / ``academic``; evaluate with
+    ``true_prob``; persist with ``to_dict`` / ``save`` / ``load``.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        categories: list[str] | None = None,
+        *,
+        params: Any = None,
+        knots: Any = None,
+        values: Any = None,
+        meta: dict | None = None,
+    ) -> None:
+        if kind not in ("logistic", "table"):
+            raise ValueError(f"kind must be 'logistic' or 'table', got {kind!r}")
+        self.kind = kind
+        self.categories = list(categories or [])
+        self.meta = dict(meta or {})
+        rows = len(self.categories) + 1
+        if kind == "logistic":
+            self.params = np.asarray(params, dtype=np.float64).reshape(rows, 2)
+        else:
+            self.knots = np.asarray(knots, dtype=np.float64)
+            if self.knots.ndim != 1 or len(self.knots) < 2 or np.any(np.diff(self.knots) <= 0):
+                raise ValueError("knots must be a 1-D strictly increasing array of at least two values")
+            self.values = np.asarray(values, dtype=np.float64).reshape(rows, len(self.knots))
+            # Evenly spaced knots (fitted per-cent tables) are located arithmetically
+            gaps = np.diff(self.knots)
+            self._spacing = float(gaps[0]) if np.allclose(gaps, gaps[0]) else None
+        self._index = pa.array(self.categories, pa.string())
+
+    # -- construction -------------------------------------------------------
+
+    @classmethod
+    def academic(cls) -> CalibrationModel:
+        """The Becker (2026) five-point lookup the screening notebook used."""
+        prices = sorted(ACADEMIC_CALIBRATION)
+        return cls(
+            "table",
+            knots=prices,
+            values=[ACADEMIC_CALIBRATION[p] for p in prices],
+            meta={"source": "academic"},
+        )
+
+    @classmethod
+    def fit(
+        cls,
+        prices: Any,
+        outcomes: Any,
+        categories: Any | None = None,
+        *,
+        method: str = "logistic",
+        weights: Any | None = None,
+        min_count: int = 500,
+        l2: float = 1.0,
+    ) -> CalibrationModel:
+        """Fit price → win probability, pooled and per category.
+
+        Parameters
+        ----------
+        prices:
+            Prices in cents, rounded to whole cents for fitting; prices
+            outside 1–99¢ are ignored.
+        outcomes:
+            1/0 per observation, NaN to ignore (``outcomes_from_result``).
+        categories:
+            Optional per-observation category; nulls count only towards the
+            pooled fit.
+        method:
+            ``"logistic"`` (two parameters per category, smooth) or
+            ``"isotonic"`` (monotone step function, interpolated between
+            cents).
+        weights:
+            Optional per-observation weight (e.g. contracts per trade).
+        min_count:
+            Categories with fewer (unweighted) observations use the pooled fit.
+        l2:
+            Logistic only: strength of the pull towards the identity map.
+        """
+        if method not in CALIBRATION_METHODS:
+            raise ValueError(f"method must be one of {CALIBRATION_METHODS}, got {method!r}")
+        cents = np.rint(_to_numpy(prices))
+        won = _to_numpy(outcomes)
+        w = np.ones(len(cents)) if weights is None else _to_numpy(weights)
+        if not len(cents) == len(won) == len(w):
+            raise ValueError("prices, outcomes and weights must have the same length")
+        valid = (cents >= 1) & (cents <= 99) & ~np.isnan(won) & ~np.isnan(w)
+
+        labels: list[str] = []
+        codes = np.zeros(len(cents), dtype=np.int64)
+        if categories is not None:
+            cats = categories if isinstance(categories, (pa.Array, pa.ChunkedArray)) else pa.array(categories, pa.string())
+            if isinstance(cats, pa.ChunkedArray):
+                cats = cats.combine_chunks()
+            encoded = cats.dictionary_encode()
+            labels = encoded.dictionary.to_pylist()
+            # Code 0 is the pooled row; nulls stay there
+            codes = encoded.indices.fill_null(-1).to_numpy(zero_copy_only=False).astype(np.int64) + 1
+
+        rows = len(labels) + 1
+        cell = (codes[valid] * 99 + cents[valid].astype(np.int64) - 1)
+        size = rows * 99
+        obs = np.bincount(cell, minlength=size).reshape(rows, 99)
+        counts = np.bincount(cell, weights=w[valid], minlength=size).reshape(rows, 99)
+        wins = np.bincount(cell, weights=(w * won)[valid], minlength=size).reshape(rows, 99)
+        # Pooled row: every valid observation, categorised or not
+        obs[0], counts[0], wins[0] = obs.sum(axis=0), counts.sum(axis=0), wins.sum(axis=0)
+
+        n_obs = obs.sum(axis=1)
+        if n_obs[0] == 0:
+            raise ValueError("no observations with a 1-99¢ price and a settled outcome")
+        keep = sorted((i for i in range(1, rows) if n_obs[i] >= max(min_count, 1)), key=lambda i: labels[i - 1])
+        dropped = len(labels) - len(keep)
+        if dropped:
+            logger.info("%d categories below min_count=%d use the pooled calibration", dropped, min_count)
+        sel = [0, *keep]
+        labels = [labels[i - 1] for i in keep]
+        meta = {
+            "method": method,
+            "min_count": min_count,
+            "n_obs": {"*": int(n_obs[0]), **{lab: int(n_obs[i]) for lab, i in zip(labels, keep)}},
+        }
+
+        if method == "logistic":
+            meta["l2"] = l2
+            return cls("logistic", labels, params=_fit_logistic(wins[sel], counts[sel], l2), meta=meta)
+
+        values = np.empty((len(sel), 99))
+        for row, i in enumerate(sel):
+            seen = counts[i] > 0
+            fitted = _isotonic(wins[i, seen] / counts[i, seen], counts[i, seen])
+            # Cents never observed take the neighbouring fitted values
+            values[row] = np.interp(_CENTS, _CENTS[seen], fitted)
+        return cls("table", labels, knots=_CENTS, values=values, meta=meta)
+
+    @classmethod
+    def fit_markets(
+        cls,
+        markets: pa.Table,
+        *,
+        price: str = "yes_ask",
+        group_by: str | None = "series_category",
+        **kwargs,
+    ) -> CalibrationModel:
+        """``fit`` over settled rows of a markets (or trades-with-result) table.
+
+        *group_by* resolves like ``market_calibration``; ``None`` fits only
+        the pooled curve.
+        """
+        categories = None
+        if group_by is not None:
+            if group_by not in markets.column_names or group_by == "series_ticker":
+                from longshot.storage.series import join_series
+
+                markets = join_series(markets)
+            categories = markets.column(group_by)
+        return cls.fit(
+            markets.column(price), outcomes_from_result(markets.column("result")), categories, **kwargs,
+        )
+
+    @classmethod
+    def fit_trades(
+        cls,
+        trades: pa.Table,
+        markets: pa.Table,
+        *,
+        group_by: str | None = "series_category",
+        by_contracts: bool = False,
+        **kwargs,
+    ) -> CalibrationModel:
+        """``fit`` on traded prices: each trade's ``yes_price`` against its market's ``result``.
+
+        Trades are matched to *markets* by ticker; *group_by* is a column of
+        *markets* resolved like ``market_calibration``.  With *by_contracts*
+        each trade is weighted by its ``count``.
+        """
+        if group_by is not None and (group_by not in markets.column_names or group_by == "series_ticker"):
+            from longshot.storage.series import join_series
+
+            markets = join_series(markets)
+        markets = markets.select(["ticker", "result"] + ([group_by] if group_by is not None else []))
+        # Row of each trade's market in the markets table (broadcast lookup)
+        idx = pc.index_in(trades.column("ticker"), value_set=markets.column("ticker").combine_chunks())
+        matched = markets.take(idx)
+        return cls.fit(
+            trades.column("yes_price"),
+            outcomes_from_result(matched.column("result")),
+            matched.column(group_by) if group_by is not None else None,
+            weights=trades.column("count") if by_contracts else None,
+            **kwargs,
+        )
+
+    # -- evaluation ---------------------------------------------------------
+
+    def _rows(self, categories: Any | None, n: int) -> np.ndarray:
+        if categories is None or not self.categories:
+            return np.zeros(n, dtype=np.int64)
+        cats = categories if isinstance(categories, (pa.Array, pa.ChunkedArray)) else pa.array(categories, pa.string())
+        if len(cats) != n:
+            raise ValueError(f"categories has {len(cats)} rows but prices have {n}")
+        idx = pc.index_in(cats, value_set=self._index)
+        return pc.fill_null(idx, -1).to_numpy(zero_copy_only=False).astype(np.int64) + 1
+
+    def true_prob(self, prices: Any, categories: Any | None = None) -> np.ndarray:
+        """Estimated YES probability for each price (cents) and optional category."""
+        price = _to_numpy(prices)
+        rows = self._rows(categories, len(price))
+        if self.kind == "logistic":
+            p = np.clip(price, 0.5, 99.5) / 100.0
+            a, b = self.params[rows, 0], self.params[rows, 1]
+            out = _sigmoid(a + b * np.log(p / (1.0 - p)))
+        else:
+            k = self.knots
+            x = np.clip(price, k[0], k[-1])
+            if self._spacing is not None:
+                j = np.minimum(((x - k[0]) / self._spacing).astype(np.int64), len(k) - 2)
+            else:
+                j = np.clip(np.searchsorted(k, x, side="right") - 1, 0, len(k) - 2)
+            frac = (x - k[j]) / (k[j + 1] - k[j])
+            flat = rows * len(k) + j
+            values = self.values.ravel()
+            out = values[flat] * (1.0 - frac) + values[flat + 1] * frac
+        return np.where(np.isnan(price), np.nan, out)
+
+    def edge(self, prices: Any, categories: Any | None = None) -> np.ndarray:
+        """Per-contract edge of selling YES (buying NO): ``price / 100 - true_prob``."""
+        return _to_numpy(prices) / 100.0 - self.true_prob(prices, categories)
+
+    # -- persistence --------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        out: dict[str, Any] = {"kind": self.kind, "categories": self.categories, "meta": self.meta}
+        if self.kind == "logistic":
+            out["params"] = self.params.tolist()
+        else:
+            out["knots"] = self.knots.tolist()
+            out["values"] = self.values.tolist()
+        return out
+
+    @classmethod
+    def from_dict(cls, data: dict) -> CalibrationModel:
+        return cls(
+            data["kind"],
+            data.get("categories"),
+            params=data.get("params"),
+            knots=data.get("knots"),
+            values=data.get("values"),
+            meta=data.get("meta"),
+        )
+
+    def save(self, name: str = "default") -> str:
+        """Write the model as JSON to ``calibration/{name}.json`` in storage. Returns the path."""
+        from longshot.storage.s3 import _base_path, _get_fs
+        from longshot.storage.writer import atomic_open
+
+        path = f"{_base_path()}/calibration/{name}.json"
+        with atomic_open(path, fs=_get_fs()) as f:
+            f.write(json.dumps(self.to_dict()).encode())
+        logger.info("Wrote %s calibration model %r to %s", self.kind, name, path)
+        return path
+
+    @classmethod
+    def load(cls, name: str = "default") -> CalibrationModel:
+        """Read a model written by ``save``."""
+        from longshot.storage.s3 import _base_path, _get_fs
+
+        path = f"{_base_path()}/calibration/{name}.json"
+        fs = _get_fs()
+        if not fs.exists(path):
+            raise RuntimeError(f"No calibration model at {path}; fit one with scripts/fit_calibration.py")
+        with fs.open(path, "rb") as f:
+            return cls.from_dict(json.loads(f.read()))
+
+    @classmethod
+    def load_or_academic(cls, name: str = "default") -> CalibrationModel:
+        """``load(name)`` when that model has been fitted, else ``academic()``."""
+        from longshot.storage.s3 import _base_path, _get_fs
+
+        if _get_fs().exists(f"{_base_path()}/calibration/{name}.json"):
+            return cls.load(name)
+        logger.info("No fitted calibration model %r; using the academic curve", name)
+        return cls.academic()
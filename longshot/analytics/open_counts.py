@@ -0,0 +1,161 @@
+"""Sweep-line counts of open markets over a grid of snapshot timestamps.
+
+Replaces the ``CROSS JOIN`` of a date series against every market (which is
+O(days × markets)) with an event sweep: each market contributes a ``+1`` at
+the first grid point where it is open and a ``-1`` at the first grid point
+where it has closed, and a cumulative sum over the grid yields the open count
+at every snapshot.  Total cost is O(n log g + groups × g) for *n* markets and
+*g* grid points.
+
+A market is open at snapshot *t* when ``open_time <= t < close_time`` — the
+same rule the Athena notebooks use.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import date, datetime, timezone
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Sentinel for missing / unparseable timestamps
+MISSING_TS = np.iinfo(np.int64).min
+
+
+def to_epoch_seconds(values: Any) -> np.ndarray:
+    """Convert ISO 8601 strings, Arrow timestamps or ints to int64 Unix seconds.
+
+    Nulls and empty strings become ``MISSING_TS``.
+    """
+    arr = values if isinstance(values, (pa.Array, pa.ChunkedArray)) else pa.array(values)
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+
+    if pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type):
+        arr = pc.if_else(pc.equal(arr, ""), pa.scalar(None, arr.type), arr)
+        arr = arr.cast(pa.timestamp("us", tz="UTC"))
+    if pa.types.is_timestamp(arr.type):
+        arr = arr.cast(pa.timestamp("s", tz=arr.type.tz), safe=False).cast(pa.int64())
+
+    return arr.cast(pa.int64()).fill_null(MISSING_TS).to_numpy(zero_copy_only=False)
+
+
+def snapshot_grid(start_ts: int, end_ts: int, step: int = 86_400) -> np.ndarray:
+    """Return snapshot timestamps from *start_ts* to *end_ts* inclusive every *step* seconds."""
+    if step <= 0:
+        raise ValueError(f"step must be positive, got {step}")
+    return np.arange(start_ts, end_ts + 1, step, dtype=np.int64)
+
+
+def daily_grid(start_date: str | date, end_date: str | date, hour: int = 20) -> np.ndarray:
+    """Return one snapshot per day at *hour* UTC between two dates (inclusive)."""
+
+    def _ts(d: str | date) -> int:
+        if isinstance(d, str):
+            d = date.fromisoformat(d)
+        return int(datetime(d.year, d.month, d.day, hour, tzinfo=timezone.utc).timestamp())
+
+    return snapshot_grid(_ts(start_date), _ts(end_date), 86_400)
+
+
+def open_counts(
+    open_ts: Any,
+    close_ts: Any,
+    grid: Any,
+    *,
+    groups: Any | None = None,
+    filters: Mapping[str, Any] | None = None,
+) -> pa.Table:
+    """Count markets open at every grid timestamp, optionally per group.
+
+    Parameters
+    ----------
+    open_ts, close_ts:
+        Per-market interval bounds — anything ``to_epoch_seconds`` accepts.
+        Markets with a missing bound are ignored (SQL comparison semantics).
+    grid:
+        Strictly increasing snapshot timestamps (Unix seconds).
+    groups:
+        Optional per-market group label (e.g. category).  Nulls form their
+        own group.
+    filters:
+        Optional ``{column_name: bool mask}``; each adds a column counting
+        only the open markets where the mask is true (e.g. longshot-priced).
+
+    Returns a long-format table with ``snapshot_ts``, ``group`` (if grouped),
+    ``total_open`` and one column per filter.  Every (group, snapshot) pair is
+    present, including zero counts.
+    """
+    grid = np.asarray(grid, dtype=np.int64)
+    if grid.ndim != 1 or (len(grid) > 1 and np.any(np.diff(grid) <= 0)):
+        raise ValueError("grid must be a 1-D strictly increasing array")
+
+    opens = to_epoch_seconds(open_ts)
+    closes = to_epoch_seconds(close_ts)
+    if len(opens) != len(closes):
+        raise ValueError(f"open_ts has {len(opens)} rows but close_ts has {len(closes)}")
+    n = len(opens)
+
+    # Open at grid[k] iff grid[k] >= open and grid[k] < close
+    start_idx = np.searchsorted(grid, opens, side="left")
+    end_idx = np.searchsorted(grid, closes, side="left")
+    valid = (opens != MISSING_TS) & (closes != MISSING_TS) & (end_idx > start_idx)
+
+    if groups is not None:
+        encoded = pa.array(groups).dictionary_encode(null_encoding="encode")
+        if isinstance(encoded, pa.ChunkedArray):
+            encoded = encoded.combine_chunks()
+        if len(encoded) != n:
+            raise ValueError(f"groups has {len(encoded)} rows but intervals have {n}")
+        codes = encoded.indices.to_numpy(zero_copy_only=False).astype(np.int64)
+        labels = encoded.dictionary
+        n_groups = len(labels)
+    else:
+        codes = np.zeros(n, dtype=np.int64)
+        labels = None
+        n_groups = 1
+
+    width = len(grid) + 1  # slot len(grid) absorbs intervals that start/end past the grid
+
+    def _sweep(mask: np.ndarray) -> np.ndarray:
+        sel = valid & mask
+        flat_start = codes[sel] * width + start_idx[sel]
+        flat_end = codes[sel] * width + end_idx[sel]
+        size = n_groups * width
+        delta = np.bincount(flat_start, minlength=size) - np.bincount(flat_end, minlength=size)
+        counts = np.cumsum(delta.reshape(n_groups, width), axis=1)[:, : len(grid)]
+        return counts.reshape(-1)
+
+    columns: dict[str, Any] = {
+        "snapshot_ts": pa.array(np.tile(grid, n_groups), type=pa.timestamp("s", tz="UTC")),
+    }
+    if labels is not None:
+        columns["group"] = labels.take(pa.array(np.repeat(np.arange(n_groups), len(grid))))
+    columns["total_open"] = _sweep(np.ones(n, dtype=bool))
+    for name, mask in (filters or {}).items():
+        mask = np.asarray(mask, dtype=bool)
+        if len(mask) != n:
+            raise ValueError(f"filter {name!r} has {len(mask)} rows but intervals have {n}")
+        columns[name] = _sweep(mask)
+
+    return pa.table(columns)
+
+
+def market_open_counts(
+    markets: pa.Table,
+    grid: Any,
+    *,
+    group_by: str | None = None,
+    filters: Mapping[str, Any] | None = None,
+) -> pa.Table:
+    """``open_counts`` over a ``MARKETS_SCHEMA``-style table (``open_time`` / ``close_time``)."""
+    return open_counts(
+        markets.column("open_time"),
+        markets.column("close_time"),
+        grid,
+        groups=markets.column(group_by) if group_by else None,
+        filters=filters,
+    )
@@ -0,0 +1,92 @@
+"""Vectorized execution-cost queries over orderbook depth snapshots.
+
+Kalshi books hold only bids: a YES bid at ``q``¢ is an offer to sell NO at
+``100 - q``¢, and vice versa.  So the NO asks of a market are its YES bids
+reversed along the price axis, and the cost of buying *N* contracts is a
+walk up that ask ladder — done here for every market at once as
+``(n_markets, 101)`` matrix operations.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+
+from longshot.storage.orderbooks import PRICE_LEVELS, depth_matrix
+
+_PRICES = np.arange(PRICE_LEVELS, dtype=np.float64)
+
+
+def ask_ladder(books: pa.Table, side: str = "no") -> np.ndarray:
+    """``(n, 101)`` contracts offered at each price to a buyer of *side*."""
+    if side not in ("yes", "no"):
+        raise ValueError(f"side must be 'yes' or 'no', got {side!r}")
+    opposite = "yes_bids" if side == "no" else "no_bids"
+    return depth_matrix(books, opposite)[:, ::-1]
+
+
+def cost_to_buy(books: pa.Table, contracts: Any, side: str = "no") -> pa.Table:
+    """Cost of buying *contracts* of *side* in every book by sweeping the asks.
+
+    Parameters
+    ----------
+    books:
+        ``ORDERBOOK_SCHEMA`` table (one row per market).
+    contracts:
+        Contracts to buy: a scalar, or one value per book.
+    side:
+        ``"no"`` (lift YES bids) or ``"yes"`` (lift NO bids).
+
+    Returns a table with ``ticker``, ``requested``, ``filled``, ``cost``
+    (cents), ``avg_price``, ``best_price``, ``worst_price`` and ``slippage``
+    (``avg_price - best_price``); prices are null where nothing fills.
+    """
+    asks = ask_ladder(books, side)
+    n = len(asks)
+    want = np.broadcast_to(np.asarray(contracts, dtype=np.int64), (n,))
+    if np.any(want < 0):
+        raise ValueError("contracts must be non-negative")
+
+    # Contracts taken at each price level, cheapest first
+    before = np.cumsum(asks, axis=1) - asks
+    taken = np.clip(want[:, None] - before, 0, asks)
+    filled = taken.sum(axis=1)
+    cost = taken @ _PRICES
+
+    has_ask = asks.any(axis=1)
+    has_fill = filled > 0
+    best = np.where(has_ask, np.argmax(asks > 0, axis=1), -1)
+    worst = np.where(has_fill, PRICE_LEVELS - 1 - np.argmax((taken > 0)[:, ::-1], axis=1), -1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg = cost / filled
+
+    def _nullable(values: np.ndarray, valid: np.ndarray) -> pa.Array:
+        return pa.array(values.astype(np.float64), mask=~valid)
+
+    return pa.table(
+        {
+            "ticker": books.column("ticker"),
+            "requested": pa.array(want),
+            "filled": pa.array(filled),
+            "cost": pa.array(cost),
+            "avg_price": _nullable(avg, has_fill),
+            "best_price": _nullable(best, has_ask),
+            "worst_price": _nullable(worst, has_fill),
+            "slippage": _nullable(avg - best, has_fill),
+        }
+    )
+
+
+def cost_to_buy_no(books: pa.Table, contracts: Any) -> pa.Table:
+    """``cost_to_buy(books, contracts, side="no")``."""
+    return cost_to_buy(books, contracts, side="no")
+
+
+def depth_within(books: pa.Table, cents: int, side: str = "no") -> np.ndarray:
+    """Contracts of *side* available within *cents* of the best ask, per book."""
+    asks = ask_ladder(books, side)
+    best = np.argmax(asks > 0, axis=1)
+    in_band = (np.arange(PRICE_LEVELS)[None, :] <= best[:, None] + cents) & asks.any(axis=1)[:, None]
+    return np.where(in_band, asks, 0).sum(axis=1)
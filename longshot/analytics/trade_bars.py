@@ -0,0 +1,235 @@
+"""OHLCV / VWAP / taker-side bars built locally from the trades dataset.
+
+Replaces the per-ticker ``GROUP BY`` the screening notebooks run on Athena
+(VWAP, trade-implied bid/ask, taker mix) with vectorized NumPy group-bys on
+``(ticker, floor(ts / interval))``.
+
+Bars hold only *mergeable* statistics — first/last trade ts with their
+prices, high/low, and sums (trades, contracts, notional, per-taker-side
+counts and price sums) — so that
+
+- bars from two batches of trades merge into the bars of their union
+  (``merge_bars``), which makes them incrementally appendable;
+- bars roll up exactly to any multiple of their interval (``rollup``);
+- any window collapses to one row per ticker (``window_summary``).
+
+Derived columns (``vwap``, ``implied_bid``, ``implied_ask``, ``spread``,
+``yes_taker_pct``) are added by ``add_derived``.  They follow the notebook
+definitions: implied ask/bid are the mean YES price of YES-/NO-taker trades.
+
+Trades must be unique by ``trade_id`` (``read_trades_unified``, or the new
+trades of an incremental fetch); merging the same trade twice counts it twice.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from longshot.analytics.open_counts import to_epoch_seconds
+
+BAR_SCHEMA = pa.schema(
+    [
+        pa.field("ticker", pa.string()),
+        pa.field("bar_ts", pa.int64()),
+        pa.field("first_ts", pa.int64()),
+        pa.field("last_ts", pa.int64()),
+        pa.field("open", pa.float64()),
+        pa.field("high", pa.float64()),
+        pa.field("low", pa.float64()),
+        pa.field("close", pa.float64()),
+        pa.field("trades", pa.int64()),
+        pa.field("volume", pa.int64()),
+        pa.field("notional", pa.float64()),
+        pa.field("yes_trades", pa.int64()),
+        pa.field("yes_volume", pa.int64()),
+        pa.field("yes_price_sum", pa.float64()),
+        pa.field("no_trades", pa.int64()),
+        pa.field("no_volume", pa.int64()),
+        pa.field("no_price_sum", pa.float64()),
+    ]
+)
+
+# Parquet/Arrow schema metadata: bar width in seconds
+_INTERVAL_KEY = b"longshot.bars.interval"
+
+_SUM_COLUMNS = [
+    "trades", "volume", "notional",
+    "yes_trades", "yes_volume", "yes_price_sum",
+    "no_trades", "no_volume", "no_price_sum",
+]
+
+
+def bar_interval(bars: pa.Table) -> int | None:
+    """Bar width in seconds recorded on *bars* (``None`` for a window summary)."""
+    raw = (bars.schema.metadata or {}).get(_INTERVAL_KEY)
+    return int(raw) if raw else None
+
+
+def _with_interval(bars: pa.Table, interval: int | None) -> pa.Table:
+    meta = {} if interval is None else {_INTERVAL_KEY: str(interval).encode()}
+    return bars.replace_schema_metadata(meta)
+
+
+def _check_interval(interval: int) -> None:
+    if interval <= 0:
+        raise ValueError(f"interval must be a positive number of seconds, got {interval}")
+
+
+def empty_bars(interval: int | None = None) -> pa.Table:
+    return _with_interval(BAR_SCHEMA.empty_table(), interval)
+
+
+def _combine(bars: pa.Table, interval: int | None) -> pa.Table:
+    """Group *bars* by ``(ticker, floor(bar_ts / interval))`` and merge each group.
+
+    ``interval=None`` collapses each ticker to one row (``bar_ts`` becomes
+    the first bar's start).
+    """
+    if bars.num_rows == 0:
+        return BAR_SCHEMA.empty_table()
+
+    encoded = bars.column("ticker").combine_chunks().dictionary_encode()
+    # Codes ranked by ticker string, so output is sorted by ticker
+    rank = np.empty(len(encoded.dictionary), dtype=np.int64)
+    rank[pc.array_sort_indices(encoded.dictionary).to_numpy()] = np.arange(len(encoded.dictionary))
+    code = rank[encoded.indices.to_numpy(zero_copy_only=False)]
+
+    col = {name: bars.column(name).to_numpy() for name in BAR_SCHEMA.names if name != "ticker"}
+    bar_ts = col["bar_ts"]
+    bucket = np.zeros_like(bar_ts) if interval is None else bar_ts // interval * interval
+
+    # Open comes from the earliest trade of the group, close from the latest
+    by_first = np.lexsort((col["first_ts"], bucket, code))
+    by_last = np.lexsort((col["last_ts"], bucket, code))
+    k, b = code[by_first], bucket[by_first]
+    starts = np.flatnonzero(np.r_[True, (k[1:] != k[:-1]) | (b[1:] != b[:-1])])
+    ends = np.r_[starts[1:], len(k)] - 1
+
+    out = {
+        "ticker": encoded.dictionary.take(pa.array(np.argsort(rank)[k[starts]])),
+        "bar_ts": np.minimum.reduceat(bar_ts[by_first], starts) if interval is None else b[starts],
+        "first_ts": np.minimum.reduceat(col["first_ts"][by_first], starts),
+        "last_ts": np.maximum.reduceat(col["last_ts"][by_first], starts),
+        "open": col["open"][by_first][starts],
+        "high": np.maximum.reduceat(col["high"][by_first], starts),
+        "low": np.minimum.reduceat(col["low"][by_first], starts),
+        "close": col["close"][by_last][ends],
+    }
+    for name in _SUM_COLUMNS:
+        out[name] = np.add.reduceat(col[name][by_first], starts)
+    return pa.table(out, schema=BAR_SCHEMA)
+
+
+def trade_ts(trades: pa.Table) -> np.ndarray:
+    """Trade time in epoch seconds: ``ts``, falling back to ``created_time``."""
+    return pc.coalesce(
+        trades.column("ts"), pa.array(to_epoch_seconds(trades.column("created_time"))),
+    ).to_numpy()
+
+
+def trades_to_bars(trades: pa.Table, interval: int = 60) -> pa.Table:
+    """Aggregate a ``TRADES_SCHEMA`` table into *interval*-second bars.
+
+    Trade time is ``ts``, falling back to ``created_time``; trades with
+    neither are dropped.  Returns ``BAR_SCHEMA`` rows sorted by
+    ``(ticker, bar_ts)``, tagged with *interval*.
+    """
+    _check_interval(interval)
+    if trades.num_rows == 0:
+        return empty_bars(interval)
+
+    ts = trade_ts(trades)
+    valid = ts != np.iinfo(np.int64).min
+    if not valid.all():
+        trades, ts = trades.filter(pa.array(valid)), ts[valid]
+
+    price = trades.column("yes_price").to_numpy().astype(np.float64)
+    count = trades.column("count").to_numpy().astype(np.int64)
+    side = trades.column("taker_side")
+    is_yes = pc.fill_null(pc.equal(side, "yes"), False).to_numpy(zero_copy_only=False)
+    is_no = pc.fill_null(pc.equal(side, "no"), False).to_numpy(zero_copy_only=False)
+
+    # Each trade is a one-trade bar; _combine merges them per bucket
+    unit = pa.table(
+        {
+            "ticker": trades.column("ticker"),
+            "bar_ts": ts,
+            "first_ts": ts,
+            "last_ts": ts,
+            "open": price,
+            "high": price,
+            "low": price,
+            "close": price,
+            "trades": np.ones(len(ts), dtype=np.int64),
+            "volume": count,
+            "notional": price * count,
+            "yes_trades": is_yes.astype(np.int64),
+            "yes_volume": np.where(is_yes, count, 0),
+            "yes_price_sum": np.where(is_yes, price, 0.0),
+            "no_trades": is_no.astype(np.int64),
+            "no_volume": np.where(is_no, count, 0),
+            "no_price_sum": np.where(is_no, price, 0.0),
+        },
+        schema=BAR_SCHEMA,
+    )
+    return _with_interval(_combine(unit, interval), interval)
+
+
+def merge_bars(*tables: pa.Table) -> pa.Table:
+    """Merge bar tables of the same interval (e.g. existing bars + bars of new trades)."""
+    intervals = {bar_interval(t) for t in tables if t.num_rows}
+    if len(intervals) > 1:
+        raise ValueError(f"cannot merge bars of different intervals: {sorted(intervals, key=str)}")
+    interval = intervals.pop() if intervals else None
+    if interval is None:
+        raise ValueError("bars to merge must carry an interval (use trades_to_bars)")
+    merged = pa.concat_tables([t.select(BAR_SCHEMA.names).cast(BAR_SCHEMA) for t in tables])
+    return _with_interval(_combine(merged, interval), interval)
+
+
+def rollup(bars: pa.Table, interval: int) -> pa.Table:
+    """Re-bucket *bars* to a coarser *interval* (a multiple of theirs)."""
+    _check_interval(interval)
+    base = bar_interval(bars)
+    if base is not None and interval % base:
+        raise ValueError(f"interval {interval}s is not a multiple of the bars' {base}s")
+    return _with_interval(_combine(bars.replace_schema_metadata(None), interval), interval)
+
+
+def window_summary(bars: pa.Table, start: int | None = None, end: int | None = None) -> pa.Table:
+    """One row per ticker over the bars with ``start <= bar_ts < end``, with derived columns.
+
+    Bar granularity bounds the window: a bar is in or out as a whole.
+    """
+    mask = None
+    if start is not None:
+        mask = pc.greater_equal(bars.column("bar_ts"), start)
+    if end is not None:
+        upper = pc.less(bars.column("bar_ts"), end)
+        mask = upper if mask is None else pc.and_(mask, upper)
+    if mask is not None:
+        bars = bars.filter(mask)
+    return add_derived(_combine(bars.replace_schema_metadata(None), None))
+
+
+def add_derived(bars: pa.Table) -> pa.Table:
+    """Append ``vwap``, ``implied_bid``, ``implied_ask``, ``spread`` and ``yes_taker_pct``.
+
+    Each is null where its denominator is zero (SQL ``NULLIF`` semantics).
+    """
+
+    def _ratio(num: str, den: str) -> pa.Array:
+        d = bars.column(den)
+        return pc.if_else(pc.equal(d, 0), pa.scalar(None, pa.float64()), pc.divide(pc.cast(bars.column(num), pa.float64()), d))
+
+    implied_bid = _ratio("no_price_sum", "no_trades")
+    implied_ask = _ratio("yes_price_sum", "yes_trades")
+    return (
+        bars.append_column("vwap", _ratio("notional", "volume"))
+        .append_column("implied_bid", implied_bid)
+        .append_column("implied_ask", implied_ask)
+        .append_column("spread", pc.subtract(implied_ask, implied_bid))
+        .append_column("yes_taker_pct", _ratio("yes_volume", "volume"))
+    )
@@ -0,0 +1,56 @@
+"""The investable longshot universe (``docs/portfolio_screening_process.md``, step 1).
+
+Markets priced 3–15¢ (``last_price``), closing 1–14 days after the as-of
+date, with at least 100 contracts of 24-hour volume — the filter the
+portfolio notebooks apply in SQL, evaluated vectorized over a markets table.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from longshot.analytics.open_counts import MISSING_TS, to_epoch_seconds
+
+MIN_PRICE = 3
+MAX_PRICE = 15
+MIN_DTE = 1
+MAX_DTE = 14
+MIN_VOLUME_24H = 100
+
+
+def days_to_expiry(close_time, as_of_ts: int) -> np.ndarray:
+    """Whole UTC calendar days from *as_of_ts* to each close (SQL ``date_diff('day', ...)``).
+
+    Missing closes give ``MISSING_TS``.
+    """
+    close = to_epoch_seconds(close_time)
+    dte = close // 86_400 - as_of_ts // 86_400
+    return np.where(close == MISSING_TS, MISSING_TS, dte)
+
+
+def longshot_mask(
+    markets: pa.Table,
+    as_of_ts: int,
+    *,
+    min_price: float = MIN_PRICE,
+    max_price: float = MAX_PRICE,
+    min_dte: int = MIN_DTE,
+    max_dte: int = MAX_DTE,
+    min_volume_24h: int = MIN_VOLUME_24H,
+) -> np.ndarray:
+    """Boolean mask of *markets* rows in the investable longshot universe."""
+    price = pc.fill_null(markets.column("last_price"), -1.0).to_numpy()
+    volume = pc.fill_null(markets.column("volume_24h"), 0).to_numpy()
+    dte = days_to_expiry(markets.column("close_time"), as_of_ts)
+    return (
+        (price >= min_price) & (price <= max_price)
+        & (dte >= min_dte) & (dte <= max_dte)
+        & (volume >= min_volume_24h)
+    )
+
+
+def longshot_universe(markets: pa.Table, as_of_ts: int, **filters) -> pa.Table:
+    """Rows of *markets* in the investable longshot universe (see ``longshot_mask``)."""
+    return markets.filter(pa.array(longshot_mask(markets, as_of_ts, **filters)))
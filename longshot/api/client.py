@@ -10,11 +10,9 @@ from typing import Any
 from urllib.parse import urlparse
 
 import httpx
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding
 
 from longshot.api.rate_limiter import TokenBucket
-from longshot.config import SETTINGS
+from longshot.config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +22,9 @@ def _sign(private_key_pem: str, timestamp_ms: int, method: str, path: str) -> st
 
     Signs: f"{timestamp_ms}{METHOD}{path_no_query}"
     """
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import padding
+
     private_key = serialization.load_pem_private_key(
         private_key_pem.encode(), password=None
     )
@@ -77,14 +78,37 @@ def retry(max_attempts: int = 5, base_delay: float = 1.0):
 
 
 class KalshiClient:
-    """Kalshi API client with connection pooling, auth, and rate limiting."""
+    """Kalshi API client with connection pooling, auth, and rate limiting.
+
+    Parameters
+    ----------
+    limiter:
+        Shared rate limiter; ``acquire()`` is called before every request.
+    base_url:
+        API root; defaults to ``Settings.kalshi_base_url``.
+    transport:
+        Custom ``httpx`` transport, e.g. the in-process mock API or a
+        record/replay transport from ``longshot.testing``.
+    auth:
+        Sign requests with the configured API key.  Disable for the mock API
+        so no credentials are needed.
+    """
 
-    def __init__(self, limiter: TokenBucket | None = None) -> None:
+    def __init__(
+        self,
+        limiter: TokenBucket | None = None,
+        *,
+        base_url: str | None = None,
+        transport: httpx.BaseTransport | None = None,
+        auth: bool = True,
+    ) -> None:
         self._http = httpx.Client(
-            base_url=SETTINGS.kalshi_base_url,
+            base_url=base_url or get_settings().kalshi_base_url,
             timeout=30.0,
+            transport=transport,
         )
         self._limiter = limiter
+        self._auth = auth
 
     def close(self) -> None:
         self._http.close()
@@ -96,10 +120,18 @@ class KalshiClient:
         self.close()
 
     def _auth_headers(self, method: str, path: str) -> dict[str, str]:
+        if not self._auth:
+            return {}
+        settings = get_settings()
+        if not settings.kalshi_api_key_id or not settings.kalshi_private_key:
+            raise RuntimeError(
+                "Missing required env var: KALSHI_API_KEY_ID / KALSHI_PRIVATE_KEY "
+                "(pass auth=False for the mock API)"
+            )
         ts_ms = int(time.time() * 1000)
-        sig = _sign(SETTINGS.kalshi_private_key, ts_ms, method, path)
+        sig = _sign(settings.kalshi_private_key, ts_ms, method, path)
         return {
-            "KALSHI-ACCESS-KEY": SETTINGS.kalshi_api_key_id,
+            "KALSHI-ACCESS-KEY": settings.kalshi_api_key_id,
             "KALSHI-ACCESS-TIMESTAMP": str(ts_ms),
             "KALSHI-ACCESS-SIGNATURE": sig,
         }
@@ -61,3 +61,53 @@ class Trade(BaseModel):
 class TradesResponse(BaseModel):
     trades: list[Trade]
     cursor: str | None = None
+
+
+class CandleOHLC(BaseModel):
+    open: float | None = None
+    high: float | None = None
+    low: float | None = None
+    close: float | None = None
+
+
+class CandlePrice(CandleOHLC):
+    mean: float | None = None
+    previous: float | None = None
+
+
+class Candlestick(BaseModel):
+    end_period_ts: int
+    price: CandlePrice = CandlePrice()
+    yes_bid: CandleOHLC = CandleOHLC()
+    yes_ask: CandleOHLC = CandleOHLC()
+    volume: int | None = None
+    open_interest: int | None = None
+
+
+class CandlesticksResponse(BaseModel):
+    ticker: str | None = None
+    candlesticks: list[Candlestick]
+
+
+class SettlementSource(BaseModel):
+    name: str | None = None
+    url: str | None = None
+
+
+class Series(BaseModel):
+    ticker: str
+    title: str | None = None
+    category: str | None = None
+    frequency: str | None = None
+    tags: list[str] | None = None
+    settlement_sources: list[SettlementSource] | None = None
+    contract_url: str | None = None
+    contract_terms_url: str | None = None
+    fee_type: str | None = None
+    fee_multiplier: float | None = None
+    volume: int | None = None
+
+
+class SeriesListResponse(BaseModel):
+    series: list[Series] | None = None
+    cursor: str | None = None
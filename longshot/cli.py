@@ -0,0 +1,69 @@
+"""``longshot`` command-line entry point.
+
+Usage:
+    longshot pull hourly
+    longshot pull hourly --base-every-hours 6 --no-reuse-nested
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+
+
+def _pull_hourly(args: argparse.Namespace) -> None:
+    from longshot.ingestion.hourly import run_hourly_pull
+
+    summary = run_hourly_pull(
+        base_every_hours=args.base_every_hours,
+        reuse_nested=args.reuse_nested,
+    )
+
+    print("\n=== Hourly Pull Complete ===")
+    print(f"  Events            : {summary['event_count']}")
+    print(f"  Markets           : {summary['market_count']} (from {summary['markets_source']})")
+    print(f"  API pages         : {summary['pages']}")
+    print(f"  Elapsed           : {summary['elapsed_s']}s")
+    print(f"  Events path       : {summary['events_path']}")
+    print(f"  Markets path      : {summary['markets_path']} ({summary['markets_kind']}, {summary['markets_rows_written']} rows)")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="longshot", description="Longshot data pipeline.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    pull = commands.add_parser("pull", help="Pull data from the Kalshi API into S3")
+    pull_kinds = pull.add_subparsers(dest="kind", required=True)
+
+    hourly = pull_kinds.add_parser(
+        "hourly",
+        help="Active events + markets for the current hour, one crawl on one rate limiter",
+    )
+    hourly.add_argument(
+        "--base-every-hours",
+        type=int,
+        default=24,
+        help="Write a full markets base every N hours, aligned to 00:00 UTC (default: 24)",
+    )
+    hourly.add_argument(
+        "--no-reuse-nested",
+        dest="reuse_nested",
+        action="store_false",
+        help="Crawl /markets even when the events pull returned nested markets",
+    )
+    hourly.set_defaults(func=_pull_hourly)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
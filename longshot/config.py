@@ -1,14 +1,16 @@
-"""Load .env and expose typed Settings singleton."""
+"""Load .env and expose typed Settings singleton.
+
+``.env`` is read and settings are resolved on first use (``get_settings()``
+or attribute access to ``SETTINGS``), so importing modules that depend on
+them is cheap and does not require credentials.
+"""
 
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 
-from dotenv import load_dotenv
-
-load_dotenv()
-
 
 @dataclass(frozen=True)
 class Settings:
@@ -17,31 +19,62 @@ class Settings:
     aws_region: str
     aws_access_key_id: str
     aws_secret_access_key: str
-    kalshi_api_key_id: str
-    kalshi_private_key: str
+    kalshi_api_key_id: str | None
+    kalshi_private_key: str | None
     kalshi_base_url: str = "https://api.elections.kalshi.com/trade-api/v2"
+    # "s3" or "local"; see longshot.storage.backend
+    storage_backend: str = "s3"
+    local_storage_root: str = "data"
+    # S3-compatible endpoint (MinIO, moto server); None for AWS
+    s3_endpoint_url: str | None = None
+
+
+STORAGE_BACKENDS = ("s3", "local")
 
 
 def _load_settings() -> Settings:
-    def _env(key: str) -> str:
-        val = os.environ.get(key)
-        if val is None:
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    def _env(key: str, default: str | None = None, *, required: bool = True) -> str | None:
+        val = os.environ.get(key, default)
+        if val is None and required:
             raise RuntimeError(f"Missing required env var: {key}")
         return val
 
+    backend = _env("STORAGE_BACKEND", "s3")
+    if backend not in STORAGE_BACKENDS:
+        raise RuntimeError(f"STORAGE_BACKEND must be one of {STORAGE_BACKENDS}, got {backend!r}")
+    # S3 credentials are only needed when datasets live on S3
+    need_s3 = backend == "s3"
+
     # .env stores RSA key with literal \n — python-dotenv does NOT convert them
-    raw_key = _env("KALSHI_PRIVATE_KEY")
-    private_key = raw_key.replace("\\n", "\n")
+    raw_key = _env("KALSHI_PRIVATE_KEY", required=False)
+    private_key = raw_key.replace("\\n", "\n") if raw_key is not None else None
 
     return Settings(
-        s3_bucket=_env("S3_BUCKET"),
-        s3_prefix=_env("S3_PREFIX"),
-        aws_region=_env("AWS_REGION"),
-        aws_access_key_id=_env("AWS_ACCESS_KEY_ID"),
-        aws_secret_access_key=_env("AWS_SECRET_ACCESS_KEY"),
-        kalshi_api_key_id=_env("KALSHI_API_KEY_ID"),
+        s3_bucket=_env("S3_BUCKET", required=need_s3) or "",
+        s3_prefix=_env("S3_PREFIX", required=need_s3) or "",
+        aws_region=_env("AWS_REGION", required=need_s3) or "",
+        aws_access_key_id=_env("AWS_ACCESS_KEY_ID", required=need_s3) or "",
+        aws_secret_access_key=_env("AWS_SECRET_ACCESS_KEY", required=need_s3) or "",
+        kalshi_api_key_id=_env("KALSHI_API_KEY_ID", required=False),
         kalshi_private_key=private_key,
+        storage_backend=backend,
+        local_storage_root=_env("LOCAL_STORAGE_ROOT", "data"),
+        s3_endpoint_url=_env("S3_ENDPOINT_URL", required=False) or None,
     )
 
 
-SETTINGS = _load_settings()
+@functools.cache
+def get_settings() -> Settings:
+    """Return the process-wide Settings, loading them on first call."""
+    return _load_settings()
+
+
+def __getattr__(name: str) -> Settings:
+    # Lazy module attribute: ``from longshot.config import SETTINGS`` still works
+    if name == "SETTINGS":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,175 @@
+"""Threaded per-market candlestick fetch from Kalshi API.
+
+Live markets are served by ``GET /series/{series}/markets/{ticker}/candlesticks``;
+markets that have aged into the historical tier by
+``GET /historical/markets/{ticker}/candlesticks``.  Each request covers at
+most ``MAX_CANDLES`` periods, so long ranges are split into windows.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import NamedTuple
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from longshot.analytics.open_counts import MISSING_TS, to_epoch_seconds
+from longshot.api.client import KalshiClient
+from longshot.api.models import CandlesticksResponse
+from longshot.api.rate_limiter import TokenBucket
+from longshot.storage.candles import (
+    CANDLES_SCHEMA,
+    INTERVALS,
+    _check_interval,
+    candles_to_table,
+    write_candles,
+)
+from longshot.storage.s3 import read_historical_markets, read_markets_unified
+from longshot.storage.series import market_series_ticker
+
+logger = logging.getLogger(__name__)
+
+# Periods per request accepted by the API
+MAX_CANDLES = 5000
+
+
+class CandleTarget(NamedTuple):
+    ticker: str
+    series_ticker: str
+    historical: bool = False
+
+
+def _endpoint(target: CandleTarget) -> str:
+    if target.historical:
+        return f"/historical/markets/{target.ticker}/candlesticks"
+    return f"/series/{target.series_ticker}/markets/{target.ticker}/candlesticks"
+
+
+def fetch_candles_for_market(
+    client: KalshiClient,
+    target: CandleTarget,
+    start_ts: int,
+    end_ts: int,
+    interval: str = "1h",
+) -> pa.Table:
+    """Fetch *interval* candles of one market with ``start_ts <= end_period_ts <= end_ts``."""
+    _check_interval(interval)
+    period = INTERVALS[interval] * 60
+    window = MAX_CANDLES * period
+    tables = []
+    lo = start_ts
+    while lo <= end_ts:
+        hi = min(lo + window - 1, end_ts)
+        raw = client.get(
+            _endpoint(target),
+            params={"start_ts": lo, "end_ts": hi, "period_interval": INTERVALS[interval]},
+        )
+        resp = CandlesticksResponse.model_validate(raw)
+        if resp.candlesticks:
+            tables.append(candles_to_table(target.ticker, resp.candlesticks))
+        lo = hi + 1
+    return pa.concat_tables(tables) if tables else CANDLES_SCHEMA.empty_table()
+
+
+def fetch_all_candles(
+    client: KalshiClient,
+    limiter: TokenBucket,
+    targets: Sequence[CandleTarget],
+    start_ts: int,
+    end_ts: int,
+    interval: str = "1h",
+    max_workers: int = 8,
+) -> pa.Table:
+    """Fetch candles for all *targets* in parallel using a thread pool.
+
+    Like ``fetch_all_trades``, the client's shared ``TokenBucket`` paces the
+    workers.  Markets that fail are logged and skipped.
+    """
+    tables: list[pa.Table] = []
+    failed: list[str] = []
+    rows = 0
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(fetch_candles_for_market, client, t, start_ts, end_ts, interval): t
+            for t in targets
+        }
+        for i, future in enumerate(as_completed(futures), 1):
+            target = futures[future]
+            try:
+                table = future.result()
+            except Exception:
+                logger.exception("Failed candles for %s", target.ticker)
+                failed.append(target.ticker)
+                continue
+            tables.append(table)
+            rows += table.num_rows
+            if i % 100 == 0 or i == len(targets):
+                logger.info("Candles progress: %d/%d markets (total candles: %d)", i, len(targets), rows)
+
+    if failed:
+        logger.warning("Failed to fetch candles for %d markets: %s", len(failed), failed[:20])
+    return pa.concat_tables(tables) if tables else CANDLES_SCHEMA.empty_table()
+
+
+def candle_targets(
+    markets: pa.Table,
+    start_ts: int,
+    end_ts: int,
+    historical_tickers: set[str] | frozenset[str] = frozenset(),
+) -> list[CandleTarget]:
+    """Markets open at some point in ``[start_ts, end_ts]`` (missing times are permissive)."""
+    open_ts = to_epoch_seconds(markets.column("open_time"))
+    close_ts = to_epoch_seconds(markets.column("close_time"))
+    mask = ((open_ts == MISSING_TS) | (open_ts <= end_ts)) & ((close_ts == MISSING_TS) | (close_ts >= start_ts))
+    selected = markets.filter(pa.array(mask))
+    return [
+        CandleTarget(ticker, series, ticker in historical_tickers)
+        for ticker, series in zip(
+            selected.column("ticker").to_pylist(),
+            market_series_ticker(selected).to_pylist(),
+        )
+    ]
+
+
+def run_candles(
+    start_ts: int,
+    end_ts: int,
+    interval: str = "1h",
+    *,
+    tickers: Sequence[str] | None = None,
+    max_workers: int = 8,
+) -> dict:
+    """Fetch *interval* candles for markets open in ``[start_ts, end_ts]`` into the candle store.
+
+    Markets come from ``read_markets_unified`` (optionally restricted to
+    *tickers*); those in the historical parts use the historical endpoint.
+
+    Returns summary dict with counts and the shard paths written.
+    """
+    _check_interval(interval)
+    markets = read_markets_unified()
+    if tickers is not None:
+        markets = markets.filter(pc.is_in(markets.column("ticker"), pa.array(list(tickers))))
+    historical = set(read_historical_markets().column("ticker").to_pylist())
+    targets = candle_targets(markets, start_ts, end_ts, historical)
+    logger.info("Fetching %s candles for %d markets (%d historical)", interval, len(targets), sum(t.historical for t in targets))
+
+    limiter = TokenBucket(rate=10.0, burst=20.0)
+    with KalshiClient(limiter=limiter) as client:
+        table = fetch_all_candles(client, limiter, targets, start_ts, end_ts, interval, max_workers=max_workers)
+    paths = write_candles(table, interval)
+
+    summary = {
+        "interval": interval,
+        "start_ts": start_ts,
+        "end_ts": end_ts,
+        "market_count": len(targets),
+        "candle_count": table.num_rows,
+        "shard_paths": paths,
+    }
+    logger.info("Candles complete: %s", summary)
+    return summary
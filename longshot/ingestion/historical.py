@@ -0,0 +1,251 @@
+"""Historical-tier ingestion: markets and trades that aged out of the live API.
+
+Kalshi moves settled markets older than ``market_settled_ts`` from
+``GET /markets`` to ``GET /historical/markets``, and trades older than
+``trades_created_ts`` from ``GET /markets/trades`` to
+``GET /historical/trades`` (both cutoffs from ``GET /historical/cutoff``).
+These functions mirror the live ``iter_market_pages`` /
+``fetch_all_trades`` against the historical tier and write under
+``markets/historical/`` and ``trades/historical/``, kept apart from the live
+datasets and unioned by ``read_markets_unified`` / ``read_trades_unified``
+in ``longshot.storage.s3``.
+
+Both crawls are resumable:
+
+- markets are written in numbered parts, and the cursor after each part is
+  checkpointed, so an interrupted crawl continues from the last part;
+- trades are fetched in ticker batches, each written as a part before the
+  ``historical_trades`` watermarks are saved, so finished tickers are not
+  refetched — and when the cutoff advances only the newly archived trades
+  are fetched.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Sequence
+
+import pyarrow as pa
+
+from longshot.analytics.open_counts import MISSING_TS, to_epoch_seconds
+from longshot.api.client import KalshiClient
+from longshot.api.rate_limiter import TokenBucket
+from longshot.ingestion.markets import iter_market_pages
+from longshot.ingestion.trades import fetch_all_trades
+from longshot.pipeline import log_stage_stats, run_pipeline
+from longshot.storage.s3 import (
+    _all_markets_path,
+    _base_path,
+    _get_fs,
+    _page_to_table,
+    _trades_to_table,
+    list_historical_markets_parts,
+    next_historical_trades_part,
+    read_markets_unified,
+    write_historical_markets_table,
+    write_historical_trades_table,
+)
+from longshot.storage.watermarks import TradeWatermarks
+from longshot.storage.writer import atomic_open
+
+logger = logging.getLogger(__name__)
+
+HISTORICAL_MARKETS_ENDPOINT = "/historical/markets"
+HISTORICAL_TRADES_ENDPOINT = "/historical/trades"
+
+# Markets per historical part file (and per resumable checkpoint)
+PART_ROWS = 100_000
+# Tickers per historical trades part (and per watermark save)
+TICKER_BATCH = 2_000
+
+
+def get_historical_cutoff(client: KalshiClient) -> dict[str, int]:
+    """Return the live/historical cutoffs (``market_settled_ts``, ``trades_created_ts``, ...)."""
+    raw = client.get("/historical/cutoff")
+    return {k: int(v) for k, v in raw.items() if v is not None}
+
+
+# ---------------------------------------------------------------------------
+# Markets
+# ---------------------------------------------------------------------------
+
+def _checkpoint_path() -> str:
+    return f"{_base_path()}/markets/historical/_checkpoint.json"
+
+
+def _read_checkpoint() -> dict | None:
+    path = _checkpoint_path()
+    fs = _get_fs()
+    if not fs.exists(path):
+        return None
+    with fs.open(path, "rb") as f:
+        return json.load(f)
+
+
+def _write_checkpoint(checkpoint: dict) -> None:
+    with atomic_open(_checkpoint_path(), fs=_get_fs()) as f:
+        f.write(json.dumps(checkpoint).encode())
+
+
+def ingest_historical_markets(client: KalshiClient, cutoff_ts: int, *, restart: bool = False) -> dict:
+    """Crawl ``GET /historical/markets`` into ``markets/historical/{cutoff_ts}-*.parquet``.
+
+    Resumes an interrupted crawl for the same *cutoff_ts* unless *restart*;
+    a crawl that already completed for it is skipped.  When a crawl for a
+    new cutoff completes, part files from older cutoffs are removed (the
+    historical tier only grows, so the new crawl covers them).
+    """
+    fs = _get_fs()
+    checkpoint = None if restart else _read_checkpoint()
+    if checkpoint is None or checkpoint["cutoff_ts"] != cutoff_ts:
+        checkpoint = {"cutoff_ts": cutoff_ts, "cursor": None, "next_part": 0, "rows": 0, "complete": False}
+    if checkpoint["complete"]:
+        logger.info("Historical markets already crawled for cutoff %d", cutoff_ts)
+        return {**checkpoint, "parts": list_historical_markets_parts(cutoff_ts), "fetched": 0}
+    if checkpoint["cursor"]:
+        logger.info("Resuming historical markets crawl at part %d", checkpoint["next_part"])
+
+    buffer: list[pa.Table] = []
+    buffered = 0
+    fetched = 0
+
+    def _decode(raw: dict) -> tuple[pa.Table, str | None]:
+        return _page_to_table(raw), raw.get("cursor") or None
+
+    def _flush(cursor: str | None) -> None:
+        nonlocal buffer, buffered
+        if buffer:
+            table = pa.concat_tables(buffer)
+            write_historical_markets_table(table, cutoff_ts, checkpoint["next_part"])
+            checkpoint["next_part"] += 1
+            checkpoint["rows"] += table.num_rows
+        checkpoint["cursor"] = cursor
+        checkpoint["complete"] = cursor is None
+        _write_checkpoint(checkpoint)
+        buffer, buffered = [], 0
+
+    def _write(item: tuple[pa.Table, str | None]) -> None:
+        nonlocal buffered, fetched
+        table, cursor = item
+        buffer.append(table)
+        buffered += table.num_rows
+        fetched += table.num_rows
+        if cursor is None or buffered >= PART_ROWS:
+            _flush(cursor)
+
+    pages = iter_market_pages(client, endpoint=HISTORICAL_MARKETS_ENDPOINT, cursor=checkpoint["cursor"])
+    stats = run_pipeline(pages, [("decode", _decode)], _write)
+    log_stage_stats("ingest_historical_markets", stats)
+
+    current = set(list_historical_markets_parts(cutoff_ts))
+    stale = [p for p in list_historical_markets_parts() if p not in current]
+    if stale:
+        fs.rm(stale)
+        logger.info("Removed %d historical market parts from older cutoffs", len(stale))
+
+    return {**checkpoint, "parts": sorted(current), "fetched": fetched}
+
+
+# ---------------------------------------------------------------------------
+# Trades
+# ---------------------------------------------------------------------------
+
+def _watermark(watermarks: TradeWatermarks, ticker: str) -> int:
+    ts = watermarks.get(ticker)
+    return MISSING_TS if ts is None else ts
+
+
+def historical_trade_tickers(markets: pa.Table, trades_cutoff_ts: int) -> list[str]:
+    """Tickers that can have trades before *trades_cutoff_ts* (created before it)."""
+    created = to_epoch_seconds(markets.column("created_time"))
+    mask = (created == MISSING_TS) | (created < trades_cutoff_ts)
+    return markets.column("ticker").filter(pa.array(mask)).to_pylist()
+
+
+def ingest_historical_trades(
+    client: KalshiClient,
+    limiter: TokenBucket,
+    trades_cutoff_ts: int,
+    tickers: Sequence[str] | None = None,
+    *,
+    batch_size: int = TICKER_BATCH,
+    max_workers: int = 8,
+) -> dict:
+    """Fetch ``GET /historical/trades`` for *tickers* into ``trades/historical/{cutoff}-*.parquet``.
+
+    *tickers* defaults to every market in ``read_markets_unified`` created
+    before the cutoff — still-live markets can have archived trades too, so
+    run this after a live universe pull (``markets/all/data.parquet``).  Tickers are fetched *max_workers* at a time in
+    batches of *batch_size*; after each batch its trades are written as a
+    new part and the ``historical_trades``
+    watermarks are saved, so a rerun skips completed tickers.
+    """
+    max_ts = trades_cutoff_ts - 1
+    if tickers is None:
+        if not _get_fs().exists(_all_markets_path()):
+            logger.warning(
+                "No live market universe at %s; archived trades of still-live markets will be missed",
+                _all_markets_path(),
+            )
+        tickers = historical_trade_tickers(read_markets_unified(), trades_cutoff_ts)
+    watermarks = TradeWatermarks.load("historical_trades")
+    pending = [t for t in tickers if _watermark(watermarks, t) < max_ts]
+    logger.info(
+        "Historical trades: %d of %d tickers pending (cutoff %d)",
+        len(pending), len(tickers), trades_cutoff_ts,
+    )
+
+    part = next_historical_trades_part(trades_cutoff_ts)
+    paths: list[str] = []
+    total = 0
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start:start + batch_size]
+        trades = fetch_all_trades(
+            client, limiter, batch, max_ts=max_ts, max_workers=max_workers,
+            watermarks=watermarks, endpoint=HISTORICAL_TRADES_ENDPOINT,
+        )
+        if trades:
+            paths.append(write_historical_trades_table(_trades_to_table(trades), trades_cutoff_ts, part))
+            part += 1
+            total += len(trades)
+        watermarks.save()
+        logger.info(
+            "Historical trades: %d/%d tickers done, %d trades",
+            min(start + batch_size, len(pending)), len(pending), total,
+        )
+
+    done = sum(_watermark(watermarks, t) >= max_ts for t in tickers)
+    return {
+        "trades_cutoff_ts": trades_cutoff_ts,
+        "tickers": len(tickers),
+        "tickers_pending": len(pending),
+        "tickers_complete": done,
+        "trade_count": total,
+        "paths": paths,
+    }
+
+
+def run_historical(*, skip_trades: bool = False, restart: bool = False, max_workers: int = 8) -> dict:
+    """Crawl the historical tier: markets (resumable) then trades (resumable).
+
+    Returns summary dict with the cutoffs, counts and written paths.
+    """
+    limiter = TokenBucket(rate=10.0, burst=20.0)
+
+    with KalshiClient(limiter=limiter) as client:
+        cutoff = get_historical_cutoff(client)
+        logger.info("Historical cutoffs: %s", cutoff)
+        markets = ingest_historical_markets(client, cutoff["market_settled_ts"], restart=restart)
+
+        trades = None
+        if not skip_trades:
+            trades = ingest_historical_trades(
+                client, limiter, cutoff["trades_created_ts"], max_workers=max_workers,
+            )
+        else:
+            logger.info("Skipping historical trades fetch")
+
+    summary = {"cutoff": cutoff, "markets": markets, "trades": trades}
+    logger.info("Historical ingestion complete: %s", summary)
+    return summary
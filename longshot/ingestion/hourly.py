@@ -0,0 +1,200 @@
+"""Hourly pull of active markets and events in one process on one rate budget.
+
+``GET /events?with_nested_markets=true`` already returns every market, so when
+nested markets are available the markets partition is derived from the
+events crawl and ``GET /markets`` is never paginated.  When the API rejects
+nested markets (or reuse is disabled), the markets crawl runs concurrently
+with the events crawl, both drawing from the same ``TokenBucket``.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import httpx
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from longshot.api.client import KalshiClient
+from longshot.api.models import Market, MarketsResponse
+from longshot.api.rate_limiter import TokenBucket
+from longshot.storage.cdc import write_hourly_pull
+from longshot.storage.s3 import _events_to_table, _get_fs, _hourly_path, _markets_to_table, markets_from_events
+from longshot.storage.writer import atomic_open
+
+logger = logging.getLogger(__name__)
+
+NESTED_FILTER = "min_close_ts + with_nested_markets"
+
+
+def _first_page(client: KalshiClient, path: str, attempts: list[tuple[str, dict]]) -> tuple[dict, str, dict]:
+    """GET the first page, falling back through *attempts* on HTTP 400.
+
+    Returns ``(raw_page, filter_label, params_used)``.
+    """
+    for i, (label, params) in enumerate(attempts):
+        try:
+            return client.get(path, params=dict(params)), label, params
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code != 400 or i == len(attempts) - 1:
+                raise
+            logger.warning("400 with %s on %s — falling back to %s", label, path, attempts[i + 1][0])
+    raise AssertionError("unreachable")
+
+
+def fetch_active_markets(client: KalshiClient, min_close_ts: int) -> tuple[list[Market], str, int]:
+    """Paginate ``GET /markets`` for non-MVE markets closing after *min_close_ts*.
+
+    Returns ``(markets, filter_used, pages)``.
+    """
+    raw, filter_used, params = _first_page(client, "/markets", [
+        ("mve_filter=exclude + min_close_ts", {"limit": 1000, "mve_filter": "exclude", "min_close_ts": min_close_ts}),
+        ("min_close_ts only", {"limit": 1000, "min_close_ts": min_close_ts}),
+    ])
+    page = MarketsResponse.model_validate(raw)
+    markets = list(page.markets)
+    cursor = page.cursor
+    pages = 1
+
+    while cursor:
+        page = MarketsResponse.model_validate(client.get("/markets", params={**params, "cursor": cursor}))
+        markets.extend(page.markets)
+        pages += 1
+        cursor = page.cursor
+        if pages % 10 == 0:
+            logger.info("Markets page %d: %d markets so far", pages, len(markets))
+
+    return markets, filter_used, pages
+
+
+def first_events_page(client: KalshiClient, min_close_ts: int) -> tuple[dict, str, dict]:
+    """First ``GET /events`` page, with nested markets if the API allows it.
+
+    Returns ``(raw_page, filter_used, params_used)``; the filter tells the
+    caller whether nested markets are available before the crawl runs.
+    """
+    return _first_page(client, "/events", [
+        (NESTED_FILTER, {"limit": 200, "min_close_ts": min_close_ts, "with_nested_markets": "true"}),
+        ("min_close_ts only", {"limit": 200, "min_close_ts": min_close_ts}),
+        ("no filters", {"limit": 200}),
+    ])
+
+
+def crawl_events(client: KalshiClient, first: dict, params: dict) -> tuple[list[dict], int]:
+    """Follow the cursor from *first* (a page fetched with *params*).
+
+    Returns ``(raw_events, pages)``.
+    """
+    events = list(first.get("events", []))
+    cursor = first.get("cursor")
+    pages = 1
+
+    while cursor:
+        raw = client.get("/events", params={**params, "cursor": cursor})
+        events.extend(raw.get("events", []))
+        pages += 1
+        cursor = raw.get("cursor")
+        if pages % 10 == 0:
+            logger.info("Events page %d: %d events so far", pages, len(events))
+
+    return events, pages
+
+
+def fetch_active_events(client: KalshiClient, min_close_ts: int) -> tuple[list[dict], str, int]:
+    """Paginate ``GET /events`` (with nested markets if the API allows it).
+
+    Returns ``(raw_events, filter_used, pages)``; nested markets are present
+    only when ``filter_used == NESTED_FILTER``.
+    """
+    raw, filter_used, params = first_events_page(client, min_close_ts)
+    events, pages = crawl_events(client, raw, params)
+    return events, filter_used, pages
+
+
+def derive_active_markets(events: pa.Table, now: datetime) -> pa.Table:
+    """Markets table from an events pull's nested markets, still open at *now*.
+
+    ``GET /events`` does not return multivariate (MVE) events, so this matches
+    the ``mve_filter=exclude`` markets crawl.
+    """
+    markets = markets_from_events(events)
+    now_iso = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+    return markets.filter(pc.fill_null(pc.greater(markets.column("close_time"), now_iso), False))
+
+
+def write_events_hour(events: pa.Table, hour_ts: int) -> str:
+    """Write an hourly events pull to ``events/daily/...``. Returns the S3 path."""
+    path = _hourly_path("events/daily", hour_ts)
+    fs = _get_fs()
+    with atomic_open(path, fs=fs) as f:
+        pq.write_table(events, f)
+    logger.info("Wrote %d events to %s", events.num_rows, path)
+    return path
+
+
+def run_hourly_pull(
+    *,
+    base_every_hours: int = 24,
+    reuse_nested: bool = True,
+    now: datetime | None = None,
+) -> dict:
+    """Pull active events and markets for the current hour and write both partitions.
+
+    Returns summary dict with counts, request pages and S3 paths.
+    """
+    now = now or datetime.now(timezone.utc)
+    min_close_ts = int(now.timestamp())
+    hour_ts = int(now.replace(minute=0, second=0, microsecond=0).timestamp())
+    logger.info("Hourly pull: %s (min_close_ts=%d, reuse_nested=%s)", now.isoformat(), min_close_ts, reuse_nested)
+
+    limiter = TokenBucket(rate=10.0, burst=20.0)
+    start = time.time()
+
+    with KalshiClient(limiter=limiter) as client, ThreadPoolExecutor(max_workers=2) as pool:
+        # The first events page settles whether nested markets are available,
+        # so the /markets crawl (if needed) starts before the events crawl
+        first, events_filter, events_params = first_events_page(client, min_close_ts)
+        markets_future = None
+        if not reuse_nested:
+            markets_future = pool.submit(fetch_active_markets, client, min_close_ts)
+        elif events_filter != NESTED_FILTER:
+            logger.warning("Nested markets unavailable (filter: %s) — crawling /markets", events_filter)
+            markets_future = pool.submit(fetch_active_markets, client, min_close_ts)
+        events_future = pool.submit(crawl_events, client, first, events_params)
+
+        raw_events, events_pages = events_future.result()
+        events_table = _events_to_table(raw_events, nested_markets=True)
+        if markets_future is None:
+            markets_table = derive_active_markets(events_table, now)
+            markets_source, markets_pages = "nested events", 0
+        else:
+            markets, markets_filter, markets_pages = markets_future.result()
+            markets_table = _markets_to_table(markets)
+            markets_source = f"/markets ({markets_filter})"
+
+    elapsed = time.time() - start
+
+    events_path = write_events_hour(events_table, hour_ts)
+    markets_path, markets_kind, markets_rows = write_hourly_pull(
+        markets_table, hour_ts, base_every_hours=base_every_hours
+    )
+
+    summary = {
+        "hour_ts": hour_ts,
+        "event_count": events_table.num_rows,
+        "market_count": markets_table.num_rows,
+        "events_filter": events_filter,
+        "markets_source": markets_source,
+        "pages": events_pages + markets_pages,
+        "elapsed_s": round(elapsed, 1),
+        "events_path": events_path,
+        "markets_path": markets_path,
+        "markets_kind": markets_kind,
+        "markets_rows_written": markets_rows,
+    }
+    logger.info("Hourly pull complete: %s", summary)
+    return summary
@@ -12,13 +12,21 @@ from longshot.api.models import Market, MarketsResponse
 logger = logging.getLogger(__name__)
 
 
-def iter_all_markets(client: KalshiClient) -> Iterator[list[Market]]:
-    """Yield pages of non-MVE markets from the API.
+MARKETS_ENDPOINT = "/markets"
 
-    Each yielded list is one page (up to 1000 markets). This avoids
-    accumulating the entire universe in memory at once.
+
+def iter_market_pages(
+    client: KalshiClient,
+    *,
+    endpoint: str = MARKETS_ENDPOINT,
+    cursor: str | None = None,
+) -> Iterator[dict]:
+    """Yield raw ``GET /markets`` responses for non-MVE markets, undecoded.
+
+    Lets ``stream_all_markets_parquet`` decode pages on another thread
+    while the next page is fetched.  *endpoint* selects the live or
+    historical tier; *cursor* resumes a crawl after the page that returned it.
     """
-    cursor: str | None = None
     page = 0
     total = 0
 
@@ -30,26 +38,35 @@ def iter_all_markets(client: KalshiClient) -> Iterator[list[Market]]:
         if cursor:
             params["cursor"] = cursor
 
-        raw = client.get("/markets", params=params)
-        resp = MarketsResponse.model_validate(raw)
+        raw = client.get(endpoint, params=params)
         page += 1
-        total += len(resp.markets)
+        total += len(raw.get("markets", []))
         logger.info(
             "Markets page %d: fetched %d (total so far: %d)",
             page,
-            len(resp.markets),
+            len(raw.get("markets", [])),
             total,
         )
 
-        yield resp.markets
+        yield raw
 
-        if not resp.cursor:
+        cursor = raw.get("cursor")
+        if not cursor:
             break
-        cursor = resp.cursor
 
     logger.info("Markets: %d total fetched (MVE excluded)", total)
 
 
+def iter_all_markets(client: KalshiClient) -> Iterator[list[Market]]:
+    """Yield pages of non-MVE markets from the API.
+
+    Each yielded list is one page (up to 1000 markets). This avoids
+    accumulating the entire universe in memory at once.
+    """
+    for raw in iter_market_pages(client):
+        yield MarketsResponse.model_validate(raw).markets
+
+
 def filter_markets_at_snapshot(
     markets: list[Market],
     snapshot_ts: int,
@@ -0,0 +1,107 @@
+"""Threaded orderbook snapshots from Kalshi API (``GET /markets/{ticker}/orderbook``)."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+import pyarrow as pa
+
+from longshot.analytics.universe import longshot_universe
+from longshot.api.client import KalshiClient
+from longshot.api.rate_limiter import TokenBucket
+from longshot.storage.orderbooks import PRICE_LEVELS, books_to_table, levels_to_array, write_orderbooks
+from longshot.storage.s3 import read_all_markets
+
+logger = logging.getLogger(__name__)
+
+
+def fetch_orderbook(client: KalshiClient, ticker: str, depth: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Return the market's ``(yes_bids, no_bids)`` as 101-slot quantity arrays."""
+    params = {"depth": depth} if depth else None
+    raw = client.get(f"/markets/{ticker}/orderbook", params=params)
+    book = raw.get("orderbook") or {}
+    return levels_to_array(book.get("yes")), levels_to_array(book.get("no"))
+
+
+def fetch_orderbooks(
+    client: KalshiClient,
+    tickers: Sequence[str],
+    snapshot_ts: int,
+    *,
+    depth: int | None = None,
+    max_workers: int = 8,
+) -> pa.Table:
+    """Fetch orderbooks for all *tickers* in parallel into an ``ORDERBOOK_SCHEMA`` table.
+
+    Like ``fetch_all_trades``, the client's shared ``TokenBucket`` paces the
+    workers.  Markets that fail are logged and left out.
+    """
+    got: list[str] = []
+    yes_rows: list[np.ndarray] = []
+    no_rows: list[np.ndarray] = []
+    failed: list[str] = []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(fetch_orderbook, client, t, depth): t for t in tickers}
+        for i, future in enumerate(as_completed(futures), 1):
+            ticker = futures[future]
+            try:
+                yes, no = future.result()
+            except Exception:
+                logger.exception("Failed orderbook for %s", ticker)
+                failed.append(ticker)
+                continue
+            got.append(ticker)
+            yes_rows.append(yes)
+            no_rows.append(no)
+            if i % 500 == 0 or i == len(tickers):
+                logger.info("Orderbooks progress: %d/%d", i, len(tickers))
+
+    if failed:
+        logger.warning("Failed to fetch orderbooks for %d markets: %s", len(failed), failed[:20])
+    empty = np.zeros((0, PRICE_LEVELS), dtype=np.int64)
+    return books_to_table(
+        got, snapshot_ts,
+        np.vstack(yes_rows) if yes_rows else empty,
+        np.vstack(no_rows) if no_rows else empty,
+    )
+
+
+def run_orderbook_snapshot(
+    snapshot_ts: int | None = None,
+    *,
+    tickers: Sequence[str] | None = None,
+    depth: int | None = None,
+    max_workers: int = 8,
+) -> dict:
+    """Snapshot orderbooks of the investable longshot universe (or *tickers*).
+
+    The universe is taken from the latest full market pull
+    (``markets/all/data.parquet``) as of *snapshot_ts* (default: now).
+
+    Books are merged into the hour's partition by ticker (see
+    ``write_orderbooks``).  Returns summary dict with counts and the S3 path.
+    """
+    snapshot_ts = int(time.time()) if snapshot_ts is None else snapshot_ts
+    if tickers is None:
+        universe = longshot_universe(read_all_markets(), snapshot_ts)
+        tickers = universe.column("ticker").to_pylist()
+        logger.info("Investable longshot universe: %d markets", len(tickers))
+
+    limiter = TokenBucket(rate=10.0, burst=20.0)
+    with KalshiClient(limiter=limiter) as client:
+        books = fetch_orderbooks(client, tickers, snapshot_ts, depth=depth, max_workers=max_workers)
+    path = write_orderbooks(books, snapshot_ts)
+
+    summary = {
+        "snapshot_ts": snapshot_ts,
+        "market_count": len(tickers),
+        "book_count": books.num_rows,
+        "path": path,
+    }
+    logger.info("Orderbook snapshot complete: %s", summary)
+    return summary
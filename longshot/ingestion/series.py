@@ -0,0 +1,59 @@
+"""Series metadata fetch from Kalshi API (``GET /series``)."""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from longshot.api.client import KalshiClient
+from longshot.api.models import Series, SeriesListResponse
+from longshot.api.rate_limiter import TokenBucket
+from longshot.storage.series import series_to_table, write_series
+
+logger = logging.getLogger(__name__)
+
+SERIES_ENDPOINT = "/series"
+
+
+def fetch_all_series(client: KalshiClient, *, category: str | None = None) -> list[Series]:
+    """Every series (optionally of one *category*), following cursors if the API pages."""
+    series: list[Series] = []
+    cursor: str | None = None
+    while True:
+        params: dict = {"include_volume": "true"}
+        if category:
+            params["category"] = category
+        if cursor:
+            params["cursor"] = cursor
+        resp = SeriesListResponse.model_validate(client.get(SERIES_ENDPOINT, params=params))
+        series.extend(resp.series or [])
+        cursor = resp.cursor
+        if not cursor:
+            break
+    logger.info("Series: %d fetched", len(series))
+    return series
+
+
+def run_series() -> dict:
+    """Fetch all series and replace the series dimension table.
+
+    Returns a summary dict with ``series_count``, ``category_counts``,
+    ``path`` and ``elapsed_s``.
+    """
+    t0 = time.time()
+    limiter = TokenBucket(rate=10.0, burst=20.0)
+    with KalshiClient(limiter=limiter) as client:
+        series = fetch_all_series(client)
+
+    path = write_series(series_to_table(series))
+
+    counts: dict[str, int] = {}
+    for s in series:
+        key = s.category or "Unknown"
+        counts[key] = counts.get(key, 0) + 1
+    return {
+        "series_count": len(series),
+        "category_counts": dict(sorted(counts.items(), key=lambda kv: -kv[1])),
+        "path": path,
+        "elapsed_s": round(time.time() - t0, 1),
+    }
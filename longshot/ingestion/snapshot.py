@@ -4,28 +4,44 @@ from __future__ import annotations
 
 import logging
 
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from longshot.analytics.open_counts import MISSING_TS, snapshot_grid, to_epoch_seconds
 from longshot.api.client import KalshiClient
 from longshot.api.models import Market
 from longshot.api.rate_limiter import TokenBucket
-from longshot.ingestion.markets import iter_all_markets, filter_markets_at_snapshot
+from longshot.ingestion.markets import filter_markets_at_snapshot, iter_market_pages
 from longshot.ingestion.trades import fetch_all_trades
 from longshot.storage.s3 import (
+    _snapshot_date_str,
+    _trades_to_table,
     read_all_markets,
     stream_all_markets_parquet,
     write_markets_parquet,
-    write_trades_parquet,
+    write_markets_table,
+    write_trades_table,
 )
+from longshot.storage.bars import append_trades
+from longshot.storage.watermarks import TradeWatermarks
 
 logger = logging.getLogger(__name__)
 
 
-def run_snapshot(snapshot_ts: int, *, skip_trades: bool = False) -> dict:
+def run_snapshot(snapshot_ts: int, *, skip_trades: bool = False, incremental: bool = True) -> dict:
     """Run a full snapshot ingestion for the given Unix timestamp.
 
     1. Stream all non-MVE markets to S3 (page by page, constant memory)
     2. Read back from S3, filter for snapshot window, write snapshot file
     3. (unless *skip_trades*) Fetch trades in parallel → write to S3
 
+    With *incremental* (the default), trades are only fetched after each
+    ticker's watermark (see ``longshot.storage.watermarks``), merged into
+    the date's trades partition and folded into the 1-minute trade bars
+    (``longshot.storage.bars``); otherwise each ticker's full history up to
+    *snapshot_ts* is fetched and the partition is overwritten.
+
     Returns summary dict with counts and S3 paths.
     """
     limiter = TokenBucket(rate=10.0, burst=20.0)
@@ -33,8 +49,8 @@ def run_snapshot(snapshot_ts: int, *, skip_trades: bool = False) -> dict:
     with KalshiClient(limiter=limiter) as client:
         # --- Stream all markets to S3 ---
         logger.info("Fetching all non-MVE markets (streaming to S3) ...")
-        all_markets_path, all_count = stream_all_markets_parquet(
-            iter_all_markets(client),
+        all_markets_path, all_count, stream_stats = stream_all_markets_parquet(
+            iter_market_pages(client),
         )
         logger.info("Full universe: %d markets → %s", all_count, all_markets_path)
 
@@ -53,10 +69,22 @@ def run_snapshot(snapshot_ts: int, *, skip_trades: bool = False) -> dict:
         trade_count = 0
         if not skip_trades:
             tickers = [m.ticker for m in snapshot_markets]
-            logger.info("Fetching trades for %d tickers ...", len(tickers))
-            trades = fetch_all_trades(client, limiter, tickers, max_ts=snapshot_ts)
-            trades_path = write_trades_parquet(trades, snapshot_ts)
+            watermarks = TradeWatermarks.load() if incremental else None
+            logger.info(
+                "Fetching trades for %d tickers (%s) ...",
+                len(tickers), f"{len(watermarks)} watermarks" if watermarks is not None else "full history",
+            )
+            trades = fetch_all_trades(
+                client, limiter, tickers, max_ts=snapshot_ts, watermarks=watermarks,
+            )
+            trades_table = _trades_to_table(trades)
+            trades_path = write_trades_table(trades_table, snapshot_ts, merge=incremental)
             trade_count = len(trades)
+            if watermarks is not None:
+                # Folding skips trades already in the bars, so fold before the
+                # watermark save: if it fails, the rerun refetches and catches up
+                append_trades(trades_table)
+                watermarks.save()
             logger.info("Trades: %d → %s", trade_count, trades_path)
         else:
             logger.info("Skipping trades fetch")
@@ -69,6 +97,137 @@ def run_snapshot(snapshot_ts: int, *, skip_trades: bool = False) -> dict:
         "all_markets_path": all_markets_path,
         "snapshot_markets_path": snapshot_markets_path,
         "trades_path": trades_path,
+        "markets_stream_stages": [s.as_dict() for s in stream_stats],
     }
     logger.info("Snapshot complete: %s", summary)
     return summary
+
+
+# ---------------------------------------------------------------------------
+# Backfill: many snapshots from one crawl
+# ---------------------------------------------------------------------------
+
+def snapshot_membership_bounds(
+    created: np.ndarray,
+    close: np.ndarray,
+    grid: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return, per market, the half-open range of *grid* indices it belongs to.
+
+    Market *i* is in snapshot *j* iff ``first[i] <= j < stop[i]``, which is
+    the ``filter_markets_at_snapshot`` rule (``created_time <= ts <
+    close_time``, missing times are permissive) evaluated for every grid
+    point with two binary searches per market.
+    """
+    first = np.searchsorted(grid, created, side="left")
+    stop = np.searchsorted(grid, close, side="left")
+    stop[close == MISSING_TS] = len(grid)
+    return first, stop
+
+
+def run_backfill(
+    start_ts: int,
+    end_ts: int,
+    step: int = 86_400,
+    *,
+    skip_trades: bool = False,
+) -> dict:
+    """Backfill snapshots every *step* seconds from *start_ts* to *end_ts* inclusive.
+
+    Equivalent to calling ``run_snapshot`` for each timestamp, but the market
+    universe is crawled once and trades are fetched once for the union of
+    all snapshot tickers (up to the last snapshot), then split into the
+    per-snapshot partitions.
+
+    Returns summary dict with counts and one entry per snapshot.
+    """
+    grid = snapshot_grid(start_ts, end_ts, step)
+    if len(grid) == 0:
+        raise ValueError(f"empty snapshot range: start {start_ts} > end {end_ts}")
+    dates = [_snapshot_date_str(int(ts)) for ts in grid]
+    if len(set(dates)) != len(dates):
+        raise ValueError(
+            f"step {step}s puts several snapshots on the same snapshot_date partition; "
+            "use a step of at least one day"
+        )
+
+    limiter = TokenBucket(rate=10.0, burst=20.0)
+
+    with KalshiClient(limiter=limiter) as client:
+        # --- Stream all markets to S3 (once) ---
+        logger.info("Fetching all non-MVE markets (streaming to S3) ...")
+        all_markets_path, all_count, stream_stats = stream_all_markets_parquet(
+            iter_market_pages(client),
+        )
+        logger.info("Full universe: %d markets → %s", all_count, all_markets_path)
+
+        # --- Membership of every market in every snapshot ---
+        all_table = read_all_markets()
+        first, stop = snapshot_membership_bounds(
+            to_epoch_seconds(all_table.column("created_time")),
+            to_epoch_seconds(all_table.column("close_time")),
+            grid,
+        )
+        in_any = stop > first
+        logger.info(
+            "%d snapshots from %d to %d: %d of %d markets in at least one",
+            len(grid), grid[0], grid[-1], int(in_any.sum()), all_table.num_rows,
+        )
+
+        # --- Trades for the union, fetched once ---
+        trades_table = None
+        trade_market = trade_ts = None
+        if not skip_trades:
+            tickers = all_table.column("ticker").filter(pa.array(in_any)).to_pylist()
+            logger.info("Fetching trades for %d tickers up to %d ...", len(tickers), grid[-1])
+            trades = fetch_all_trades(client, limiter, tickers, max_ts=int(grid[-1]))
+            trades_table = _trades_to_table(trades)
+            del trades
+            trade_market = pc.index_in(
+                trades_table.column("ticker"), value_set=all_table.column("ticker")
+            ).to_numpy(zero_copy_only=False)
+            trade_ts = pc.coalesce(
+                trades_table.column("ts"),
+                pa.array(to_epoch_seconds(trades_table.column("created_time"))),
+            ).to_numpy()
+        else:
+            logger.info("Skipping trades fetch")
+
+    # --- Split into per-snapshot partitions ---
+    snapshots = []
+    total_trades = 0
+    for j, ts in enumerate(grid.tolist()):
+        member = (first <= j) & (j < stop)
+        markets_path = write_markets_table(all_table.filter(pa.array(member)), ts)
+        trades_path = None
+        trade_count = 0
+        if trades_table is not None:
+            mask = member[trade_market] & (trade_ts <= ts)
+            trades_path = write_trades_table(trades_table.filter(pa.array(mask)), ts)
+            trade_count = int(mask.sum())
+            total_trades += trade_count
+        snapshots.append({
+            "snapshot_ts": ts,
+            "snapshot_market_count": int(member.sum()),
+            "trade_count": trade_count,
+            "snapshot_markets_path": markets_path,
+            "trades_path": trades_path,
+        })
+
+    summary = {
+        "start_ts": int(grid[0]),
+        "end_ts": int(grid[-1]),
+        "step": step,
+        "all_market_count": all_count,
+        "union_market_count": int(in_any.sum()),
+        "fetched_trade_count": 0 if trades_table is None else trades_table.num_rows,
+        "partition_trade_count": total_trades,
+        "all_markets_path": all_markets_path,
+        "snapshots": snapshots,
+        "markets_stream_stages": [s.as_dict() for s in stream_stats],
+    }
+    logger.info(
+        "Backfill complete: %d snapshots, %d trades fetched",
+        len(snapshots), summary["fetched_trade_count"],
+    )
+    return summary
@@ -4,21 +4,34 @@ from __future__ import annotations
 
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING
 
 from longshot.api.client import KalshiClient
 from longshot.api.models import Trade, TradesResponse
 from longshot.api.rate_limiter import TokenBucket
 
+if TYPE_CHECKING:
+    from longshot.storage.watermarks import TradeWatermarks
+
 logger = logging.getLogger(__name__)
 
+TRADES_ENDPOINT = "/markets/trades"
+
 
 def fetch_trades_for_market(
     client: KalshiClient,
     ticker: str,
     max_ts: int,
     min_ts: int | None = None,
+    *,
+    raise_errors: bool = False,
+    endpoint: str = TRADES_ENDPOINT,
 ) -> list[Trade]:
-    """Fetch all trades for a single market ticker between *min_ts* and *max_ts*."""
+    """Fetch all trades for a single market ticker between *min_ts* and *max_ts*.
+
+    On a request error the trades fetched so far are returned, unless
+    *raise_errors* is set.  *endpoint* selects the live or historical tier.
+    """
     trades: list[Trade] = []
     cursor: str | None = None
 
@@ -34,8 +47,10 @@ def fetch_trades_for_market(
             params["cursor"] = cursor
 
         try:
-            raw = client.get("/markets/trades", params=params)
+            raw = client.get(endpoint, params=params)
         except Exception:
+            if raise_errors:
+                raise
             logger.exception("Failed to fetch trades for %s", ticker)
             return trades
 
@@ -56,18 +71,33 @@ def fetch_all_trades(
     max_ts: int,
     min_ts: int | None = None,
     max_workers: int = 8,
+    watermarks: TradeWatermarks | None = None,
+    endpoint: str = TRADES_ENDPOINT,
 ) -> list[Trade]:
     """Fetch trades for all *tickers* in parallel using a thread pool.
 
     The shared ``TokenBucket`` on the client naturally serialises requests
     at the rate limit, so threads block when tokens are exhausted.
+
+    With *watermarks*, each ticker is only fetched from just after its
+    watermark, and the watermark is advanced to *max_ts* for every ticker
+    fetched without errors (tickers that fail keep their old watermark and
+    contribute no trades).  Persisting the watermarks is left to the caller,
+    once the trades have been written.
     """
     all_trades: list[Trade] = []
     failed: list[str] = []
     skipped = 0
 
     def _fetch(ticker: str) -> tuple[str, list[Trade]]:
-        return ticker, fetch_trades_for_market(client, ticker, max_ts, min_ts=min_ts)
+        if watermarks is None:
+            return ticker, fetch_trades_for_market(client, ticker, max_ts, min_ts=min_ts, endpoint=endpoint)
+        ticker_min_ts = watermarks.min_ts(ticker, min_ts)
+        if ticker_min_ts is not None and ticker_min_ts > max_ts:
+            return ticker, []
+        return ticker, fetch_trades_for_market(
+            client, ticker, max_ts, min_ts=ticker_min_ts, raise_errors=True, endpoint=endpoint,
+        )
 
     with ThreadPoolExecutor(max_workers=max_workers) as pool:
         futures = {pool.submit(_fetch, t): t for t in tickers}
@@ -78,6 +108,8 @@ def fetch_all_trades(
                 if not trades:
                     skipped += 1
                 all_trades.extend(trades)
+                if watermarks is not None:
+                    watermarks.advance(ticker, max_ts)
                 if i % 100 == 0 or i == len(tickers):
                     logger.info(
                         "Trades progress: %d/%d tickers (total trades: %d, skipped: %d)",
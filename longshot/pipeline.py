@@ -0,0 +1,168 @@
+"""Bounded multi-stage pipeline for overlapping fetch, decode and write.
+
+Each stage runs on its own thread and hands items to the next through a
+bounded queue, so a slow stage applies backpressure upstream instead of
+letting pages pile up in memory.  The last stage (the sink) runs on the
+calling thread.  Items keep their source order.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import asdict, dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+_POLL_S = 0.1
+
+
+@dataclass
+class StageStats:
+    """Timings for one stage.
+
+    ``busy_s`` is time spent doing work, ``idle_s`` waiting for input and
+    ``blocked_s`` waiting for room in the downstream queue (backpressure).
+    """
+
+    name: str
+    items: int = 0
+    busy_s: float = 0.0
+    idle_s: float = 0.0
+    blocked_s: float = 0.0
+
+    def as_dict(self) -> dict:
+        return {k: round(v, 3) if isinstance(v, float) else v for k, v in asdict(self).items()}
+
+
+class _Aborted(Exception):
+    pass
+
+
+def _put(q: queue.Queue, item: Any, stop: threading.Event) -> float:
+    start = time.perf_counter()
+    while True:
+        if stop.is_set():
+            raise _Aborted
+        try:
+            q.put(item, timeout=_POLL_S)
+            return time.perf_counter() - start
+        except queue.Full:
+            continue
+
+
+def _get(q: queue.Queue, stop: threading.Event) -> tuple[Any, float]:
+    start = time.perf_counter()
+    while True:
+        if stop.is_set():
+            raise _Aborted
+        try:
+            return q.get(timeout=_POLL_S), time.perf_counter() - start
+        except queue.Empty:
+            continue
+
+
+def run_pipeline(
+    source: Iterable[Any],
+    stages: Sequence[tuple[str, Callable[[Any], Any]]],
+    sink: Callable[[Any], None],
+    *,
+    source_name: str = "fetch",
+    sink_name: str = "write",
+    maxsize: int = 4,
+) -> list[StageStats]:
+    """Run ``source → stages... → sink`` with *maxsize*-bounded queues.
+
+    The first exception raised by any stage stops the pipeline and is
+    re-raised here.  Returns per-stage stats in pipeline order.
+    """
+    queues = [queue.Queue(maxsize=maxsize) for _ in range(len(stages) + 1)]
+    stats = [StageStats(source_name)] + [StageStats(name) for name, _ in stages] + [StageStats(sink_name)]
+    stop = threading.Event()
+    errors: list[BaseException] = []
+
+    def _fail(exc: BaseException) -> None:
+        errors.append(exc)
+        stop.set()
+
+    def _source() -> None:
+        st, out = stats[0], queues[0]
+        try:
+            iterator = iter(source)
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                st.busy_s += time.perf_counter() - start
+                st.items += 1
+                st.blocked_s += _put(out, item, stop)
+            _put(out, _DONE, stop)
+        except _Aborted:
+            pass
+        except BaseException as exc:
+            _fail(exc)
+
+    def _stage(i: int, fn: Callable[[Any], Any]) -> None:
+        st, inp, out = stats[i + 1], queues[i], queues[i + 1]
+        try:
+            while True:
+                item, waited = _get(inp, stop)
+                st.idle_s += waited
+                if item is _DONE:
+                    _put(out, _DONE, stop)
+                    return
+                start = time.perf_counter()
+                result = fn(item)
+                st.busy_s += time.perf_counter() - start
+                st.items += 1
+                st.blocked_s += _put(out, result, stop)
+        except _Aborted:
+            pass
+        except BaseException as exc:
+            _fail(exc)
+
+    threads = [threading.Thread(target=_source, name=f"pipeline-{source_name}", daemon=True)]
+    threads += [
+        threading.Thread(target=_stage, args=(i, fn), name=f"pipeline-{name}", daemon=True)
+        for i, (name, fn) in enumerate(stages)
+    ]
+    for t in threads:
+        t.start()
+
+    st = stats[-1]
+    try:
+        while True:
+            item, waited = _get(queues[-1], stop)
+            st.idle_s += waited
+            if item is _DONE:
+                break
+            start = time.perf_counter()
+            sink(item)
+            st.busy_s += time.perf_counter() - start
+            st.items += 1
+    except _Aborted:
+        pass
+    except BaseException as exc:
+        _fail(exc)
+    finally:
+        for t in threads:
+            t.join()
+
+    if errors:
+        raise errors[0]
+    return stats
+
+
+def log_stage_stats(label: str, stats: Sequence[StageStats]) -> None:
+    for st in stats:
+        logger.info(
+            "%s %-7s items=%d busy=%.2fs idle=%.2fs blocked=%.2fs",
+            label, st.name, st.items, st.busy_s, st.idle_s, st.blocked_s,
+        )
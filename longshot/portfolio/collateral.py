@@ -0,0 +1,234 @@
+"""Worst-case collateral and payoffs of NO positions grouped by event.
+
+Buying NO costs ``no_price``¢ per contract and pays $1 unless the market
+resolves YES.  Within a mutually exclusive (ME) event at most one market
+resolves YES, so a cluster of NO positions has one scenario per held market
+(that market wins, every other held NO pays) plus the scenario where no
+held market wins (everything pays).  With ``Q`` contracts in the event and
+``q_j`` on market ``j``:
+
+* payout if market ``j`` resolves YES: ``Q - q_j``
+* worst-case payout: ``Q - max_j q_j`` (ME); ``0`` otherwise, since the
+  markets of a non-ME event can all resolve YES together
+* collateral: the worst-case loss, ``max(cost - worst payout, 0)``
+
+This is the capital the exchange actually locks, and it replaces the
+``max(no_price)`` per-event approximation of ``notebooks/10_*``.  The
+"no held market wins" scenario is always kept, so an event whose held
+markets cover every outcome is treated conservatively.
+
+Reductions are segment reductions (``np.add.reduceat`` /
+``np.maximum.reduceat``) over positions sorted by ``(book, event, market)``
+codes, so thousands of clusters — or every snapshot of a backtest, via
+*books* — cost one sort.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from longshot.portfolio.sizing import _codes, _float
+
+
+def _labels(values: Any, n: int) -> pa.Array:
+    arr = values if isinstance(values, (pa.Array, pa.ChunkedArray)) else pa.array(values)
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    if len(arr) != n:
+        raise ValueError(f"labels have {len(arr)} rows but prices have {n}")
+    return arr
+
+
+def _reduce(
+    events: Any,
+    no_price: Any,
+    contracts: Any | None,
+    mutually_exclusive: Any | None,
+    markets: Any | None,
+    books: Any | None,
+) -> dict[str, np.ndarray]:
+    """Per-event and per-row arrays shared by ``event_collateral`` and ``position_payouts``."""
+    unit = _float(no_price) / 100.0
+    n = len(unit)
+    unit = np.where(np.isnan(unit), 0.0, unit)
+    qty = np.ones(n) if contracts is None else np.nan_to_num(_float(contracts))
+    if mutually_exclusive is None:
+        me = np.zeros(n, dtype=bool)
+    else:
+        flags = _labels(mutually_exclusive, n)
+        me = pc.fill_null(pc.cast(flags, pa.bool_()), False).to_numpy(zero_copy_only=False)
+
+    event_code, n_events = _codes(events, n)
+    book_code, _ = _codes(books, n)
+    group = book_code * n_events + event_code
+    if markets is None:
+        # Every row is its own market; a stable sort keeps rows distinct
+        market = np.arange(n)
+        order = np.argsort(group, kind="stable")
+    else:
+        market = _codes(markets, n)[0]
+        order = np.lexsort((market, group))
+    g, m = group[order], market[order]
+    q, spent, flag = qty[order], (qty * unit)[order], me[order]
+
+    if n == 0:
+        empty = np.zeros(0)
+        return {
+            "order": order, "group": group, "n_events": n_events, "me": me,
+            "n_markets": np.zeros(0, dtype=np.int64), "contracts": empty, "cost": empty,
+            "max_market": empty, "row_event": np.zeros(0, dtype=np.int64), "row_market_qty": empty,
+        }
+
+    # Segment boundaries: (group, market) runs, then group runs
+    new_market = np.ones(n, dtype=bool)
+    new_market[1:] = (g[1:] != g[:-1]) | (m[1:] != m[:-1])
+    new_group = np.ones(n, dtype=bool)
+    new_group[1:] = g[1:] != g[:-1]
+    market_starts = np.flatnonzero(new_market)
+    group_starts = np.flatnonzero(new_group)
+    # Group runs expressed over market segments
+    group_market_starts = np.flatnonzero(new_group[market_starts])
+
+    market_qty = np.add.reduceat(q, market_starts)
+    out = {
+        "order": order,
+        "group": g[group_starts],
+        "n_events": n_events,
+        # An event is treated as ME only if every position says so
+        "me": np.minimum.reduceat(flag.astype(np.int8), group_starts).astype(bool),
+        "n_markets": np.diff(np.append(group_market_starts, len(market_starts))),
+        "contracts": np.add.reduceat(q, group_starts),
+        "cost": np.add.reduceat(spent, group_starts),
+        "max_market": np.maximum.reduceat(market_qty, group_market_starts),
+    }
+    # Per sorted row: its event segment and its market's contracts
+    out["row_event"] = np.cumsum(new_group) - 1
+    out["row_market_qty"] = market_qty[np.cumsum(new_market) - 1]
+    return out
+
+
+def event_collateral(
+    events: Any,
+    no_price: Any,
+    contracts: Any | None = None,
+    mutually_exclusive: Any | None = None,
+    *,
+    markets: Any | None = None,
+    books: Any | None = None,
+) -> pa.Table:
+    """Worst-case collateral per event (per ``(book, event)`` when *books* is given).
+
+    Parameters
+    ----------
+    events:
+        Event ticker per position.
+    no_price:
+        Cost of one NO contract in cents.
+    contracts:
+        Contracts per position (default 1).
+    mutually_exclusive:
+        The event's ``mutually_exclusive`` flag per position; null or omitted
+        is treated as not ME (collateral = cost).
+    markets:
+        Market ticker per position, so repeated lots on one market share a
+        scenario (default: every row is its own market).
+    books:
+        Optional portfolio key per position (e.g. snapshot ts).
+
+    Returns one row per event, in ``(book, event)`` order: ``book`` (when
+    given), ``event_ticker``, ``mutually_exclusive``, ``n_markets``,
+    ``contracts``, ``cost``, ``max_payout``, ``min_payout``, ``worst_pnl``
+    and ``collateral``, all money in dollars.
+    """
+    no_price = _float(no_price)
+    events = _labels(events, len(no_price))
+    r = _reduce(events, no_price, contracts, mutually_exclusive, markets, books)
+
+    max_payout = r["contracts"]
+    min_payout = np.where(r["me"], r["contracts"] - r["max_market"], 0.0)
+    worst_pnl = min_payout - r["cost"]
+
+    event_dict = events.dictionary_encode(null_encoding="encode").dictionary
+    columns: dict[str, Any] = {}
+    if books is not None:
+        book_dict = _labels(books, len(events)).dictionary_encode(null_encoding="encode").dictionary
+        columns["book"] = book_dict.take(pa.array(r["group"] // r["n_events"]))
+    columns.update(
+        {
+            "event_ticker": event_dict.take(pa.array(r["group"] % r["n_events"])),
+            "mutually_exclusive": r["me"],
+            "n_markets": r["n_markets"],
+            "contracts": r["contracts"],
+            "cost": r["cost"],
+            "max_payout": max_payout,
+            "min_payout": min_payout,
+            "worst_pnl": worst_pnl,
+            "collateral": np.maximum(-worst_pnl, 0.0),
+        }
+    )
+    return pa.table(columns)
+
+
+def position_payouts(
+    events: Any,
+    no_price: Any,
+    contracts: Any | None = None,
+    mutually_exclusive: Any | None = None,
+    *,
+    markets: Any | None = None,
+    books: Any | None = None,
+) -> pa.Table:
+    """Scenario payoffs aligned with the input positions.
+
+    For each position, ``payout_if_yes`` / ``pnl_if_yes`` are its event's
+    payout and P&L (dollars) when that position's market resolves YES and
+    the event's other held markets resolve NO; ``payout_if_none`` is the
+    event payout when no held market resolves YES.  Together they are the
+    event's scenario payoff vector.  Arguments as for ``event_collateral``.
+    """
+    r = _reduce(events, no_price, contracts, mutually_exclusive, markets, books)
+    event_qty = r["contracts"][r["row_event"]]
+    payout_if_yes = event_qty - r["row_market_qty"]
+    pnl_if_yes = payout_if_yes - r["cost"][r["row_event"]]
+
+    # Back to input order
+    inverse = np.empty_like(r["order"])
+    inverse[r["order"]] = np.arange(len(r["order"]))
+    return pa.table(
+        {
+            "payout_if_yes": payout_if_yes[inverse],
+            "pnl_if_yes": pnl_if_yes[inverse],
+            "payout_if_none": event_qty[inverse],
+        }
+    )
+
+
+def portfolio_collateral(
+    positions: pa.Table,
+    *,
+    event: str = "event_ticker",
+    price: str = "price",
+    contracts: str = "contracts",
+    market: str = "ticker",
+    mutually_exclusive: str = "mutually_exclusive",
+    book: str | None = None,
+) -> pa.Table:
+    """``event_collateral`` over a positions table (e.g. ``size_candidates`` output).
+
+    NO cost is ``100 - price`` (YES cents).  Missing *contracts* or
+    *mutually_exclusive* columns mean one contract per row and non-ME
+    events.  The portfolio's capital requirement is the ``collateral`` sum.
+    """
+    names = positions.column_names
+    return event_collateral(
+        positions.column(event),
+        pc.subtract(100, pc.cast(positions.column(price), pa.float64())),
+        positions.column(contracts) if contracts in names else None,
+        positions.column(mutually_exclusive) if mutually_exclusive in names else None,
+        markets=positions.column(market) if market in names else None,
+        books=positions.column(book) if book is not None else None,
+    )
@@ -0,0 +1,186 @@
+"""Fractional-Kelly position sizing for NO positions with position, category and deployment caps.
+
+Sizing follows ``notebooks/03_longshot_screening.py`` (``position_sizing``):
+
+1. Full Kelly for buying NO at ``100 - price``¢ when the YES contract is
+   worth ``true_prob``: ``(price / 100 - true_prob) / (price / 100)``.
+2. Stake ``kelly_fraction`` of it, capped at ``max_position_pct`` of the
+   bankroll, in whole contracts.
+3. Project onto the caps in turn: every category scaled down to at most
+   ``max_category_pct`` of the bankroll, then the whole book to at most
+   ``max_deployed_pct``.  Each projection only shrinks positions, so it
+   cannot break a cap applied before it, and contracts are re-rounded down
+   after each one, so the result is feasible in whole contracts.
+
+Everything is a column operation; category totals are ``bincount`` sums over
+``(book, category)`` codes.  Passing *books* (e.g. the snapshot timestamp)
+sizes many independent portfolios — every snapshot of a backtest — in one
+call, each with its own bankroll-relative caps.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Absorbs float error before flooring to whole contracts (0.9999999 -> 1)
+_ROUND_EPS = 1e-9
+
+
+@dataclass(frozen=True)
+class SizingLimits:
+    """Bankroll and caps (fractions of the bankroll); a ``None`` cap is not applied."""
+
+    bankroll: float = 100_000
+    kelly_fraction: float = 0.25
+    max_position_pct: float | None = 0.05
+    max_category_pct: float | None = 0.15
+    max_deployed_pct: float | None = 0.70
+
+
+def _float(values: Any) -> np.ndarray:
+    if isinstance(values, (pa.Array, pa.ChunkedArray)):
+        return pc.cast(values, pa.float64()).fill_null(np.nan).to_numpy(zero_copy_only=False)
+    return np.asarray(values, dtype=np.float64)
+
+
+def _codes(values: Any | None, n: int) -> tuple[np.ndarray, int]:
+    """Dense group codes for *values* (nulls form their own group)."""
+    if values is None:
+        return np.zeros(n, dtype=np.int64), 1
+    arr = values if isinstance(values, (pa.Array, pa.ChunkedArray)) else pa.array(values)
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    if len(arr) != n:
+        raise ValueError(f"group labels have {len(arr)} rows but prices have {n}")
+    encoded = arr.dictionary_encode(null_encoding="encode")
+    return encoded.indices.to_numpy(zero_copy_only=False).astype(np.int64), max(len(encoded.dictionary), 1)
+
+
+def kelly_no(price: Any, true_prob: Any) -> np.ndarray:
+    """Full-Kelly bankroll fraction for buying NO at ``100 - price``¢; 0 where the edge is not positive."""
+    implied = _float(price) / 100.0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        f = (implied - _float(true_prob)) / implied
+    return np.where(np.isfinite(f) & (f > 0), f, 0.0)
+
+
+def _whole(dollars: np.ndarray, unit: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid="ignore", divide="ignore"):
+        contracts = np.floor(dollars / unit + _ROUND_EPS)
+    return np.where(unit > 0, np.nan_to_num(contracts), 0).astype(np.int64)
+
+
+def size_positions(
+    price: Any,
+    true_prob: Any,
+    categories: Any | None = None,
+    *,
+    limits: SizingLimits = SizingLimits(),
+    cost: Any | None = None,
+    books: Any | None = None,
+) -> pa.Table:
+    """Size NO positions for every candidate at once.
+
+    Parameters
+    ----------
+    price:
+        YES price in cents per candidate (the price the edge is measured at).
+    true_prob:
+        Estimated YES probability per candidate (``CalibrationModel.true_prob``).
+    categories:
+        Category per candidate for the category cap; nulls form one group.
+    limits:
+        Bankroll, Kelly fraction and caps.
+    cost:
+        Cost of one NO contract in cents (default ``100 - price``).
+    books:
+        Optional portfolio key per candidate (e.g. snapshot ts); caps apply
+        within each book.
+
+    Returns a table with one row per candidate: ``kelly_raw``, ``kelly``,
+    ``target_dollars``, ``cost_per_contract`` (dollars), ``category_scale``,
+    ``deploy_scale``, ``contracts`` and ``cost`` (dollars).
+    """
+    price = _float(price)
+    n = len(price)
+    unit = (100.0 - price if cost is None else _float(cost)) / 100.0
+    unit = np.where(np.isnan(unit), 0.0, unit)
+
+    kelly_raw = kelly_no(price, true_prob)
+    kelly = limits.kelly_fraction * kelly_raw
+    if limits.max_position_pct is not None:
+        kelly = np.minimum(kelly, limits.max_position_pct)
+    target = kelly * limits.bankroll
+    contracts = _whole(target, unit)
+    spent = contracts * unit
+
+    book, n_books = _codes(books, n)
+
+    category_scale = np.ones(n)
+    if limits.max_category_pct is not None:
+        cat, n_cats = _codes(categories, n)
+        cell = book * n_cats + cat
+        totals = np.bincount(cell, weights=spent, minlength=n_books * n_cats)
+        cap = limits.max_category_pct * limits.bankroll
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scale = np.where(totals > cap, cap / totals, 1.0)
+        category_scale = scale[cell]
+        contracts = _whole(spent * category_scale, unit)
+        spent = contracts * unit
+
+    deploy_scale = np.ones(n)
+    if limits.max_deployed_pct is not None:
+        totals = np.bincount(book, weights=spent, minlength=n_books)
+        cap = limits.max_deployed_pct * limits.bankroll
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scale = np.where(totals > cap, cap / totals, 1.0)
+        deploy_scale = scale[book]
+        contracts = _whole(spent * deploy_scale, unit)
+        spent = contracts * unit
+
+    return pa.table(
+        {
+            "kelly_raw": kelly_raw,
+            "kelly": kelly,
+            "target_dollars": target,
+            "cost_per_contract": unit,
+            "category_scale": category_scale,
+            "deploy_scale": deploy_scale,
+            "contracts": contracts,
+            "cost": spent,
+        }
+    )
+
+
+def size_candidates(
+    candidates: pa.Table,
+    limits: SizingLimits = SizingLimits(),
+    *,
+    category: str = "category",
+    book: str | None = None,
+    drop_empty: bool = True,
+) -> pa.Table:
+    """``size_positions`` over scored candidates (``Screener.score`` / ``Screener.rank`` output).
+
+    Uses the ``price``, ``est_true_prob`` and *category* columns (and *book*
+    when given) and appends the sizing columns.  With *drop_empty*, rows
+    sized to zero contracts are removed.
+    """
+    sized = size_positions(
+        candidates.column("price"),
+        candidates.column("est_true_prob"),
+        candidates.column(category) if category in candidates.column_names else None,
+        limits=limits,
+        books=candidates.column(book) if book is not None else None,
+    )
+    out = candidates
+    for name in sized.column_names:
+        out = out.append_column(name, sized.column(name))
+    if drop_empty:
+        out = out.filter(pc.greater(out.column("contracts"), 0))
+    return out
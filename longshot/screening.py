@@ -0,0 +1,230 @@
+"""Longshot screening and composite scoring (``notebooks/03_longshot_screening.py``).
+
+A ``Screener`` takes a point-in-time markets table plus per-ticker trade
+pricing and returns ranked candidates for selling YES (buying NO):
+
+1. **Screen** — price (trade VWAP, falling back to ``yes_ask``) within
+   ``[yes_min, yes_max]``¢, at least ``min_trades`` trades in the pricing
+   window, at least ``min_days`` to close.
+2. **Score** — calibrated edge (``longshot.analytics.calibration``) plus
+   liquidity, time-to-close, diversification and taker-flow components,
+   each min-max normalised over the screened set and combined with
+   ``ScoreWeights``.
+3. **Rank** — candidates with relative edge ``>= min_rel_edge``, by
+   composite score (ties by ticker, so output is deterministic).
+
+Every step is a column operation over NumPy/Arrow arrays, so a screen of a
+full hourly snapshot costs milliseconds and ``iter_hourly_screens`` can run
+it for every stored hour.
+
+Trade pricing is a ``window_summary`` of trade bars
+(``longshot.analytics.trade_bars``): ``trades``, ``volume``, ``vwap``,
+``implied_bid``, ``implied_ask``, ``spread`` and ``yes_taker_pct`` per ticker.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from longshot.analytics.calibration import CalibrationModel
+from longshot.analytics.open_counts import MISSING_TS, to_epoch_seconds
+from longshot.analytics.trade_bars import window_summary
+
+# Columns taken from the trade pricing table
+PRICING_COLUMNS = ("trades", "volume", "vwap", "implied_bid", "implied_ask", "spread", "yes_taker_pct")
+
+
+@dataclass(frozen=True)
+class ScoreWeights:
+    """Weights of the normalised score components (the notebook's 40/25/15/10/10)."""
+
+    edge: float = 0.40
+    liquidity: float = 0.25
+    time: float = 0.15
+    diversification: float = 0.10
+    flow: float = 0.10
+
+
+def time_score(days_to_close: np.ndarray) -> np.ndarray:
+    """1.0 for 7–30 days to close, ramping up from 0 over days 0–7 and down over 30–90.
+
+    Under one day, past 90 days, and unknown closes score 0.
+    """
+    d = np.asarray(days_to_close, dtype=np.float64)
+    score = np.interp(d, [0.0, 7.0, 30.0, 90.0], [0.0, 1.0, 1.0, 0.0])
+    return np.where((d < 1) | np.isnan(d), 0.0, score)
+
+
+def min_max(values: np.ndarray) -> np.ndarray:
+    """Scale to ``[0, 1]`` ignoring NaNs; a constant column becomes 0.5."""
+    values = np.asarray(values, dtype=np.float64)
+    if np.all(np.isnan(values)):
+        return values
+    lo, hi = np.nanmin(values), np.nanmax(values)
+    if hi > lo:
+        return (values - lo) / (hi - lo)
+    return np.where(np.isnan(values), np.nan, 0.5)
+
+
+def _float(column) -> np.ndarray:
+    return pc.cast(column, pa.float64()).fill_null(np.nan).to_numpy(zero_copy_only=False)
+
+
+@dataclass(frozen=True)
+class Screener:
+    """Screen, score and rank longshot candidates.
+
+    Parameters
+    ----------
+    calibration:
+        Price → true-probability model (default: the academic five-point curve).
+    yes_min, yes_max:
+        Price band in cents, inclusive.
+    min_trades:
+        Trades required in the pricing window.
+    min_days:
+        Days to close required (fractional, from the as-of time).
+    min_rel_edge:
+        Relative edge (``edge / implied_prob``) required for a ranked candidate.
+    weights:
+        Composite score weights.
+    category:
+        Markets column holding the category; when the markets table has no
+        such column it is resolved through the series dimension table
+        (``series_category``).
+    """
+
+    calibration: CalibrationModel = field(default_factory=CalibrationModel.academic)
+    yes_min: float = 3
+    yes_max: float = 12
+    min_trades: int = 5
+    min_days: float = 1
+    min_rel_edge: float = 0.15
+    weights: ScoreWeights = field(default_factory=ScoreWeights)
+    category: str = "category"
+
+    def _with_category(self, markets: pa.Table) -> pa.Table:
+        if self.category in markets.column_names:
+            return markets
+        from longshot.storage.series import join_series
+
+        joined = join_series(markets, columns=("category",))
+        return joined.rename_columns(
+            [self.category if name == "series_category" else name for name in joined.column_names]
+        )
+
+    def screen(self, markets: pa.Table, pricing: pa.Table, as_of_ts: int) -> pa.Table:
+        """Markets joined with their pricing that pass the price, activity and expiry filters.
+
+        Adds ``price``, ``days_to_close`` and the ``PRICING_COLUMNS`` (null for
+        markets without trades) to the markets columns.
+        """
+        markets = self._with_category(markets)
+        # Broadcast left join: row of each market's ticker in the pricing table
+        idx = pc.index_in(markets.column("ticker"), value_set=pricing.column("ticker").combine_chunks())
+        matched = pricing.select(list(PRICING_COLUMNS)).take(idx)
+        for name in PRICING_COLUMNS:
+            if name in markets.column_names:
+                markets = markets.drop_columns([name])
+            markets = markets.append_column(name, matched.column(name))
+
+        price = _float(pc.coalesce(pc.cast(markets.column("vwap"), pa.float64()),
+                                   pc.cast(markets.column("yes_ask"), pa.float64())))
+        close = to_epoch_seconds(markets.column("close_time"))
+        days = np.where(close == MISSING_TS, np.nan, (close - as_of_ts) / 86_400)
+        trades = pc.fill_null(markets.column("trades"), 0).to_numpy(zero_copy_only=False)
+
+        with np.errstate(invalid="ignore"):
+            mask = (
+                (price >= self.yes_min) & (price <= self.yes_max)
+                & (trades >= self.min_trades)
+                & (days >= self.min_days)
+            )
+        markets = markets.append_column("price", pa.array(price)).append_column("days_to_close", pa.array(days))
+        return markets.filter(pa.array(mask))
+
+    def score(self, candidates: pa.Table) -> pa.Table:
+        """Add edge and composite-score columns to screened *candidates*."""
+        price = _float(candidates.column("price"))
+        category = candidates.column(self.category)
+        implied = price / 100.0
+        true_prob = self.calibration.true_prob(price, category)
+        edge = implied - true_prob
+        with np.errstate(invalid="ignore", divide="ignore"):
+            relative_edge = edge / implied
+
+        # Diversification: 1 / candidates sharing the category (null categories count alone)
+        encoded = category.combine_chunks().dictionary_encode()
+        codes = encoded.indices.fill_null(-1).to_numpy(zero_copy_only=False).astype(np.int64)
+        per_category = np.bincount(codes[codes >= 0], minlength=len(encoded.dictionary))
+        diversification = np.where(codes >= 0, 1.0 / per_category[np.maximum(codes, 0)].clip(min=1), 1.0)
+
+        flow = _float(candidates.column("yes_taker_pct"))
+        components = {
+            "edge_norm": min_max(edge),
+            "liq_norm": min_max(_float(candidates.column("volume"))),
+            "time_norm": min_max(time_score(_float(candidates.column("days_to_close")))),
+            "div_norm": min_max(diversification),
+            "flow_norm": min_max(np.where(np.isnan(flow), 0.5, flow)),
+        }
+        w = self.weights
+        composite = (
+            w.edge * components["edge_norm"]
+            + w.liquidity * components["liq_norm"]
+            + w.time * components["time_norm"]
+            + w.diversification * components["div_norm"]
+            + w.flow * components["flow_norm"]
+        )
+
+        out = (
+            candidates.append_column("est_true_prob", pa.array(true_prob))
+            .append_column("implied_prob", pa.array(implied))
+            .append_column("edge", pa.array(edge))
+            .append_column("relative_edge", pa.array(relative_edge))
+        )
+        for name, values in components.items():
+            out = out.append_column(name, pa.array(values))
+        return out.append_column("composite_score", pa.array(composite))
+
+    def rank(self, scored: pa.Table) -> pa.Table:
+        """Scored candidates passing ``min_rel_edge``, best first, with a 1-based ``rank``."""
+        rel = _float(scored.column("relative_edge"))
+        with np.errstate(invalid="ignore"):
+            scored = scored.filter(pa.array(rel >= self.min_rel_edge))
+        score = _float(scored.column("composite_score"))
+        # Descending score (NaN last), ties by ticker
+        tickers = scored.column("ticker").to_numpy(zero_copy_only=False)
+        order = np.lexsort((tickers, np.where(np.isnan(score), np.inf, -score)))
+        ranked = scored.take(pa.array(order))
+        return ranked.append_column("rank", pa.array(np.arange(1, len(order) + 1)))
+
+    def __call__(self, markets: pa.Table, pricing: pa.Table, as_of_ts: int) -> pa.Table:
+        """``rank(score(screen(markets, pricing, as_of_ts)))``."""
+        return self.rank(self.score(self.screen(markets, pricing, as_of_ts)))
+
+
+def iter_hourly_screens(
+    screener: Screener,
+    *,
+    after_ts: int | None = None,
+    window: int = 86_400,
+    bars: pa.Table | None = None,
+) -> Iterator[tuple[int, pa.Table]]:
+    """Yield ``(hour_ts, ranked)`` for every stored hourly market pull newer than *after_ts*.
+
+    Markets come from the CDC replay (``longshot.storage.cdc``); pricing is
+    the *window* seconds of trade bars ending at each hour (default: the
+    stored 1-minute bars).
+    """
+    from longshot.storage.bars import read_trade_bars
+    from longshot.storage.cdc import iter_reconstructed_hours
+
+    bars = read_trade_bars() if bars is None else bars
+    for hour_ts, markets in iter_reconstructed_hours(after_ts):
+        pricing = window_summary(bars, hour_ts - window, hour_ts)
+        yield hour_ts, screener(markets, pricing, hour_ts)
@@ -3,32 +3,47 @@
 from __future__ import annotations
 
 import time
+from typing import TYPE_CHECKING
 
-import boto3
-import pandas as pd
+from longshot.config import get_settings
 
-from longshot.config import SETTINGS
+if TYPE_CHECKING:
+    import pandas as pd
 
 DATABASE = "longshot"
-OUTPUT_LOCATION = f"s3://{SETTINGS.s3_bucket}/athena-results/"
+
+
+def _output_location() -> str:
+    return f"s3://{get_settings().s3_bucket}/athena-results/"
+
+
+def __getattr__(name: str) -> str:
+    if name == "OUTPUT_LOCATION":
+        return _output_location()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _client():
+    import boto3  # deferred: boto3 import alone costs ~0.3s
+
+    settings = get_settings()
     return boto3.client(
         "athena",
-        region_name=SETTINGS.aws_region,
-        aws_access_key_id=SETTINGS.aws_access_key_id,
-        aws_secret_access_key=SETTINGS.aws_secret_access_key,
+        region_name=settings.aws_region,
+        aws_access_key_id=settings.aws_access_key_id,
+        aws_secret_access_key=settings.aws_secret_access_key,
     )
 
 
 def query(sql: str, *, database: str = DATABASE) -> pd.DataFrame:
     """Execute *sql* on Athena and return the result as a DataFrame."""
+    import pandas as pd
+
     client = _client()
     resp = client.start_query_execution(
         QueryString=sql,
         QueryExecutionContext={"Database": database},
-        ResultConfiguration={"OutputLocation": OUTPUT_LOCATION},
+        ResultConfiguration={"OutputLocation": _output_location()},
     )
     qid = resp["QueryExecutionId"]
 
@@ -0,0 +1,108 @@
+"""Storage backends: which filesystem and root the dataset tree lives under.
+
+Every writer/reader in ``longshot.storage`` builds paths as
+``{root}/{dataset}/...`` and opens them through ``fs``, so the same
+Hive-style layout works on any backend:
+
+    s3     s3://{S3_BUCKET}/{S3_PREFIX} via s3fs (default).  Set
+           S3_ENDPOINT_URL to target MinIO or a moto server instead of AWS.
+    local  LOCAL_STORAGE_ROOT on the local filesystem.
+
+The backend is chosen by ``STORAGE_BACKEND`` in the settings; tests and
+benchmarks can override it for the process with ``set_backend``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+
+from fsspec import AbstractFileSystem
+
+from longshot.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StorageBackend:
+    name: str
+    fs: AbstractFileSystem
+    root: str
+
+    def path(self, *parts: str) -> str:
+        """Join *parts* under the backend root."""
+        return "/".join([self.root, *parts])
+
+
+def s3_backend(
+    bucket: str,
+    prefix: str,
+    *,
+    key: str | None = None,
+    secret: str | None = None,
+    region: str | None = None,
+    endpoint_url: str | None = None,
+) -> StorageBackend:
+    """S3 (or S3-compatible, with *endpoint_url*) bucket + prefix."""
+    import s3fs  # imports aiobotocore; deferred so importing storage stays cheap
+
+    fs = s3fs.S3FileSystem(
+        key=key,
+        secret=secret,
+        endpoint_url=endpoint_url,
+        client_kwargs={"region_name": region} if region else None,
+    )
+    root = f"s3://{bucket}/{prefix}" if prefix else f"s3://{bucket}"
+    return StorageBackend("s3", fs, root)
+
+
+def local_backend(root: str) -> StorageBackend:
+    """Directory on the local filesystem; parent directories are created on write."""
+    from fsspec.implementations.local import LocalFileSystem
+
+    return StorageBackend("local", LocalFileSystem(auto_mkdir=True), os.path.abspath(root))
+
+
+def memory_backend(root: str = "/longshot") -> StorageBackend:
+    """Process-local in-memory filesystem, for tests."""
+    from fsspec.implementations.memory import MemoryFileSystem
+
+    return StorageBackend("memory", MemoryFileSystem(), root)
+
+
+def _backend_from_settings() -> StorageBackend:
+    settings = get_settings()
+    if settings.storage_backend == "local":
+        return local_backend(settings.local_storage_root)
+    return s3_backend(
+        settings.s3_bucket,
+        settings.s3_prefix,
+        key=settings.aws_access_key_id,
+        secret=settings.aws_secret_access_key,
+        region=settings.aws_region,
+        endpoint_url=settings.s3_endpoint_url,
+    )
+
+
+_backend: StorageBackend | None = None
+_lock = threading.Lock()
+
+
+def get_backend() -> StorageBackend:
+    """Return the process-wide backend, building it from settings on first call."""
+    global _backend
+    with _lock:
+        if _backend is None:
+            _backend = _backend_from_settings()
+            logger.info("Storage backend: %s (%s)", _backend.name, _backend.root)
+        return _backend
+
+
+def set_backend(backend: StorageBackend | None) -> None:
+    """Override the backend for this process; ``None`` reverts to settings."""
+    global _backend
+    with _lock:
+        _backend = backend
@@ -0,0 +1,93 @@
+"""Persisted trade bars (``longshot.analytics.trade_bars``), appendable as trades arrive.
+
+One file per bar interval, sorted by ``(ticker, bar_ts)``.  Incremental
+snapshot runs fold their newly fetched trades into the 1-minute bars
+(``BASE_INTERVAL``); ``scripts/build_trade_bars.py`` rebuilds a file from
+the full (deduplicated) trades dataset.
+
+The bars are their own watermark: a ticker's latest ``last_ts`` is the
+newest trade folded in, and ``append_trades`` skips anything at or before
+it.  Folding the same trades twice is therefore a no-op, so the snapshot
+run folds *before* saving the trade watermarks — a failed fold fails the
+run, and the rerun refetches the trades and folds only what is missing.
+
+Writes to: s3://{bucket}/{prefix}/bars/interval={seconds}s/data.parquet
+"""
+
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from longshot.analytics.trade_bars import empty_bars, merge_bars, trade_ts, trades_to_bars
+from longshot.storage.s3 import _base_path, _get_fs, read_trades_unified
+from longshot.storage.writer import atomic_open
+
+logger = logging.getLogger(__name__)
+
+BASE_INTERVAL = 60
+
+
+def _bars_path(interval: int) -> str:
+    return f"{_base_path()}/bars/interval={interval}s/data.parquet"
+
+
+def read_trade_bars(interval: int = BASE_INTERVAL) -> pa.Table:
+    """Read stored bars for *interval*; empty if none have been built."""
+    path = _bars_path(interval)
+    fs = _get_fs()
+    if not fs.exists(path):
+        return empty_bars(interval)
+    with fs.open(path, "rb") as f:
+        # The interval tag is carried in the Parquet schema metadata
+        return pq.read_table(f)
+
+
+def write_trade_bars(bars: pa.Table, interval: int = BASE_INTERVAL) -> str:
+    path = _bars_path(interval)
+    fs = _get_fs()
+    with atomic_open(path, fs=fs) as f:
+        pq.write_table(bars, f, row_group_size=128_000, compression="zstd")
+    logger.info("Wrote %d %ds trade bars to %s", bars.num_rows, interval, path)
+    return path
+
+
+def unfolded_trades(bars: pa.Table, trades: pa.Table) -> pa.Table:
+    """Rows of *trades* newer than the last trade folded into *bars* for their ticker."""
+    if bars.num_rows == 0 or trades.num_rows == 0:
+        return trades
+    folded = bars.group_by("ticker").aggregate([("last_ts", "max")])
+    idx = pc.index_in(trades.column("ticker"), value_set=folded.column("ticker").combine_chunks())
+    mark = pc.fill_null(pc.take(folded.column("last_ts_max"), idx), np.iinfo(np.int64).min)
+    return trades.filter(pa.array(trade_ts(trades) > mark.to_numpy()))
+
+
+def append_trades(trades: pa.Table, interval: int = BASE_INTERVAL) -> str:
+    """Fold trades into the stored bars, skipping any already folded.
+
+    Without a stored bars file there is nothing to fold into, so the bars
+    are rebuilt from the full trades dataset instead (which should already
+    hold *trades*).
+    """
+    if not _get_fs().exists(_bars_path(interval)):
+        logger.warning("No %ds trade bars yet; rebuilding them from the trades dataset", interval)
+        return rebuild_trade_bars(interval)[0]
+    bars = read_trade_bars(interval)
+    new = unfolded_trades(bars, trades)
+    if new.num_rows < trades.num_rows:
+        logger.info("Bars: %d of %d trades already folded", trades.num_rows - new.num_rows, trades.num_rows)
+    return write_trade_bars(merge_bars(bars, trades_to_bars(new, interval)), interval)
+
+
+def rebuild_trade_bars(interval: int = BASE_INTERVAL) -> tuple[str, int]:
+    """Rebuild the *interval* bars from every live and historical trades partition.
+
+    Returns ``(path, trade_count)``.
+    """
+    trades = read_trades_unified()
+    path = write_trade_bars(trades_to_bars(trades, interval), interval)
+    return path, trades.num_rows
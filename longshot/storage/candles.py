@@ -0,0 +1,181 @@
+"""Candlestick (OHLC) store: one ticker/time-sorted Parquet dataset per interval.
+
+Candles are hash-sharded by ticker so an ingest only rewrites the shards it
+touches, and each shard is sorted by ``(ticker, end_period_ts)`` with modest
+row groups, so ``candles(ticker, start, end)`` reads one file and only the
+row groups whose min/max statistics cover the ticker and time range.
+
+Writes to: s3://{bucket}/{prefix}/candles/interval={1m,1h,1d}/shard={NN}/data.parquet
+"""
+
+from __future__ import annotations
+
+import logging
+import zlib
+from collections.abc import Iterable
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from longshot.api.models import Candlestick
+from longshot.storage.s3 import _base_path, _get_fs
+from longshot.storage.writer import atomic_open
+
+logger = logging.getLogger(__name__)
+
+# Interval name → period in minutes (Kalshi's ``period_interval``)
+INTERVALS = {"1m": 1, "1h": 60, "1d": 1440}
+
+N_SHARDS = 32
+ROW_GROUP_SIZE = 64_000
+
+CANDLES_SCHEMA = pa.schema(
+    [
+        pa.field("ticker", pa.string()),
+        pa.field("end_period_ts", pa.int64()),
+        pa.field("open", pa.float64()),
+        pa.field("high", pa.float64()),
+        pa.field("low", pa.float64()),
+        pa.field("close", pa.float64()),
+        pa.field("mean", pa.float64()),
+        pa.field("previous", pa.float64()),
+        pa.field("yes_bid_open", pa.float64()),
+        pa.field("yes_bid_high", pa.float64()),
+        pa.field("yes_bid_low", pa.float64()),
+        pa.field("yes_bid_close", pa.float64()),
+        pa.field("yes_ask_open", pa.float64()),
+        pa.field("yes_ask_high", pa.float64()),
+        pa.field("yes_ask_low", pa.float64()),
+        pa.field("yes_ask_close", pa.float64()),
+        pa.field("volume", pa.int64()),
+        pa.field("open_interest", pa.int64()),
+    ]
+)
+
+
+def _check_interval(interval: str) -> None:
+    if interval not in INTERVALS:
+        raise ValueError(f"Unknown candle interval {interval!r}; expected one of {sorted(INTERVALS)}")
+
+
+def shard_of(ticker: str) -> int:
+    """Stable shard number for *ticker*."""
+    return zlib.crc32(ticker.encode()) % N_SHARDS
+
+
+def _shard_path(interval: str, shard: int) -> str:
+    return f"{_base_path()}/candles/interval={interval}/shard={shard:02d}/data.parquet"
+
+
+def candles_to_table(ticker: str, candles: list[Candlestick]) -> pa.Table:
+    arrays = {
+        "ticker": [ticker] * len(candles),
+        "end_period_ts": [c.end_period_ts for c in candles],
+        "open": [c.price.open for c in candles],
+        "high": [c.price.high for c in candles],
+        "low": [c.price.low for c in candles],
+        "close": [c.price.close for c in candles],
+        "mean": [c.price.mean for c in candles],
+        "previous": [c.price.previous for c in candles],
+        "yes_bid_open": [c.yes_bid.open for c in candles],
+        "yes_bid_high": [c.yes_bid.high for c in candles],
+        "yes_bid_low": [c.yes_bid.low for c in candles],
+        "yes_bid_close": [c.yes_bid.close for c in candles],
+        "yes_ask_open": [c.yes_ask.open for c in candles],
+        "yes_ask_high": [c.yes_ask.high for c in candles],
+        "yes_ask_low": [c.yes_ask.low for c in candles],
+        "yes_ask_close": [c.yes_ask.close for c in candles],
+        "volume": [c.volume for c in candles],
+        "open_interest": [c.open_interest for c in candles],
+    }
+    return pa.table(arrays, schema=CANDLES_SCHEMA)
+
+
+def _sort_dedupe(table: pa.Table) -> pa.Table:
+    """Sort by ``(ticker, end_period_ts)``, keeping the *last* row of each key."""
+    table = table.append_column("_row", pa.array(np.arange(table.num_rows)))
+    table = table.sort_by([("ticker", "ascending"), ("end_period_ts", "ascending"), ("_row", "descending")])
+    ticker = table.column("ticker").to_numpy(zero_copy_only=False)
+    ts = table.column("end_period_ts").to_numpy()
+    keep = np.ones(table.num_rows, dtype=bool)
+    keep[1:] = (ticker[1:] != ticker[:-1]) | (ts[1:] != ts[:-1])
+    return table.filter(pa.array(keep)).drop_columns(["_row"])
+
+
+def read_shard(interval: str, shard: int) -> pa.Table:
+    path = _shard_path(interval, shard)
+    fs = _get_fs()
+    if not fs.exists(path):
+        return CANDLES_SCHEMA.empty_table()
+    with fs.open(path, "rb") as f:
+        return pq.read_table(f, schema=CANDLES_SCHEMA)
+
+
+def write_candles(table: pa.Table, interval: str) -> list[str]:
+    """Merge *table* into the store for *interval*. Returns the shard paths rewritten.
+
+    Rows for an existing ``(ticker, end_period_ts)`` replace the stored ones
+    (the latest fetch of a still-open period wins).
+    """
+    _check_interval(interval)
+    if table.num_rows == 0:
+        return []
+    table = table.select(CANDLES_SCHEMA.names).cast(CANDLES_SCHEMA)
+    shards = np.fromiter((shard_of(t) for t in table.column("ticker").to_pylist()), dtype=np.int64, count=table.num_rows)
+    fs = _get_fs()
+    paths = []
+    for shard in np.unique(shards).tolist():
+        merged = _sort_dedupe(pa.concat_tables([read_shard(interval, shard), table.filter(pa.array(shards == shard))]))
+        path = _shard_path(interval, shard)
+        with atomic_open(path, fs=fs) as f:
+            pq.write_table(merged, f, row_group_size=ROW_GROUP_SIZE, compression="zstd")
+        paths.append(path)
+    logger.info("Merged %d %s candles into %d shard(s)", table.num_rows, interval, len(paths))
+    return paths
+
+
+def candles(ticker: str, start: int | None = None, end: int | None = None, interval: str = "1h") -> pa.Table:
+    """Stored candles for *ticker* with ``start <= end_period_ts <= end``, sorted by time.
+
+    Only the ticker's shard is opened, and row groups outside the ticker or
+    time range are skipped using Parquet statistics.
+    """
+    _check_interval(interval)
+    path = _shard_path(interval, shard_of(ticker))
+    fs = _get_fs()
+    if not fs.exists(path):
+        return CANDLES_SCHEMA.empty_table()
+    filters = [("ticker", "=", ticker)]
+    if start is not None:
+        filters.append(("end_period_ts", ">=", start))
+    if end is not None:
+        filters.append(("end_period_ts", "<=", end))
+    with fs.open(path, "rb") as f:
+        return pq.read_table(f, schema=CANDLES_SCHEMA, filters=filters)
+
+
+def candles_many(
+    tickers: Iterable[str], start: int | None = None, end: int | None = None, interval: str = "1h",
+) -> pa.Table:
+    """``candles`` for several tickers, reading each shard once."""
+    _check_interval(interval)
+    by_shard: dict[int, list[str]] = {}
+    for t in tickers:
+        by_shard.setdefault(shard_of(t), []).append(t)
+    fs = _get_fs()
+    tables = []
+    for shard, shard_tickers in sorted(by_shard.items()):
+        path = _shard_path(interval, shard)
+        if not fs.exists(path):
+            continue
+        filters = [("ticker", "in", shard_tickers)]
+        if start is not None:
+            filters.append(("end_period_ts", ">=", start))
+        if end is not None:
+            filters.append(("end_period_ts", "<=", end))
+        with fs.open(path, "rb") as f:
+            tables.append(pq.read_table(f, schema=CANDLES_SCHEMA, filters=filters))
+    if not tables:
+        return CANDLES_SCHEMA.empty_table()
+    return pa.concat_tables(tables).sort_by([("ticker", "ascending"), ("end_period_ts", "ascending")])
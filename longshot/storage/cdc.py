@@ -0,0 +1,229 @@
+"""Change-data-capture deltas between consecutive hourly market pulls.
+
+Instead of writing a full copy of the active universe every hour, the hourly
+job writes a full *base* every few hours and, in between, only the rows that
+changed since the previous hour:
+
+- ``insert``: ticker not present in the previous hour
+- ``update``: row hash differs from the previous hour
+- ``delete``: ticker present in the previous hour but not in this pull
+  (only ``ticker`` is populated)
+
+Bases keep the existing hourly layout, so the Athena ``daily_markets`` table
+now holds a full copy at base hours only.  The newest pull is also written in
+full to ``markets/latest`` (the Athena ``latest_markets`` table), overwritten
+every hour:
+
+    s3://{bucket}/{prefix}/markets/daily/date={YYYY-MM-DD}/hour={HH}/data.parquet
+    s3://{bucket}/{prefix}/markets/daily_delta/date={YYYY-MM-DD}/hour={HH}/data.parquet
+    s3://{bucket}/{prefix}/markets/latest/data.parquet
+
+Any hour is reconstructed by replaying the deltas after the latest base.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator, Sequence
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from longshot.storage.compaction import list_hours, read_hour
+from longshot.storage.s3 import MARKETS_SCHEMA, _base_path, _get_fs, _hourly_path
+from longshot.storage.writer import atomic_open
+
+logger = logging.getLogger(__name__)
+
+BASE_PREFIX = "markets/daily"
+DELTA_PREFIX = "markets/daily_delta"
+LATEST_PATH = "markets/latest/data.parquet"
+
+DELTA_SCHEMA = MARKETS_SCHEMA.append(pa.field("op", pa.string()))
+
+# Every column participates so that replaying deltas reproduces each pull exactly
+CDC_HASH_COLUMNS = MARKETS_SCHEMA.names
+
+# Nullable pandas dtypes so a column's hash doesn't depend on whether *other*
+# rows in the batch happen to be null (int64 -> float64 upcasting)
+_HASH_DTYPES = {pa.int64(): pd.Int64Dtype(), pa.bool_(): pd.BooleanDtype()}.get
+
+
+def row_hash(table: pa.Table, columns: Sequence[str] = CDC_HASH_COLUMNS) -> np.ndarray:
+    """Return a uint64 hash per row over *columns* (null-aware, vectorized)."""
+    if table.num_rows == 0:
+        return np.empty(0, dtype=np.uint64)
+    df = table.select(list(columns)).to_pandas(types_mapper=_HASH_DTYPES)
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def _dedupe_tickers(pull: pa.Table) -> pa.Table:
+    """Drop repeated tickers (pagination can return a market twice), keeping the first."""
+    tickers = pull.column("ticker").to_numpy(zero_copy_only=False)
+    _, first = np.unique(tickers, return_index=True)
+    if len(first) == pull.num_rows:
+        return pull
+    logger.warning("Pull has %d duplicate ticker rows — keeping first", pull.num_rows - len(first))
+    return pull.take(np.sort(first))
+
+
+def diff_pulls(prev: pa.Table, new: pa.Table) -> pa.Table:
+    """Return the ``DELTA_SCHEMA`` rows that turn *prev* into *new*."""
+    new = _dedupe_tickers(new.select(MARKETS_SCHEMA.names).cast(MARKETS_SCHEMA))
+    prev_keys = pa.table({"ticker": prev.column("ticker"), "prev_hash": row_hash(prev)})
+    new_keys = pa.table({"ticker": new.column("ticker"), "new_hash": row_hash(new)})
+    joined = prev_keys.join(new_keys, "ticker", join_type="full outer")
+
+    prev_hash = joined.column("prev_hash")
+    new_hash = joined.column("new_hash")
+    inserted = joined.filter(pc.is_null(prev_hash)).column("ticker")
+    updated = joined.filter(
+        pc.fill_null(pc.not_equal(prev_hash, new_hash), False)
+    ).column("ticker")
+    deleted = joined.filter(pc.is_null(new_hash)).column("ticker")
+
+    def _with_op(rows: pa.Table, op: str) -> pa.Table:
+        return rows.append_column("op", pa.array([op] * rows.num_rows, pa.string()))
+
+    tickers = new.column("ticker")
+    deletes = pa.table(
+        [
+            deleted.combine_chunks() if f.name == "ticker" else pa.nulls(len(deleted), f.type)
+            for f in MARKETS_SCHEMA
+        ],
+        schema=MARKETS_SCHEMA,
+    )
+
+    delta = pa.concat_tables([
+        _with_op(new.filter(pc.is_in(tickers, value_set=inserted)), "insert"),
+        _with_op(new.filter(pc.is_in(tickers, value_set=updated)), "update"),
+        _with_op(deletes, "delete"),
+    ])
+    return delta.sort_by("ticker")
+
+
+def apply_delta(state: pa.Table, delta: pa.Table) -> pa.Table:
+    """Apply a ``DELTA_SCHEMA`` table to a full *state* and return the new state."""
+    touched = delta.column("ticker")
+    kept = state.filter(pc.invert(pc.is_in(state.column("ticker"), value_set=touched)))
+    upserts = delta.filter(pc.not_equal(delta.column("op"), "delete"))
+    return pa.concat_tables([kept, upserts.select(MARKETS_SCHEMA.names)]).sort_by("ticker")
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+def list_cdc_hours() -> list[tuple[int, str]]:
+    """Return ``(hour_ts, kind)`` for every stored base/delta hour, oldest first.
+
+    If an hour has both, the base wins.  Compacted days are included.
+    """
+    entries: dict[int, str] = {}
+    for hour_ts in list_hours(DELTA_PREFIX):
+        entries[hour_ts] = "delta"
+    for hour_ts in list_hours(BASE_PREFIX):
+        entries[hour_ts] = "base"
+    return sorted(entries.items())
+
+
+def _read(kind: str, hour_ts: int) -> pa.Table:
+    return read_hour(BASE_PREFIX if kind == "base" else DELTA_PREFIX, hour_ts)
+
+
+def _base_state(table: pa.Table) -> pa.Table:
+    return table.select(MARKETS_SCHEMA.names).cast(MARKETS_SCHEMA).sort_by("ticker")
+
+
+def iter_reconstructed_hours(after_ts: int | None = None) -> Iterator[tuple[int, pa.Table]]:
+    """Yield ``(hour_ts, full_state)`` for every stored hour newer than *after_ts*.
+
+    Replays from the latest base at or before the first hour needed, so each
+    base and delta file is read at most once.
+    """
+    entries = list_cdc_hours()
+    base_idx = [i for i, (ts, kind) in enumerate(entries) if kind == "base"]
+    if not base_idx:
+        return
+
+    start = base_idx[0]
+    if after_ts is not None:
+        start = max([i for i in base_idx if entries[i][0] <= after_ts], default=start)
+    if start == base_idx[0] and start > 0:
+        logger.warning("Skipping %d delta(s) with no preceding base", start)
+
+    state: pa.Table | None = None
+    for hour_ts, kind in entries[start:]:
+        table = _read(kind, hour_ts)
+        state = _base_state(table) if kind == "base" else apply_delta(state, table)
+        if after_ts is None or hour_ts > after_ts:
+            yield hour_ts, state
+
+
+def reconstruct_hour(hour_ts: int) -> pa.Table:
+    """Return the full market pull stored for *hour_ts* (or the latest hour before it)."""
+    entries = list_cdc_hours()
+    bases = [i for i, (ts, kind) in enumerate(entries) if kind == "base" and ts <= hour_ts]
+    if not bases:
+        raise FileNotFoundError(f"No base market pull at or before {hour_ts}")
+
+    state = None
+    for ts, kind in entries[bases[-1]:]:
+        if ts > hour_ts:
+            break
+        table = _read(kind, ts)
+        state = _base_state(table) if kind == "base" else apply_delta(state, table)
+    return state
+
+
+def _write_latest(table: pa.Table, hour_ts: int) -> None:
+    dt = datetime.fromtimestamp(hour_ts, tz=timezone.utc)
+    n = table.num_rows
+    latest = table.append_column("date", pa.array([f"{dt:%Y-%m-%d}"] * n, pa.string()))
+    latest = latest.append_column("hour", pa.array([f"{dt:%H}"] * n, pa.string()))
+    with atomic_open(f"{_base_path()}/{LATEST_PATH}", fs=_get_fs()) as f:
+        pq.write_table(latest, f)
+
+
+def write_hourly_pull(table: pa.Table, hour_ts: int, *, base_every_hours: int = 24) -> tuple[str, str, int]:
+    """Write an hourly pull as a base or a delta against the previous stored hour.
+
+    A base is written when the number of hours since the Unix epoch is a
+    multiple of *base_every_hours* (so 24 means 00:00 UTC) or when no base
+    exists within the last *base_every_hours* hours.  Unless a newer hour is
+    already stored, the full pull also replaces ``markets/latest``.
+
+    Returns ``(path, kind, rows_written)``.
+    """
+    if base_every_hours < 1:
+        raise ValueError(f"base_every_hours must be >= 1, got {base_every_hours}")
+    stored = list_cdc_hours()
+    entries = [e for e in stored if e[0] < hour_ts]
+    last_base = max((ts for ts, kind in entries if kind == "base"), default=None)
+
+    needs_base = (
+        (hour_ts // 3600) % base_every_hours == 0
+        or last_base is None
+        or hour_ts - last_base >= base_every_hours * 3600
+    )
+
+    fs = _get_fs()
+    if needs_base:
+        path = _hourly_path(BASE_PREFIX, hour_ts)
+        out, kind = table, "base"
+    else:
+        prev = reconstruct_hour(entries[-1][0])
+        path = _hourly_path(DELTA_PREFIX, hour_ts)
+        out, kind = diff_pulls(prev, table), "delta"
+
+    with atomic_open(path, fs=fs) as f:
+        pq.write_table(out, f)
+    logger.info("Wrote %s of %d rows (pull has %d) to %s", kind, out.num_rows, table.num_rows, path)
+
+    if all(ts <= hour_ts for ts, _ in stored):
+        _write_latest(table, hour_ts)
+    return path, kind, out.num_rows
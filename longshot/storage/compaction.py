@@ -0,0 +1,232 @@
+"""Compaction of hourly partitions into a few sorted per-day Parquet files.
+
+The hourly layout ``{dataset}/date=YYYY-MM-DD/hour=HH/data.parquet`` leaves
+24 small files per day.  Once a day is complete it is rewritten as one or a
+few well-sized files, sorted by ``(hour, key)`` with ``hour`` kept as a
+column:
+
+    s3://{bucket}/{prefix}/{dataset}_compacted/date={YYYY-MM-DD}/gen={id}/part-{NNNN}.parquet
+    s3://{bucket}/{prefix}/{dataset}_compacted/date={YYYY-MM-DD}/_manifest.json
+
+Part files are written under a fresh generation directory and only become
+visible when ``_manifest.json`` (a single-object PUT) is replaced, so readers
+never see a half-written day.  The generation the manifest replaced is kept
+until the next compaction of that day, so a reader that loaded the old
+manifest just before the swap can still open its files.  ``read_hour`` /
+``read_day`` / ``list_hours`` prefer the compacted copy and fall back to the
+hourly files.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import uuid
+from datetime import date, datetime, timezone
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from longshot.storage.s3 import _base_path, _get_fs, _hourly_path, list_hourly_partitions
+from longshot.storage.writer import atomic_open
+
+logger = logging.getLogger(__name__)
+
+# Hourly datasets and the key each is sorted by within an hour
+DATASET_SORT_KEYS = {
+    "markets/daily": "ticker",
+    "markets/daily_delta": "ticker",
+    "events/daily": "event_ticker",
+}
+
+# In-memory (Arrow) bytes per output file; Parquet compression typically
+# brings this down 3-5x on disk
+TARGET_FILE_BYTES = 512 * 1024 * 1024
+
+MANIFEST_NAME = "_manifest.json"
+
+
+def _compacted_dir(dataset: str, date_str: str) -> str:
+    return f"{_base_path()}/{dataset}_compacted/date={date_str}"
+
+
+def _hour_ts(date_str: str, hour: int) -> int:
+    dt = datetime.strptime(date_str, "%Y-%m-%d").replace(hour=hour, tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def read_manifest(dataset: str, date_str: str) -> dict | None:
+    """Return the compaction manifest for a day, or ``None`` if not compacted."""
+    fs = _get_fs()
+    path = f"{_compacted_dir(dataset, date_str)}/{MANIFEST_NAME}"
+    if not fs.exists(path):
+        return None
+    return json.loads(fs.cat_file(path))
+
+
+def _list_manifests(dataset: str) -> list[dict]:
+    fs = _get_fs()
+    pattern = f"{_base_path()}/{dataset}_compacted/date=*/{MANIFEST_NAME}"
+    return [json.loads(fs.cat_file(key)) for key in sorted(fs.glob(pattern))]
+
+
+# ---------------------------------------------------------------------------
+# Readers
+# ---------------------------------------------------------------------------
+
+def list_hours(dataset: str) -> list[int]:
+    """Return the start ts of every hour stored for *dataset*, compacted or not."""
+    hours = {ts for ts, _ in list_hourly_partitions(dataset)}
+    for manifest in _list_manifests(dataset):
+        hours.update(_hour_ts(manifest["date"], h) for h in manifest["hours"])
+    return sorted(hours)
+
+
+def _read_compacted(dataset: str, manifest: dict, hour: int | None) -> pa.Table:
+    fs = _get_fs()
+    base = _compacted_dir(dataset, manifest["date"])
+    tables = []
+    for part in manifest["files"]:
+        if hour is not None and hour not in part["hours"]:
+            continue
+        with fs.open(f"{base}/{part['path']}", "rb") as f:
+            tables.append(pq.read_table(f, filters=None if hour is None else pc.field("hour") == hour))
+    return pa.concat_tables(tables, promote_options="default")
+
+
+def read_hour(dataset: str, hour_ts: int) -> pa.Table:
+    """Read one hour of *dataset* (without the ``hour`` column)."""
+    dt = datetime.fromtimestamp(hour_ts, tz=timezone.utc)
+    manifest = read_manifest(dataset, f"{dt:%Y-%m-%d}")
+    if manifest is not None and dt.hour in manifest["hours"]:
+        table = _read_compacted(dataset, manifest, dt.hour)
+        return table.drop_columns(["hour"])
+
+    fs = _get_fs()
+    with fs.open(_hourly_path(dataset, hour_ts), "rb") as f:
+        return pq.read_table(f)
+
+
+def read_day(dataset: str, date_str: str) -> pa.Table:
+    """Read every stored hour of *dataset* for a day, with an ``hour`` column."""
+    manifest = read_manifest(dataset, date_str)
+    if manifest is not None:
+        return _read_compacted(dataset, manifest, None)
+    return _read_hourly_day(dataset, date_str)[0]
+
+
+def _read_hourly_day(dataset: str, date_str: str) -> tuple[pa.Table, list[int], list[str]]:
+    day_start = _hour_ts(date_str, 0)
+    fs = _get_fs()
+    tables, hours, paths = [], [], []
+    for hour_ts, path in list_hourly_partitions(dataset):
+        if not day_start <= hour_ts < day_start + 86_400:
+            continue
+        hour = (hour_ts - day_start) // 3600
+        with fs.open(path, "rb") as f:
+            table = pq.read_table(f)
+        tables.append(table.append_column("hour", pa.array([hour] * table.num_rows, pa.int32())))
+        hours.append(hour)
+        paths.append(path)
+    if not tables:
+        raise FileNotFoundError(f"No hourly partitions for {dataset} on {date_str}")
+    return pa.concat_tables(tables, promote_options="default"), hours, paths
+
+
+# ---------------------------------------------------------------------------
+# Compaction
+# ---------------------------------------------------------------------------
+
+def compact_day(
+    dataset: str,
+    date_str: str,
+    *,
+    target_file_bytes: int = TARGET_FILE_BYTES,
+    delete_hourly: bool = False,
+) -> dict:
+    """Rewrite a completed day of hourly partitions into sorted per-day files.
+
+    The new generation is committed by replacing the manifest.  The
+    generation it replaces is kept for readers still holding the old
+    manifest; older generations are removed.  With
+    *delete_hourly*, the source hourly files are deleted once the manifest is
+    committed.
+
+    Returns the committed manifest.
+    """
+    if date.fromisoformat(date_str) >= datetime.now(timezone.utc).date():
+        raise ValueError(f"Refusing to compact {date_str}: day is not complete yet")
+
+    sort_key = DATASET_SORT_KEYS[dataset]
+    table, hours, sources = _read_hourly_day(dataset, date_str)
+
+    # Carry over hours already compacted whose hourly files are gone
+    previous = read_manifest(dataset, date_str)
+    if previous is not None:
+        carried = [h for h in previous["hours"] if h not in hours]
+        if carried:
+            old = _read_compacted(dataset, previous, None)
+            old = old.filter(pc.is_in(old.column("hour"), value_set=pa.array(carried, pa.int32())))
+            table = pa.concat_tables([table, old], promote_options="default")
+            hours = hours + carried
+
+    table = table.sort_by([("hour", "ascending"), (sort_key, "ascending")])
+
+    # Roughly equal-sized parts; sorted, so each covers a contiguous hour range
+    n_parts = max(1, math.ceil(table.nbytes / target_file_bytes))
+    rows_per_part = math.ceil(table.num_rows / n_parts)
+
+    fs = _get_fs()
+    base = _compacted_dir(dataset, date_str)
+    generation = uuid.uuid4().hex[:12]
+    files = []
+    for i, offset in enumerate(range(0, max(table.num_rows, 1), rows_per_part or 1)):
+        part = table.slice(offset, rows_per_part)
+        rel = f"gen={generation}/part-{i:04d}.parquet"
+        with atomic_open(f"{base}/{rel}", fs=fs) as f:
+            pq.write_table(part, f, row_group_size=128_000, compression="zstd")
+        part_hours = pc.unique(part.column("hour")).to_pylist()
+        files.append({"path": rel, "rows": part.num_rows, "hours": sorted(part_hours)})
+
+    manifest = {
+        "dataset": dataset,
+        "date": date_str,
+        "generation": generation,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "hours": sorted(hours),
+        "rows": table.num_rows,
+        "files": files,
+    }
+    with atomic_open(f"{base}/{MANIFEST_NAME}", fs=fs) as f:
+        f.write(json.dumps(manifest, indent=2).encode())
+    logger.info(
+        "Compacted %s %s: %d hourly files → %d file(s), %d rows (gen=%s)",
+        dataset, date_str, len(sources), len(files), table.num_rows, generation,
+    )
+
+    keep = {f"gen={generation}"}
+    if previous is not None:
+        keep.add(f"gen={previous['generation']}")
+    for path in fs.glob(f"{base}/gen=*"):
+        if path.rstrip("/").rsplit("/", 1)[-1] not in keep:
+            fs.rm(path, recursive=True)
+    if delete_hourly:
+        for path in sources:
+            fs.rm(path)
+        logger.info("Deleted %d hourly files for %s %s", len(sources), dataset, date_str)
+
+    return manifest
+
+
+def uncompacted_days(dataset: str) -> list[str]:
+    """Return completed days of *dataset* that have hourly files not yet compacted."""
+    today = datetime.now(timezone.utc).date()
+    compacted = {m["date"]: set(m["hours"]) for m in _list_manifests(dataset)}
+    pending: set[str] = set()
+    for hour_ts, _ in list_hourly_partitions(dataset):
+        dt = datetime.fromtimestamp(hour_ts, tz=timezone.utc)
+        if dt.date() < today and dt.hour not in compacted.get(f"{dt:%Y-%m-%d}", set()):
+            pending.add(f"{dt:%Y-%m-%d}")
+    return sorted(pending)
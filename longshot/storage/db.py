@@ -2,28 +2,43 @@
 
 from __future__ import annotations
 
-import duckdb
+from typing import TYPE_CHECKING
 
-from longshot.config import SETTINGS
+from longshot.config import get_settings
 
-# S3 paths for use in queries
-MARKETS_ALL = f"s3://{SETTINGS.s3_bucket}/{SETTINGS.s3_prefix}/markets/all/*.parquet"
-EVENTS_ALL = f"s3://{SETTINGS.s3_bucket}/{SETTINGS.s3_prefix}/events/data.parquet"
-MARKETS_SNAPSHOT = (
-    f"s3://{SETTINGS.s3_bucket}/{SETTINGS.s3_prefix}/markets/snapshot_date={{date}}/data.parquet"
-)
-TRADES_SNAPSHOT = (
-    f"s3://{SETTINGS.s3_bucket}/{SETTINGS.s3_prefix}/trades/snapshot_date={{date}}/data.parquet"
-)
+if TYPE_CHECKING:
+    import duckdb
+
+# S3 paths for use in queries, relative to s3://{bucket}/{prefix}; exposed as
+# module attributes (MARKETS_ALL, ...) resolved on first access
+_PATHS = {
+    "MARKETS_ALL": "markets/all/*.parquet",
+    "MARKETS_HISTORICAL": "markets/historical/*.parquet",
+    "EVENTS_ALL": "events/data.parquet",
+    "SERIES_ALL": "series/data.parquet",
+    "MARKETS_SNAPSHOT": "markets/snapshot_date={date}/data.parquet",
+    "TRADES_SNAPSHOT": "trades/snapshot_date={date}/data.parquet",
+    "TRADES_HISTORICAL": "trades/historical/*.parquet",
+}
+
+
+def __getattr__(name: str) -> str:
+    if name in _PATHS:
+        settings = get_settings()
+        return f"s3://{settings.s3_bucket}/{settings.s3_prefix}/{_PATHS[name]}"
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def connect() -> duckdb.DuckDBPyConnection:
     """Return a DuckDB connection with S3 credentials installed."""
+    import duckdb
+
+    settings = get_settings()
     con = duckdb.connect()
     con.execute("INSTALL httpfs; LOAD httpfs;")
     con.execute(f"""
-        SET s3_region = '{SETTINGS.aws_region}';
-        SET s3_access_key_id = '{SETTINGS.aws_access_key_id}';
-        SET s3_secret_access_key = '{SETTINGS.aws_secret_access_key}';
+        SET s3_region = '{settings.aws_region}';
+        SET s3_access_key_id = '{settings.aws_access_key_id}';
+        SET s3_secret_access_key = '{settings.aws_secret_access_key}';
     """)
     return con
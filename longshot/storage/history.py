@@ -0,0 +1,202 @@
+"""SCD-2 market history folded from hourly pulls, with point-in-time lookup.
+
+Each row of the history table is one *version* of a market: the full
+``MARKETS_SCHEMA`` row as first observed at ``valid_from``, valid until
+``valid_to`` (exclusive; null while it is still the current version).  A new
+version is opened only when one of ``TRACKED_COLUMNS`` changes between pulls,
+so storage grows with the number of state changes rather than the number of
+hourly copies.
+
+Writes to: s3://{bucket}/{prefix}/markets/history/data.parquet
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from longshot.storage.cdc import _dedupe_tickers, iter_reconstructed_hours, row_hash
+from longshot.storage.s3 import MARKETS_SCHEMA, _base_path, _get_fs
+from longshot.storage.writer import atomic_open
+
+logger = logging.getLogger(__name__)
+
+# Changes to any of these open a new version; descriptive fields (title,
+# rules, ...) are carried along from the first pull of each version.
+TRACKED_COLUMNS = [
+    "status",
+    "yes_bid",
+    "yes_ask",
+    "no_bid",
+    "no_ask",
+    "last_price",
+    "previous_yes_bid",
+    "previous_yes_ask",
+    "previous_price",
+    "volume",
+    "volume_24h",
+    "open_interest",
+    "close_time",
+    "expiration_time",
+    "result",
+    "settlement_value",
+]
+
+HISTORY_SCHEMA = MARKETS_SCHEMA.append(pa.field("valid_from", pa.int64())).append(
+    pa.field("valid_to", pa.int64())
+)
+
+# Parquet key-value metadata: Unix ts of the latest pull folded in
+_THROUGH_TS_KEY = b"longshot.history.through_ts"
+
+
+def empty_history() -> pa.Table:
+    return HISTORY_SCHEMA.empty_table()
+
+
+def fold_pull(history: pa.Table, pull: pa.Table, pull_ts: int) -> pa.Table:
+    """Fold one full pull of markets observed at *pull_ts* into *history*.
+
+    - tickers whose tracked state changed (or that are new) get a new version
+      starting at *pull_ts*, closing the previous one;
+    - tickers with an open version that are absent from the pull are closed
+      at *pull_ts* (they left the active set).
+    """
+    pull = _dedupe_tickers(pull.select(MARKETS_SCHEMA.names).cast(MARKETS_SCHEMA))
+
+    is_open = pc.is_null(history.column("valid_to"))
+    current = history.filter(is_open)
+
+    cur_keys = pa.table(
+        {"ticker": current.column("ticker"), "cur_hash": row_hash(current, TRACKED_COLUMNS)}
+    )
+    new_keys = pa.table({"ticker": pull.column("ticker"), "new_hash": row_hash(pull, TRACKED_COLUMNS)})
+    joined = cur_keys.join(new_keys, "ticker", join_type="full outer")
+
+    cur_hash = joined.column("cur_hash")
+    new_hash = joined.column("new_hash")
+    differs = pc.fill_null(pc.not_equal(cur_hash, new_hash), True)
+    to_close = joined.filter(pc.and_(pc.is_valid(cur_hash), differs)).column("ticker")
+    to_open = joined.filter(pc.and_(pc.is_valid(new_hash), differs)).column("ticker")
+
+    closing = pc.and_(is_open, pc.is_in(history.column("ticker"), value_set=to_close))
+    valid_to = pc.if_else(closing, pa.scalar(pull_ts, pa.int64()), history.column("valid_to"))
+    history = history.set_column(history.schema.get_field_index("valid_to"), "valid_to", valid_to)
+
+    inserts = pull.filter(pc.is_in(pull.column("ticker"), value_set=to_open))
+    inserts = inserts.append_column(
+        "valid_from", pa.array(np.full(inserts.num_rows, pull_ts, dtype=np.int64))
+    ).append_column("valid_to", pa.nulls(inserts.num_rows, pa.int64()))
+
+    logger.info(
+        "Folded pull at %d: %d rows → %d new versions, %d closed",
+        pull_ts,
+        pull.num_rows,
+        inserts.num_rows,
+        len(to_close),
+    )
+    return pa.concat_tables([history, inserts]).sort_by(
+        [("ticker", "ascending"), ("valid_from", "ascending")]
+    )
+
+
+def state_as_of(
+    history: pa.Table,
+    ts: int,
+    tickers: Iterable[str] | None = None,
+) -> pa.Table:
+    """Return the market rows valid at *ts* from an in-memory history table."""
+    return history.filter(_as_of_expr(ts, tickers)).select(MARKETS_SCHEMA.names)
+
+
+def _as_of_expr(ts: int, tickers: Iterable[str] | None) -> pc.Expression:
+    expr = (pc.field("valid_from") <= ts) & (
+        pc.field("valid_to").is_null() | (pc.field("valid_to") > ts)
+    )
+    if tickers is not None:
+        expr = expr & pc.field("ticker").isin(list(tickers))
+    return expr
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+def _history_path() -> str:
+    return f"{_base_path()}/markets/history/data.parquet"
+
+
+def read_history() -> tuple[pa.Table, int | None]:
+    """Read the history table and the ts of the latest pull folded into it.
+
+    Returns ``(empty_history(), None)`` if no history has been written yet.
+    """
+    path = _history_path()
+    fs = _get_fs()
+    if not fs.exists(path):
+        return empty_history(), None
+    with fs.open(path, "rb") as f:
+        table = pq.read_table(f)
+    meta = table.schema.metadata or {}
+    through = meta.get(_THROUGH_TS_KEY)
+    return table.replace_schema_metadata(None), int(through) if through else None
+
+
+def write_history(history: pa.Table, through_ts: int) -> str:
+    """Write the history table, recording *through_ts* in the file metadata."""
+    path = _history_path()
+    table = history.replace_schema_metadata({_THROUGH_TS_KEY: str(through_ts).encode()})
+    fs = _get_fs()
+    with atomic_open(path, fs=fs) as f:
+        # Sorted by ticker, so modest row groups give useful min/max pruning
+        pq.write_table(table, f, row_group_size=128_000)
+    logger.info("Wrote %d history rows (through %d) to %s", history.num_rows, through_ts, path)
+    return path
+
+
+def market_state_as_of(ts: int, tickers: Iterable[str] | None = None) -> pa.Table:
+    """Return what the market universe (or *tickers*) looked like at Unix *ts*.
+
+    Answers by interval lookup on the history table; row groups that cannot
+    contain a matching version are skipped via Parquet statistics.
+    """
+    path = _history_path()
+    fs = _get_fs()
+    with fs.open(path, "rb") as f:
+        table = pq.read_table(f, filters=_as_of_expr(ts, tickers))
+    return table.select(MARKETS_SCHEMA.names)
+
+
+def compact_hourly_into_history() -> dict:
+    """Fold every hourly market pull newer than the history high-water mark.
+
+    Hours stored as CDC deltas are reconstructed before folding.
+
+    Returns summary dict with counts and the history path.
+    """
+    history, through_ts = read_history()
+    logger.info("History through %s; folding newer hourly pulls", through_ts)
+
+    folded = 0
+    rows_in = 0
+    for pull_ts, pull in iter_reconstructed_hours(after_ts=through_ts):
+        rows_in += pull.num_rows
+        history = fold_pull(history, pull, pull_ts)
+        through_ts = pull_ts
+        folded += 1
+
+    path = write_history(history, through_ts) if folded else _history_path()
+    summary = {
+        "pulls_folded": folded,
+        "rows_in": rows_in,
+        "history_rows": history.num_rows,
+        "through_ts": through_ts,
+        "history_path": path,
+    }
+    logger.info("History compaction complete: %s", summary)
+    return summary
@@ -0,0 +1,105 @@
+"""Orderbook depth snapshots stored as fixed-size price-indexed arrays.
+
+``GET /markets/{ticker}/orderbook`` returns resting YES and NO bids as
+``[price, quantity]`` pairs.  Each side is stored as a 101-slot array
+indexed by price in cents (slot ``p`` = contracts bid at ``p``¢), so a batch
+of books loads straight into an ``(n_markets, 101)`` NumPy matrix for the
+vectorized queries in ``longshot.analytics.orderbook``.
+
+Writes to: s3://{bucket}/{prefix}/orderbooks/date=YYYY-MM-DD/hour=HH/data.parquet
+"""
+
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from longshot.storage.s3 import _get_fs, _hourly_path, list_hourly_partitions
+from longshot.storage.writer import atomic_open
+
+logger = logging.getLogger(__name__)
+
+PRICE_LEVELS = 101  # 0..100 cents
+
+ORDERBOOK_SCHEMA = pa.schema(
+    [
+        pa.field("ticker", pa.string()),
+        pa.field("snapshot_ts", pa.int64()),
+        pa.field("yes_bids", pa.list_(pa.int64(), PRICE_LEVELS)),
+        pa.field("no_bids", pa.list_(pa.int64(), PRICE_LEVELS)),
+    ]
+)
+
+
+def levels_to_array(levels: list[list[float]] | None) -> np.ndarray:
+    """``[[price, qty], ...]`` → 101-slot quantity array (prices rounded to cents)."""
+    depth = np.zeros(PRICE_LEVELS, dtype=np.int64)
+    if levels:
+        pairs = np.asarray(levels, dtype=np.float64).reshape(-1, 2)
+        prices = np.clip(np.rint(pairs[:, 0]).astype(np.int64), 0, PRICE_LEVELS - 1)
+        np.add.at(depth, prices, pairs[:, 1].astype(np.int64))
+    return depth
+
+
+def books_to_table(tickers: list[str], snapshot_ts: int, yes_bids: np.ndarray, no_bids: np.ndarray) -> pa.Table:
+    """Build an ``ORDERBOOK_SCHEMA`` table from ``(n, 101)`` depth matrices."""
+    n = len(tickers)
+    yes_bids = np.asarray(yes_bids, dtype=np.int64).reshape(n, PRICE_LEVELS)
+    no_bids = np.asarray(no_bids, dtype=np.int64).reshape(n, PRICE_LEVELS)
+    return pa.table(
+        {
+            "ticker": pa.array(tickers, pa.string()),
+            "snapshot_ts": pa.array(np.full(n, snapshot_ts, dtype=np.int64)),
+            "yes_bids": pa.FixedSizeListArray.from_arrays(pa.array(yes_bids.reshape(-1)), PRICE_LEVELS),
+            "no_bids": pa.FixedSizeListArray.from_arrays(pa.array(no_bids.reshape(-1)), PRICE_LEVELS),
+        },
+        schema=ORDERBOOK_SCHEMA,
+    )
+
+
+def depth_matrix(books: pa.Table, side: str) -> np.ndarray:
+    """``(n, 101)`` int64 matrix of the ``yes_bids`` or ``no_bids`` column."""
+    column = books.column(side).combine_chunks()
+    if not pa.types.is_fixed_size_list(column.type):
+        column = column.cast(pa.list_(pa.int64(), PRICE_LEVELS))
+    return column.flatten().to_numpy().reshape(-1, PRICE_LEVELS)
+
+
+def write_orderbooks(books: pa.Table, snapshot_ts: int, *, merge: bool = True) -> str:
+    """Write books into the hour partition of *snapshot_ts*. Returns the S3 path.
+
+    With *merge*, books already in the partition are kept unless *books* has
+    the same ticker, so an ad-hoc ``--ticker`` run does not replace the
+    hour's universe snapshot.
+    """
+    path = _hourly_path("orderbooks", snapshot_ts)
+    fs = _get_fs()
+    if merge and fs.exists(path):
+        with fs.open(path, "rb") as f:
+            existing = pq.read_table(f, schema=ORDERBOOK_SCHEMA)
+        kept = pc.invert(pc.is_in(existing.column("ticker"), value_set=books.column("ticker").combine_chunks()))
+        books = pa.concat_tables([existing.filter(kept), books.cast(ORDERBOOK_SCHEMA)])
+    with atomic_open(path, fs=fs) as f:
+        pq.write_table(books.sort_by("ticker"), f, compression="zstd")
+    logger.info("Wrote %d orderbooks to %s", books.num_rows, path)
+    return path
+
+
+def read_orderbooks(snapshot_ts: int | None = None) -> pa.Table:
+    """Orderbooks of the hour containing *snapshot_ts* (default: the latest hour)."""
+    fs = _get_fs()
+    if snapshot_ts is None:
+        partitions = list_hourly_partitions("orderbooks")
+        if not partitions:
+            return ORDERBOOK_SCHEMA.empty_table()
+        path = partitions[-1][1]
+    else:
+        path = _hourly_path("orderbooks", snapshot_ts)
+        if not fs.exists(path):
+            return ORDERBOOK_SCHEMA.empty_table()
+    with fs.open(path, "rb") as f:
+        return pq.read_table(f, schema=ORDERBOOK_SCHEMA)
@@ -1,18 +1,29 @@
-"""PyArrow + s3fs parquet read/write with Hive-style partitioning."""
+"""PyArrow parquet read/write with Hive-style partitioning.
+
+Paths are rooted at the configured storage backend (S3 by default, or a
+local directory); see ``longshot.storage.backend``.
+"""
 
 from __future__ import annotations
 
+import json
 import logging
+import re
+from collections.abc import Iterable
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING
 
+import numpy as np
 import pyarrow as pa
 import pyarrow.parquet as pq
-import s3fs
 
-from collections.abc import Iterator
+from longshot.api.models import Market, MarketsResponse, Trade
+from longshot.pipeline import StageStats, log_stage_stats, run_pipeline
+from longshot.storage.backend import get_backend
+from longshot.storage.writer import ROW_GROUP_BYTES, BatchingParquetWriter, atomic_open
 
-from longshot.api.models import Market, Trade
-from longshot.config import SETTINGS
+if TYPE_CHECKING:
+    from fsspec import AbstractFileSystem
 
 logger = logging.getLogger(__name__)
 
@@ -69,22 +80,65 @@ TRADES_SCHEMA = pa.schema(
 )
 
 
-def _get_fs() -> s3fs.S3FileSystem:
-    return s3fs.S3FileSystem(
-        key=SETTINGS.aws_access_key_id,
-        secret=SETTINGS.aws_secret_access_key,
-        client_kwargs={"region_name": SETTINGS.aws_region},
-    )
+EVENTS_SCHEMA = pa.schema(
+    [
+        pa.field("event_ticker", pa.string()),
+        pa.field("series_ticker", pa.string()),
+        pa.field("category", pa.string()),
+        pa.field("title", pa.string()),
+        pa.field("sub_title", pa.string()),
+        pa.field("mutually_exclusive", pa.bool_()),
+        pa.field("collateral_return_type", pa.string()),
+        pa.field("strike_date", pa.string()),
+        pa.field("strike_period", pa.string()),
+    ]
+)
+
+# One struct per nested market, same fields as MARKETS_SCHEMA
+MARKET_STRUCT = pa.struct(list(MARKETS_SCHEMA))
+
+# Hourly events pull: event fields + typed nested markets
+DAILY_EVENTS_SCHEMA = EVENTS_SCHEMA.append(pa.field("markets", pa.list_(MARKET_STRUCT)))
+
+
+def _get_fs() -> AbstractFileSystem:
+    return get_backend().fs
 
 
 def _base_path() -> str:
-    return f"s3://{SETTINGS.s3_bucket}/{SETTINGS.s3_prefix}"
+    return get_backend().root
 
 
 def _snapshot_date_str(snapshot_ts: int) -> str:
     return datetime.fromtimestamp(snapshot_ts, tz=timezone.utc).strftime("%Y-%m-%d")
 
 
+_HOURLY_RE = re.compile(r"date=(\d{4}-\d{2}-\d{2})/hour=(\d{2})/")
+
+
+def _hourly_path(prefix: str, hour_ts: int, filename: str = "data.parquet") -> str:
+    dt = datetime.fromtimestamp(hour_ts, tz=timezone.utc)
+    return f"{_base_path()}/{prefix}/date={dt:%Y-%m-%d}/hour={dt:%H}/{filename}"
+
+
+def list_hourly_partitions(prefix: str, filename: str = "data.parquet") -> list[tuple[int, str]]:
+    """Return ``(hour_ts, path)`` for every ``{prefix}/date=*/hour=*`` file, oldest first.
+
+    ``hour_ts`` is the Unix timestamp of the start of the partition hour.
+    """
+    fs = _get_fs()
+    pattern = f"{_base_path()}/{prefix}/date=*/hour=*/{filename}"
+    found = []
+    for key in fs.glob(pattern):
+        match = _HOURLY_RE.search(key)
+        if not match:
+            continue
+        date_str, hour = match.groups()
+        dt = datetime.strptime(f"{date_str} {hour}", "%Y-%m-%d %H").replace(tzinfo=timezone.utc)
+        found.append((int(dt.timestamp()), fs.unstrip_protocol(key)))
+    return sorted(found)
+
+
 def _markets_to_table(markets: list[Market]) -> pa.Table:
     arrays = {
         "ticker": [m.ticker for m in markets],
@@ -125,6 +179,63 @@ def _markets_to_table(markets: list[Market]) -> pa.Table:
     return pa.table(arrays, schema=MARKETS_SCHEMA)
 
 
+def _events_to_table(events: list[dict], *, nested_markets: bool = False) -> pa.Table:
+    """Build an events table from raw API dicts.
+
+    With *nested_markets*, each event's ``markets`` list is validated through
+    ``Market`` and stored as a typed ``list<struct>`` column
+    (``DAILY_EVENTS_SCHEMA``).
+    """
+    arrays = {
+        name: [e.get(name) for e in events] for name in EVENTS_SCHEMA.names
+    }
+    if not nested_markets:
+        return pa.table(arrays, schema=EVENTS_SCHEMA)
+
+    arrays["markets"] = [
+        [Market.model_validate(m).model_dump() for m in e.get("markets") or []]
+        for e in events
+    ]
+    return pa.table(arrays, schema=DAILY_EVENTS_SCHEMA)
+
+
+def _nested_markets(events: pa.Table) -> pa.ChunkedArray:
+    if "markets" in events.column_names:
+        return events.column("markets")
+    # Partitions written before the typed column stored JSON strings
+    legacy = [
+        [Market.model_validate(m).model_dump() for m in json.loads(s or "[]")]
+        for s in events.column("markets_json").to_pylist()
+    ]
+    return pa.chunked_array([pa.array(legacy, type=pa.list_(MARKET_STRUCT))])
+
+
+def explode_event_markets(
+    events: pa.Table,
+    event_columns: tuple[str, ...] = ("category", "mutually_exclusive"),
+) -> pa.Table:
+    """Flatten an events table's nested ``markets`` into one row per market.
+
+    Returns ``MARKETS_SCHEMA`` columns plus the requested *event_columns*
+    (taken from each market's parent event), without any JSON parsing.
+    """
+    clash = set(event_columns) & set(MARKETS_SCHEMA.names)
+    if clash:
+        raise ValueError(f"event_columns clash with market columns: {sorted(clash)}")
+
+    nested = _nested_markets(events).combine_chunks()
+    flat = pa.Table.from_struct_array(nested.flatten())
+    parents = nested.value_parent_indices()
+    for name in event_columns:
+        flat = flat.append_column(name, events.column(name).take(parents))
+    return flat
+
+
+def markets_from_events(events: pa.Table) -> pa.Table:
+    """Derive a ``MARKETS_SCHEMA`` table from an events pull with nested markets."""
+    return explode_event_markets(events, event_columns=()).cast(MARKETS_SCHEMA)
+
+
 # ---------------------------------------------------------------------------
 # Full market universe (all non-MVE markets)
 # ---------------------------------------------------------------------------
@@ -133,29 +244,56 @@ def _all_markets_path() -> str:
     return f"{_base_path()}/markets/all/data.parquet"
 
 
-def stream_all_markets_parquet(
-    pages: Iterator[list[Market]],
-) -> tuple[str, int]:
-    """Stream market pages into a parquet file on S3, one batch per page.
+def _page_to_table(page: list[Market] | dict) -> pa.Table:
+    if isinstance(page, dict):
+        page = MarketsResponse.model_validate(page).markets
+    return _markets_to_table(page)
 
-    Nothing accumulates in memory — each page is written and discarded.
 
-    Returns ``(s3_path, total_written)``.
+def stream_all_markets_parquet(
+    pages: Iterable[list[Market]] | Iterable[dict],
+    *,
+    queue_size: int = 4,
+    row_group_bytes: int = ROW_GROUP_BYTES,
+    compression: str = "zstd",
+    compression_level: int | None = None,
+) -> tuple[str, int, list[StageStats]]:
+    """Stream market pages into a parquet file on S3, batched into large row groups.
+
+    *pages* are either decoded ``Market`` lists or raw ``GET /markets``
+    responses (``iter_market_pages``).  Iterating *pages* (the API fetch),
+    decoding and writing run as a bounded three-stage pipeline, so at most
+    ``~3 * queue_size`` pages are in memory at once.
+
+    Pages are batched into row groups of about *row_group_bytes* (in-memory
+    Arrow size) and compressed with *compression* at *compression_level*.
+
+    Returns ``(s3_path, total_written, stage_stats)``.
     """
     path = _all_markets_path()
     fs = _get_fs()
     total = 0
 
-    with fs.open(path, "wb") as f:
-        writer = pq.ParquetWriter(f, MARKETS_SCHEMA)
-        for page in pages:
-            batch = _markets_to_table(page)
+    with atomic_open(path, fs=fs) as f:
+        writer = BatchingParquetWriter(
+            f,
+            MARKETS_SCHEMA,
+            row_group_bytes=row_group_bytes,
+            compression=compression,
+            compression_level=compression_level,
+        )
+
+        def _write(batch: pa.Table) -> None:
+            nonlocal total
             writer.write_table(batch)
-            total += len(page)
-        writer.close()
+            total += batch.num_rows
+
+        stats = run_pipeline(pages, [("decode", _page_to_table)], _write, maxsize=queue_size)
+        file_stats = writer.close()
 
-    logger.info("Wrote %d markets (full universe, streamed) to %s", total, path)
-    return path, total
+    logger.info("Wrote %d markets (full universe, streamed) to %s: %s", total, path, file_stats)
+    log_stage_stats("stream_all_markets_parquet", stats)
+    return path, total, stats
 
 
 def read_all_markets() -> pa.Table:
@@ -176,13 +314,17 @@ def _snapshot_markets_path(snapshot_date: str) -> str:
 
 def write_markets_parquet(markets: list[Market], snapshot_ts: int) -> str:
     """Write snapshot-filtered markets to S3. Returns the S3 path."""
+    return write_markets_table(_markets_to_table(markets), snapshot_ts)
+
+
+def write_markets_table(table: pa.Table, snapshot_ts: int) -> str:
+    """Write a ``MARKETS_SCHEMA`` table as a snapshot partition. Returns the S3 path."""
     snapshot_date = _snapshot_date_str(snapshot_ts)
     path = _snapshot_markets_path(snapshot_date)
-    table = _markets_to_table(markets)
     fs = _get_fs()
-    with fs.open(path, "wb") as f:
+    with atomic_open(path, fs=fs) as f:
         pq.write_table(table, f)
-    logger.info("Wrote %d markets (snapshot) to %s", len(markets), path)
+    logger.info("Wrote %d markets (snapshot) to %s", table.num_rows, path)
     return path
 
 
@@ -202,10 +344,7 @@ def _trades_path(snapshot_date: str) -> str:
     return f"{_base_path()}/trades/snapshot_date={snapshot_date}/data.parquet"
 
 
-def write_trades_parquet(trades: list[Trade], snapshot_ts: int) -> str:
-    """Write trades list to S3 as parquet. Returns the S3 path."""
-    snapshot_date = _snapshot_date_str(snapshot_ts)
-    path = _trades_path(snapshot_date)
+def _trades_to_table(trades: list[Trade]) -> pa.Table:
     arrays = {
         "trade_id": [t.trade_id for t in trades],
         "ticker": [t.ticker for t in trades],
@@ -216,11 +355,46 @@ def write_trades_parquet(trades: list[Trade], snapshot_ts: int) -> str:
         "created_time": [t.created_time for t in trades],
         "ts": [t.ts for t in trades],
     }
-    table = pa.table(arrays, schema=TRADES_SCHEMA)
+    return pa.table(arrays, schema=TRADES_SCHEMA)
+
+
+def write_trades_parquet(trades: list[Trade], snapshot_ts: int) -> str:
+    """Write trades list to S3 as parquet. Returns the S3 path."""
+    return write_trades_table(_trades_to_table(trades), snapshot_ts)
+
+
+def _dedupe_by(table: pa.Table, key: str) -> pa.Table:
+    """Drop rows repeating an earlier *key* value, keeping the first."""
+    values = table.column(key).to_numpy(zero_copy_only=False)
+    _, first = np.unique(values, return_index=True)
+    if len(first) == table.num_rows:
+        return table
+    logger.info("Dropping %d duplicate %s rows", table.num_rows - len(first), key)
+    return table.take(np.sort(first))
+
+
+def _dedupe_trades(table: pa.Table) -> pa.Table:
+    return _dedupe_by(table, "trade_id")
+
+
+def write_trades_table(table: pa.Table, snapshot_ts: int, *, merge: bool = False) -> str:
+    """Write a ``TRADES_SCHEMA`` table as a snapshot partition. Returns the S3 path.
+
+    Rows are deduplicated by ``trade_id``.  With *merge*, rows already in the
+    partition are kept and only new trade ids are appended (incremental runs
+    landing on the same snapshot date).
+    """
+    snapshot_date = _snapshot_date_str(snapshot_ts)
+    path = _trades_path(snapshot_date)
     fs = _get_fs()
-    with fs.open(path, "wb") as f:
+    if merge and fs.exists(path):
+        with fs.open(path, "rb") as f:
+            existing = pq.read_table(f, schema=TRADES_SCHEMA)
+        table = pa.concat_tables([existing, table.cast(TRADES_SCHEMA)])
+    table = _dedupe_trades(table)
+    with atomic_open(path, fs=fs) as f:
         pq.write_table(table, f)
-    logger.info("Wrote %d trades to %s", len(trades), path)
+    logger.info("Wrote %d trades to %s", table.num_rows, path)
     return path
 
 
@@ -230,3 +404,94 @@ def read_trades(snapshot_date: str) -> pa.Table:
     fs = _get_fs()
     with fs.open(path, "rb") as f:
         return pq.read_table(f)
+
+
+# ---------------------------------------------------------------------------
+# Historical tier + unified (live ∪ historical) readers
+# ---------------------------------------------------------------------------
+#
+# Markets and trades that have aged out of the live API get their own
+# prefixes, so globs over the live datasets (``db.MARKETS_ALL``, a
+# ``trades/snapshot_date=`` partition) never see them twice:
+#
+#   markets/historical/{cutoff}-{part}.parquet
+#   trades/historical/{cutoff}-{part}.parquet
+#
+# Readers below union both tiers and drop duplicates.
+
+def _historical_markets_path(cutoff_ts: int, part: int) -> str:
+    return f"{_base_path()}/markets/historical/{cutoff_ts}-{part:05d}.parquet"
+
+
+def _historical_trades_path(cutoff_ts: int, part: int) -> str:
+    return f"{_base_path()}/trades/historical/{cutoff_ts}-{part:05d}.parquet"
+
+
+def list_historical_markets_parts(cutoff_ts: int | None = None) -> list[str]:
+    """Historical market part files, for one cutoff or (``None``) all of them."""
+    cutoff = "*" if cutoff_ts is None else cutoff_ts
+    return sorted(_get_fs().glob(f"{_base_path()}/markets/historical/{cutoff}-*.parquet"))
+
+
+def list_historical_trades_parts() -> list[str]:
+    """Every historical trade part file (all cutoffs)."""
+    return sorted(_get_fs().glob(f"{_base_path()}/trades/historical/*.parquet"))
+
+
+def next_historical_trades_part(cutoff_ts: int) -> int:
+    """Next unused part number for *cutoff_ts*'s historical trades."""
+    pattern = _historical_trades_path(cutoff_ts, 0).replace("00000", "*")
+    parts = [int(p.rsplit("-", 1)[1].split(".")[0]) for p in _get_fs().glob(pattern)]
+    return max(parts, default=-1) + 1
+
+
+def write_historical_markets_table(table: pa.Table, cutoff_ts: int, part: int) -> str:
+    path = _historical_markets_path(cutoff_ts, part)
+    with atomic_open(path, fs=_get_fs()) as f:
+        pq.write_table(table, f, compression="zstd")
+    logger.info("Wrote %d historical markets to %s", table.num_rows, path)
+    return path
+
+
+def write_historical_trades_table(table: pa.Table, cutoff_ts: int, part: int) -> str:
+    path = _historical_trades_path(cutoff_ts, part)
+    table = _dedupe_trades(table)
+    with atomic_open(path, fs=_get_fs()) as f:
+        pq.write_table(table, f, compression="zstd")
+    logger.info("Wrote %d historical trades to %s", table.num_rows, path)
+    return path
+
+
+def _read_parquet_files(paths: Iterable[str], schema: pa.Schema, filters=None) -> pa.Table:
+    fs = _get_fs()
+    tables = []
+    for path in paths:
+        with fs.open(path, "rb") as f:
+            tables.append(pq.read_table(f, schema=schema, filters=filters))
+    return pa.concat_tables(tables) if tables else schema.empty_table()
+
+
+def read_historical_markets() -> pa.Table:
+    """Markets crawled from the historical tier (all parts)."""
+    return _dedupe_by(_read_parquet_files(list_historical_markets_parts(), MARKETS_SCHEMA), "ticker")
+
+
+def read_markets_unified() -> pa.Table:
+    """Full market universe: the live pull plus every historical part, one row per ticker.
+
+    The live row wins when a ticker is in both tiers.
+    """
+    live = _all_markets_path()
+    paths = ([live] if _get_fs().exists(live) else []) + list_historical_markets_parts()
+    return _dedupe_by(_read_parquet_files(paths, MARKETS_SCHEMA), "ticker")
+
+
+def read_trades_unified(tickers: Iterable[str] | None = None) -> pa.Table:
+    """All trades from every live and historical partition, one row per ``trade_id``.
+
+    *tickers* restricts the result (pushed down into the Parquet reads).
+    """
+    live = sorted(_get_fs().glob(f"{_base_path()}/trades/snapshot_date=*/*.parquet"))
+    paths = live + list_historical_trades_parts()
+    filters = None if tickers is None else [("ticker", "in", list(tickers))]
+    return _dedupe_trades(_read_parquet_files(paths, TRADES_SCHEMA, filters))
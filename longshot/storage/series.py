@@ -0,0 +1,228 @@
+"""Series dimension table: one row per Kalshi series (``GET /series``).
+
+A series groups the recurring events of one contract type (e.g. ``KXHIGHNY``,
+the NYC daily high temperature).  The table is a few thousand rows, so
+readers keep it in memory and, when the dataset lives on S3, mirror it to a
+local file that is trusted only while the stored file's ETag (or size and
+modification time) is unchanged; joins look series up by ``series_ticker``
+in a single vectorized ``index_in`` pass (a broadcast join) instead of going
+through events.
+
+Writes to: s3://{bucket}/{prefix}/series/data.parquet
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from longshot.api.models import Series
+from longshot.storage.backend import get_backend
+from longshot.storage.s3 import _dedupe_by
+from longshot.storage.writer import atomic_open
+
+if TYPE_CHECKING:
+    import duckdb
+
+logger = logging.getLogger(__name__)
+
+SERIES_SCHEMA = pa.schema(
+    [
+        pa.field("series_ticker", pa.string()),
+        pa.field("title", pa.string()),
+        pa.field("category", pa.string()),
+        pa.field("frequency", pa.string()),
+        pa.field("tags", pa.list_(pa.string())),
+        pa.field("settlement_sources", pa.list_(pa.string())),
+        pa.field("contract_url", pa.string()),
+        pa.field("contract_terms_url", pa.string()),
+        pa.field("fee_type", pa.string()),
+        pa.field("fee_multiplier", pa.float64()),
+        pa.field("volume", pa.int64()),
+    ]
+)
+
+# Series columns joined onto markets by default
+JOIN_COLUMNS = ("title", "category", "frequency")
+
+# Local mirror of the table for remote backends
+CACHE_DIR = Path(os.environ.get("LONGSHOT_CACHE_DIR", Path.home() / ".cache" / "longshot"))
+
+# Parquet schema metadata on the mirror: fingerprint of the stored file it copies
+_SOURCE_KEY = b"longshot.series.source"
+
+_memo: dict[str, pa.Table] = {}
+_memo_lock = threading.Lock()
+
+
+def _series_path() -> str:
+    return get_backend().path("series", "data.parquet")
+
+
+def _cache_path(path: str) -> Path:
+    # One mirror per dataset root, so switching backends never serves the wrong table
+    return CACHE_DIR / f"series-{hashlib.sha1(path.encode()).hexdigest()[:12]}.parquet"
+
+
+def series_to_table(series: Sequence[Series]) -> pa.Table:
+    return pa.table(
+        {
+            "series_ticker": [s.ticker for s in series],
+            "title": [s.title for s in series],
+            "category": [s.category for s in series],
+            "frequency": [s.frequency for s in series],
+            "tags": [s.tags for s in series],
+            "settlement_sources": [
+                None if s.settlement_sources is None else [src.name for src in s.settlement_sources if src.name]
+                for s in series
+            ],
+            "contract_url": [s.contract_url for s in series],
+            "contract_terms_url": [s.contract_terms_url for s in series],
+            "fee_type": [s.fee_type for s in series],
+            "fee_multiplier": [s.fee_multiplier for s in series],
+            "volume": [s.volume for s in series],
+        },
+        schema=SERIES_SCHEMA,
+    )
+
+
+def _mirrored() -> bool:
+    return get_backend().name not in ("local", "memory")
+
+
+def _fingerprint(path: str) -> str:
+    """ETag (or size and modification time) of the stored series file."""
+    fs = get_backend().fs
+    fs.invalidate_cache(path)
+    info = fs.info(path)
+    etag = info.get("ETag") or info.get("etag")
+    if etag:
+        return str(etag)
+    return f"{info.get('size')}:{info.get('LastModified') or info.get('mtime') or info.get('created')}"
+
+
+def _write_cache(path: str, table: pa.Table) -> None:
+    if not _mirrored():
+        return
+    cache = _cache_path(path)
+    cache.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache.with_suffix(".tmp")
+    meta = {**(table.schema.metadata or {}), _SOURCE_KEY: _fingerprint(path).encode()}
+    pq.write_table(table.replace_schema_metadata(meta), tmp)
+    os.replace(tmp, cache)
+
+
+def _read_cache(path: str) -> pa.Table | None:
+    """The local mirror, if it copies the stored file as it is now."""
+    cache = _cache_path(path)
+    if not cache.exists():
+        return None
+    source = (pq.read_schema(cache).metadata or {}).get(_SOURCE_KEY)
+    if source is None or source.decode() != _fingerprint(path):
+        logger.info("Series mirror %s is stale; rereading %s", cache, path)
+        return None
+    return pq.read_table(cache, schema=SERIES_SCHEMA)
+
+
+def write_series(table: pa.Table) -> str:
+    """Replace the series table (deduplicated by ``series_ticker``, sorted)."""
+    table = _dedupe_by(table.cast(SERIES_SCHEMA), "series_ticker").sort_by("series_ticker")
+
+    path = _series_path()
+    with atomic_open(path, fs=get_backend().fs) as f:
+        pq.write_table(table, f, compression="zstd")
+    _write_cache(path, table)
+    with _memo_lock:
+        _memo[path] = table
+    logger.info("Wrote %d series to %s", table.num_rows, path)
+    return path
+
+
+def read_series(*, refresh: bool = False) -> pa.Table:
+    """The series table, from memory, the local mirror, or storage (in that order).
+
+    The mirror is used only while it matches the stored file (one metadata
+    request), so a re-ingest on another machine is picked up on the next
+    process start.  ``refresh=True`` also bypasses the in-process copy.
+    Empty if series were never ingested.
+    """
+    path = _series_path()
+    with _memo_lock:
+        if not refresh and path in _memo:
+            return _memo[path]
+
+    fs = get_backend().fs
+    if not fs.exists(path):
+        return SERIES_SCHEMA.empty_table()
+    table = None if refresh or not _mirrored() else _read_cache(path)
+    if table is None:
+        with fs.open(path, "rb") as f:
+            table = pq.read_table(f, schema=SERIES_SCHEMA)
+        _write_cache(path, table)
+
+    with _memo_lock:
+        _memo[path] = table
+    return table
+
+
+def market_series_ticker(markets: pa.Table) -> pa.ChunkedArray:
+    """Series ticker of each market row.
+
+    ``/markets`` rows often leave ``series_ticker`` unset (null or ``""``);
+    it is then the prefix of ``event_ticker`` before the first ``-``.
+    """
+    prefix = pc.list_element(pc.split_pattern(markets.column("event_ticker"), "-", max_splits=1), 0)
+    if "series_ticker" not in markets.column_names:
+        return prefix
+    series = markets.column("series_ticker")
+    # Empty strings count as unset
+    series = pc.if_else(pc.equal(series, ""), pa.scalar(None, series.type), series)
+    return pc.coalesce(series, prefix)
+
+
+def join_series(
+    table: pa.Table,
+    series: pa.Table | None = None,
+    columns: Sequence[str] = JOIN_COLUMNS,
+    *,
+    prefix: str = "series_",
+) -> pa.Table:
+    """Left-join series *columns* onto *table* (markets, events, ...), keeping row order.
+
+    Rows are matched on ``series_ticker`` — resolved with ``market_series_ticker``
+    when *table* has an ``event_ticker`` column.  Joined columns are named
+    ``{prefix}{column}`` and are null for series not in the table.
+    """
+    series = read_series() if series is None else series
+    if "event_ticker" in table.column_names:
+        key = market_series_ticker(table)
+    else:
+        key = table.column("series_ticker")
+    # Row of each key in the (small) series table; null where unknown
+    idx = pc.index_in(key, value_set=series.column("series_ticker").combine_chunks())
+    if "series_ticker" in table.column_names:
+        table = table.set_column(table.schema.get_field_index("series_ticker"), "series_ticker", key)
+    else:
+        table = table.append_column("series_ticker", key)
+    matched = series.select(list(columns)).take(idx)
+    for name in columns:
+        table = table.append_column(f"{prefix}{name}", matched.column(name))
+    return table
+
+
+def register_series(con: duckdb.DuckDBPyConnection, name: str = "series") -> None:
+    """Expose the cached series table to DuckDB as view *name*.
+
+    DuckDB scans the registered Arrow table in place, so it joins as a small
+    in-memory build side rather than a Parquet read per query.
+    """
+    con.register(name, read_series())
@@ -0,0 +1,113 @@
+"""Per-ticker trade watermarks for incremental trade ingestion.
+
+A watermark is the ``max_ts`` of the last *complete* trades fetch for a
+ticker: every trade with ``ts <= watermark`` has already been written.  The
+next fetch for that ticker only asks for ``min_ts = watermark + 1``, so
+trade ingestion cost scales with new trades rather than total history.
+
+Watermarks only advance for tickers whose fetch finished without errors, and
+are persisted by the caller *after* the trades they cover have been written,
+so a failed run is simply refetched from the old watermark next time.
+
+Writes to: s3://{bucket}/{prefix}/watermarks/{name}.parquet (``trades`` for
+the live tier, ``historical_trades`` for the historical tier)
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from longshot.storage.s3 import _base_path, _get_fs
+from longshot.storage.writer import atomic_open
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_SCHEMA = pa.schema([
+    pa.field("ticker", pa.string(), nullable=False),
+    pa.field("max_ts", pa.int64(), nullable=False),
+    pa.field("updated_at", pa.int64(), nullable=False),
+])
+
+
+def _watermarks_path(name: str) -> str:
+    return f"{_base_path()}/watermarks/{name}.parquet"
+
+
+class TradeWatermarks:
+    """In-memory ticker → watermark map backed by a single Parquet file."""
+
+    def __init__(
+        self,
+        watermarks: dict[str, int] | None = None,
+        updated_at: dict[str, int] | None = None,
+        *,
+        name: str = "trades",
+    ) -> None:
+        self.name = name
+        self._max_ts = dict(watermarks or {})
+        self._updated_at = dict(updated_at or {})
+
+    def __len__(self) -> int:
+        return len(self._max_ts)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._max_ts
+
+    def get(self, ticker: str) -> int | None:
+        return self._max_ts.get(ticker)
+
+    def min_ts(self, ticker: str, default: int | None = None) -> int | None:
+        """Return the ``min_ts`` to request for *ticker* (``default`` if unseen)."""
+        mark = self._max_ts.get(ticker)
+        if mark is None:
+            return default
+        return mark + 1 if default is None else max(mark + 1, default)
+
+    def advance(self, ticker: str, max_ts: int) -> None:
+        """Record a complete fetch of *ticker* up to *max_ts*; never moves backwards."""
+        if max_ts > self._max_ts.get(ticker, max_ts - 1):
+            self._max_ts[ticker] = max_ts
+            self._updated_at[ticker] = int(time.time())
+
+    @classmethod
+    def load(cls, name: str = "trades") -> TradeWatermarks:
+        """Read the *name* watermark file; empty if none has been written yet."""
+        path = _watermarks_path(name)
+        fs = _get_fs()
+        if not fs.exists(path):
+            return cls(name=name)
+        with fs.open(path, "rb") as f:
+            table = pq.read_table(f)
+        tickers = table.column("ticker").to_pylist()
+        marks = cls(
+            dict(zip(tickers, table.column("max_ts").to_pylist())),
+            dict(zip(tickers, table.column("updated_at").to_pylist())),
+            name=name,
+        )
+        logger.info("Loaded %d trade watermarks from %s", len(marks), path)
+        return marks
+
+    def to_table(self) -> pa.Table:
+        tickers = sorted(self._max_ts)
+        return pa.table(
+            {
+                "ticker": tickers,
+                "max_ts": [self._max_ts[t] for t in tickers],
+                "updated_at": [self._updated_at.get(t, 0) for t in tickers],
+            },
+            schema=WATERMARK_SCHEMA,
+        )
+
+    def save(self) -> str:
+        """Write all watermarks (sorted by ticker). Returns the path."""
+        path = _watermarks_path(self.name)
+        fs = _get_fs()
+        table = self.to_table()
+        with atomic_open(path, fs=fs) as f:
+            pq.write_table(table, f, compression="zstd")
+        logger.info("Wrote %d trade watermarks to %s", table.num_rows, path)
+        return path
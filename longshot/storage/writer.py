@@ -0,0 +1,256 @@
+"""Atomic object writes and batched Parquet writing for the storage backends.
+
+A file opened with ``atomic_open`` becomes visible at its final path only
+when the ``with`` block exits cleanly; on error nothing is left behind and a
+previous object at that path is untouched.
+
+- S3: bytes are buffered into parts that are uploaded concurrently as one
+  multipart upload to the final key.  S3 exposes the object only on
+  ``CompleteMultipartUpload``, which is the commit; on error the upload is
+  aborted.  Files smaller than one part are sent with a single PUT.
+- Other filesystems (local, memory): written to a hidden temporary sibling
+  and renamed into place.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import posixpath
+import threading
+import uuid
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, BinaryIO
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from longshot.storage.backend import get_backend
+
+if TYPE_CHECKING:
+    from fsspec import AbstractFileSystem
+
+logger = logging.getLogger(__name__)
+
+# S3 requires parts of at least 5 MiB (except the last)
+MIN_PART_SIZE = 5 * 1024 * 1024
+PART_SIZE = 16 * 1024 * 1024
+MAX_CONCURRENCY = 8
+
+# In-memory (Arrow) bytes buffered per row group by BatchingParquetWriter
+ROW_GROUP_BYTES = 128 * 1024 * 1024
+
+
+def _is_s3(fs: AbstractFileSystem) -> bool:
+    protocol = fs.protocol if isinstance(fs.protocol, tuple) else (fs.protocol,)
+    return "s3" in protocol
+
+
+class _S3MultipartWriter(io.RawIOBase):
+    """Write-only file that uploads full parts in the background.
+
+    At most *max_concurrency* parts are buffered or in flight at once;
+    ``write`` blocks when that limit is reached.
+    """
+
+    mode = "wb"
+
+    def __init__(self, fs: AbstractFileSystem, path: str, part_size: int, max_concurrency: int) -> None:
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(f"part_size must be at least {MIN_PART_SIZE} bytes, got {part_size}")
+        self._fs = fs
+        self._path = path
+        self._bucket, self._key, _ = fs.split_path(path)
+        self._part_size = part_size
+        self._buffer = bytearray()
+        self._position = 0
+        self._upload_id: str | None = None
+        self._parts: list[Future] = []
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="s3-part")
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def write(self, data) -> int:
+        view = memoryview(data).cast("B")
+        self._buffer += view
+        self._position += len(view)
+        while len(self._buffer) >= self._part_size:
+            self._submit(bytes(self._buffer[: self._part_size]))
+            del self._buffer[: self._part_size]
+        return len(view)
+
+    def _submit(self, body: bytes) -> None:
+        # Fail fast instead of buffering the rest of the file after a bad part
+        for done in self._parts:
+            if done.done() and done.exception() is not None:
+                raise done.exception()
+        if self._upload_id is None:
+            resp = self._fs.call_s3("create_multipart_upload", Bucket=self._bucket, Key=self._key)
+            self._upload_id = resp["UploadId"]
+        self._slots.acquire()
+        future = self._pool.submit(self._upload_part, len(self._parts) + 1, body)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._parts.append(future)
+
+    def _upload_part(self, number: int, body: bytes) -> dict:
+        resp = self._fs.call_s3(
+            "upload_part",
+            Bucket=self._bucket, Key=self._key, UploadId=self._upload_id,
+            PartNumber=number, Body=body,
+        )
+        return {"PartNumber": number, "ETag": resp["ETag"]}
+
+    def commit(self) -> None:
+        try:
+            if self._upload_id is None:
+                self._fs.pipe_file(self._path, bytes(self._buffer))
+            else:
+                if self._buffer:
+                    self._submit(bytes(self._buffer))
+                parts = [f.result() for f in self._parts]
+                self._fs.call_s3(
+                    "complete_multipart_upload",
+                    Bucket=self._bucket, Key=self._key, UploadId=self._upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+            self._fs.invalidate_cache(self._path)
+        finally:
+            self._pool.shutdown(wait=True)
+            self._buffer.clear()
+        logger.debug("Committed %s (%d bytes, %d parts)", self._path, self._position, len(self._parts))
+
+    def abort(self) -> None:
+        for future in self._parts:
+            future.cancel()
+        self._pool.shutdown(wait=True)
+        self._buffer.clear()
+        if self._upload_id is not None:
+            self._fs.call_s3(
+                "abort_multipart_upload",
+                Bucket=self._bucket, Key=self._key, UploadId=self._upload_id,
+            )
+        logger.warning("Aborted write to %s", self._path)
+
+
+@contextmanager
+def atomic_open(
+    path: str,
+    *,
+    fs: AbstractFileSystem | None = None,
+    part_size: int = PART_SIZE,
+    max_concurrency: int = MAX_CONCURRENCY,
+) -> Iterator[BinaryIO]:
+    """Open *path* for binary writing; the object is committed on clean exit.
+
+    *part_size* and *max_concurrency* apply to S3 multipart uploads only.
+    """
+    fs = fs or get_backend().fs
+
+    if _is_s3(fs):
+        writer = _S3MultipartWriter(fs, path, part_size, max_concurrency)
+        try:
+            yield writer  # type: ignore[misc]
+            writer.commit()
+        except BaseException:
+            writer.abort()
+            raise
+        return
+
+    parent, name = posixpath.split(path)
+    tmp = f"{parent}/.{name}.{uuid.uuid4().hex[:12]}.tmp"
+    try:
+        with fs.open(tmp, "wb") as f:
+            yield f
+        fs.mv(tmp, path)
+    except BaseException:
+        if fs.exists(tmp):
+            fs.rm(tmp)
+        raise
+
+
+# ---------------------------------------------------------------------------
+# Batched Parquet writer
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class ParquetFileStats:
+    rows: int
+    row_groups: int
+    file_bytes: int
+    uncompressed_bytes: int
+    compression: str
+
+    def __str__(self) -> str:
+        ratio = self.uncompressed_bytes / self.file_bytes if self.file_bytes else 0.0
+        return (
+            f"{self.rows:,} rows in {self.row_groups} row group(s), "
+            f"{self.file_bytes / 1024 / 1024:.1f} MB on disk ({self.compression}, {ratio:.1f}x)"
+        )
+
+
+class BatchingParquetWriter:
+    """``pq.ParquetWriter`` that buffers small tables into large row groups.
+
+    Tables passed to ``write_table`` are held until their in-memory size
+    reaches *row_group_bytes*, then written as a single row group, so
+    page-at-a-time producers don't leave hundreds of tiny row groups.
+    ``close`` returns the final ``ParquetFileStats``.
+    """
+
+    def __init__(
+        self,
+        sink: BinaryIO,
+        schema: pa.Schema,
+        *,
+        row_group_bytes: int = ROW_GROUP_BYTES,
+        compression: str = "zstd",
+        compression_level: int | None = None,
+    ) -> None:
+        self._sink = sink
+        self._metadata: list[pq.FileMetaData] = []
+        self._writer = pq.ParquetWriter(
+            sink,
+            schema,
+            compression=compression,
+            compression_level=compression_level,
+            metadata_collector=self._metadata,
+        )
+        self._row_group_bytes = row_group_bytes
+        self._compression = compression
+        self._pending: list[pa.Table] = []
+        self._pending_bytes = 0
+
+    def write_table(self, table: pa.Table) -> None:
+        self._pending.append(table)
+        self._pending_bytes += table.nbytes
+        if self._pending_bytes >= self._row_group_bytes:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write everything buffered as one row group."""
+        if not self._pending:
+            return
+        table = pa.concat_tables(self._pending).combine_chunks()
+        self._writer.write_table(table, row_group_size=max(table.num_rows, 1))
+        self._pending.clear()
+        self._pending_bytes = 0
+
+    def close(self) -> ParquetFileStats:
+        self.flush()
+        self._writer.close()
+        meta = self._metadata[0]
+        return ParquetFileStats(
+            rows=meta.num_rows,
+            row_groups=meta.num_row_groups,
+            file_bytes=self._sink.tell(),
+            uncompressed_bytes=sum(meta.row_group(i).total_byte_size for i in range(meta.num_row_groups)),
+            compression=self._compression,
+        )
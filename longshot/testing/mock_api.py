@@ -0,0 +1,618 @@
+"""Local stand-in for the Kalshi trade API, for offline benchmarks and tests.
+
+Serves ``GET /markets``, ``GET /events`` and ``GET /markets/trades`` over a
+deterministic synthetic universe, with cursor pagination, configurable
+per-request latency and injected ``429 Too Many Requests`` responses.  With
+``historical_cutoff_ts`` set it also models the live/historical split:
+markets settled before the cutoff and trades before it move from the live
+routes to ``GET /historical/markets`` and ``GET /historical/trades``.
+Candlesticks (live and historical) are aggregated from the synthetic trades,
+``GET /markets/{ticker}/orderbook`` serves a synthetic book around each
+market's bid/ask, and ``GET /series`` lists the series (unpaged, as live).
+
+The same ``MockKalshiAPI`` object can be used in-process or over HTTP:
+
+    api = MockKalshiAPI(MockConfig(n_events=20_000, latency_s=0.03))
+    client = KalshiClient(base_url=MOCK_BASE_URL, transport=api.transport(), auth=False)
+
+    # or as an ASGI app (needs uvicorn):
+    uv run python -m longshot.testing.mock_api --port 8765 --latency-ms 30
+    client = KalshiClient(base_url="http://127.0.0.1:8765/trade-api/v2", auth=False)
+
+Rows are generated per page from a handful of numpy arrays, so universes of
+a million markets cost a few tens of MB.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass
+from urllib.parse import parse_qsl
+
+import httpx
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX = "/trade-api/v2"
+MOCK_BASE_URL = f"http://mock.kalshi.local{API_PREFIX}"
+
+# Page size caps of the live API
+MAX_LIMIT = {
+    "/markets": 1000, "/events": 200, "/markets/trades": 1000,
+    "/historical/markets": 1000, "/historical/trades": 1000, "/historical/cutoff": 0,
+    "/series": 0,
+}
+
+# Candlestick routes (path parameters); Kalshi caps a request at 5000 periods
+_CANDLES_ROUTE = re.compile(r"^/(series/[^/]+|historical)/markets/([^/]+)/candlesticks$")
+MAX_CANDLES = 5000
+_ORDERBOOK_ROUTE = re.compile(r"^/markets/([^/]+)/orderbook$")
+
+CATEGORIES = (
+    "Politics", "Economics", "Financials", "Climate and Weather", "Sports",
+    "Entertainment", "Science and Technology", "Companies", "World", "Health",
+)
+
+
+@dataclass(frozen=True)
+class MockConfig:
+    """Size and behaviour of the mock API.
+
+    Parameters
+    ----------
+    n_events:
+        Number of events in the universe.
+    markets_per_event:
+        Mean markets per event (uniform on ``1 .. 2 * mean - 1``).
+    trades_per_market:
+        Mean trades per market (Poisson).
+    latency_s, latency_jitter_s:
+        Delay added to every response, plus a uniform random extra.
+    error_rate:
+        Fraction of requests answered with 429 regardless of load.
+    rate_limit:
+        Requests/second the server accepts before answering 429 (token
+        bucket with one second of burst); ``None`` disables it.
+    now_ts:
+        Reference "now" used to decide which markets are open; fixed so the
+        universe is identical across runs.
+    historical_cutoff_ts:
+        Live/historical split point; ``None`` serves everything from the
+        live routes and leaves the historical ones empty.
+    """
+
+    n_events: int = 20_000
+    markets_per_event: int = 5
+    trades_per_market: int = 40
+    seed: int = 0
+    latency_s: float = 0.0
+    latency_jitter_s: float = 0.0
+    error_rate: float = 0.0
+    rate_limit: float | None = None
+    now_ts: int = 1_767_225_600  # 2026-01-01T00:00:00Z
+    historical_cutoff_ts: int | None = None
+
+
+def _iso(ts: np.ndarray) -> list[str]:
+    return [s + "Z" for s in np.datetime_as_string(ts.astype("datetime64[s]"), unit="s")]
+
+
+class SyntheticUniverse:
+    """Deterministic series → events → markets → trades hierarchy."""
+
+    def __init__(self, config: MockConfig) -> None:
+        self.config = config
+        rng = np.random.default_rng(config.seed)
+        n_events = config.n_events
+        now = config.now_ts
+
+        n_series = max(1, n_events // 20)
+        self.event_series = rng.integers(0, n_series, n_events)
+        self.series_category = rng.integers(0, len(CATEGORIES), n_series)
+        self.event_exclusive = rng.random(n_events) < 0.6
+
+        # Markets of an event share its open/close times
+        per_event = rng.integers(1, max(2, 2 * config.markets_per_event), n_events)
+        self.event_offsets = np.concatenate([[0], np.cumsum(per_event)])
+        self.market_event = np.repeat(np.arange(n_events), per_event)
+        self.market_pos = np.arange(len(self.market_event)) - self.event_offsets[self.market_event]
+        n_markets = len(self.market_event)
+
+        event_open = now - rng.integers(3600, 365 * 86_400, n_events)
+        event_close = event_open + rng.integers(3600, 400 * 86_400, n_events)
+        self.event_close = event_close
+        self.open_ts = event_open[self.market_event]
+        self.close_ts = event_close[self.market_event]
+        self.created_ts = self.open_ts - rng.integers(0, 7 * 86_400, n_markets)
+
+        self.yes_bid = rng.integers(0, 98, n_markets)
+        self.spread = rng.integers(1, 4, n_markets)
+        self.last_price = np.clip(self.yes_bid + rng.integers(0, 3, n_markets), 1, 99)
+        self.volume = rng.lognormal(6.0, 2.0, n_markets).astype(np.int64)
+        self.open_interest = (self.volume * rng.random(n_markets)).astype(np.int64)
+        self.result_yes = rng.random(n_markets) < self.last_price / 100
+
+        self.trade_counts = rng.poisson(config.trades_per_market, n_markets)
+
+    # -- identifiers --------------------------------------------------------
+
+    @property
+    def n_markets(self) -> int:
+        return len(self.market_event)
+
+    def series_ticker(self, s: int) -> str:
+        return f"KXMOCK{s:05d}"
+
+    def event_ticker(self, e: int) -> str:
+        return f"{self.series_ticker(int(self.event_series[e]))}-E{e:07d}"
+
+    def market_ticker(self, m: int) -> str:
+        return f"{self.event_ticker(int(self.market_event[m]))}-M{int(self.market_pos[m])}"
+
+    def parse_market_ticker(self, ticker: str) -> int | None:
+        try:
+            _, event_part, market_part = ticker.rsplit("-", 2)
+            e, pos = int(event_part[1:]), int(market_part[1:])
+        except ValueError:
+            return None
+        if not 0 <= e < self.config.n_events:
+            return None
+        m = int(self.event_offsets[e]) + pos
+        return m if pos >= 0 and m < self.event_offsets[e + 1] else None
+
+    def parse_series_ticker(self, ticker: str) -> int:
+        try:
+            return int(ticker.removeprefix("KXMOCK"))
+        except ValueError:
+            return -1
+
+    def parse_event_ticker(self, ticker: str) -> int | None:
+        try:
+            e = int(ticker.rsplit("-", 1)[1][1:])
+        except (IndexError, ValueError):
+            return None
+        return e if 0 <= e < self.config.n_events else None
+
+    # -- rows ---------------------------------------------------------------
+
+    def status(self, m: np.ndarray) -> np.ndarray:
+        return np.where(self.close_ts[m] > self.config.now_ts, "active", "finalized")
+
+    def markets(self, idx: np.ndarray) -> list[dict]:
+        """Market dicts (live API field names, prices in cents) for *idx*."""
+        if len(idx) == 0:
+            return []
+        open_iso, close_iso = _iso(self.open_ts[idx]), _iso(self.close_ts[idx])
+        created_iso = _iso(self.created_ts[idx])
+        status = self.status(idx)
+        rows = []
+        for k, m in enumerate(idx.tolist()):
+            e = int(self.market_event[m])
+            bid = int(self.yes_bid[m])
+            ask = min(99, bid + int(self.spread[m]))
+            settled = status[k] == "finalized"
+            result = ("yes" if self.result_yes[m] else "no") if settled else ""
+            rows.append({
+                "ticker": self.market_ticker(m),
+                "event_ticker": self.event_ticker(e),
+                "market_type": "binary",
+                "title": f"Mock market {m}",
+                "subtitle": "",
+                "yes_sub_title": f"Outcome {int(self.market_pos[m])}",
+                "no_sub_title": f"Outcome {int(self.market_pos[m])}",
+                "status": str(status[k]),
+                "yes_bid": bid,
+                "yes_ask": ask,
+                "no_bid": 100 - ask,
+                "no_ask": 100 - bid,
+                "last_price": int(self.last_price[m]),
+                "previous_yes_bid": bid,
+                "previous_yes_ask": ask,
+                "previous_price": int(self.last_price[m]),
+                "volume": int(self.volume[m]),
+                "volume_24h": int(self.volume[m]) // 30,
+                "open_interest": int(self.open_interest[m]),
+                "notional_value": 100,
+                "open_time": open_iso[k],
+                "close_time": close_iso[k],
+                "expiration_time": close_iso[k],
+                "expected_expiration_time": close_iso[k],
+                "latest_expiration_time": close_iso[k],
+                "created_time": created_iso[k],
+                "updated_time": close_iso[k] if settled else open_iso[k],
+                "result": result,
+                "settlement_value": (100 if result == "yes" else 0) if settled else None,
+                "can_close_early": True,
+                "strike_type": "custom",
+                "rules_primary": "Resolves per the mock rulebook.",
+                "rules_secondary": "",
+            })
+        return rows
+
+    def series(self, idx: np.ndarray) -> list[dict]:
+        return [
+            {
+                "ticker": self.series_ticker(s),
+                "title": f"Mock series {s}",
+                "category": CATEGORIES[int(self.series_category[s])],
+                "frequency": "daily" if s % 2 else "weekly",
+                "tags": [],
+                "settlement_sources": [{"name": "Mock Source", "url": "https://example.com"}],
+                "contract_url": "",
+                "fee_type": "quadratic",
+                "fee_multiplier": 1.0,
+            }
+            for s in idx.tolist()
+        ]
+
+    def events(self, idx: np.ndarray, *, nested: bool) -> list[dict]:
+        rows = []
+        for e in idx.tolist():
+            s = int(self.event_series[e])
+            row = {
+                "event_ticker": self.event_ticker(e),
+                "series_ticker": self.series_ticker(s),
+                "category": CATEGORIES[int(self.series_category[s])],
+                "title": f"Mock event {e}",
+                "sub_title": "",
+                "mutually_exclusive": bool(self.event_exclusive[e]),
+                "collateral_return_type": "MECNET" if self.event_exclusive[e] else "",
+                "strike_date": _iso(self.event_close[e:e + 1])[0],
+                "strike_period": "",
+            }
+            if nested:
+                row["markets"] = self.markets(np.arange(self.event_offsets[e], self.event_offsets[e + 1]))
+            rows.append(row)
+        return rows
+
+    def trades(self, m: int) -> tuple[np.ndarray, list[dict]]:
+        """All trades of market *m*, newest first, with their ``ts`` array."""
+        n = int(self.trade_counts[m])
+        if n == 0:
+            return np.empty(0, dtype=np.int64), []
+        rng = np.random.default_rng([self.config.seed, m])
+        end = min(int(self.close_ts[m]), self.config.now_ts)
+        ts = np.sort(rng.integers(int(self.open_ts[m]), max(end, int(self.open_ts[m]) + 1), n))[::-1]
+        drift = np.cumsum(rng.integers(-2, 3, n))[::-1]
+        price = np.clip(int(self.last_price[m]) + drift - drift[0], 1, 99)
+        count = rng.geometric(0.05, n)
+        taker_yes = rng.random(n) < 0.5
+        iso = _iso(ts)
+        ticker = self.market_ticker(m)
+        rows = [
+            {
+                "trade_id": f"{m:08x}-{j:06x}",
+                "ticker": ticker,
+                "count": int(count[j]),
+                "yes_price": int(price[j]),
+                "no_price": 100 - int(price[j]),
+                "taker_side": "yes" if taker_yes[j] else "no",
+                "created_time": iso[j],
+            }
+            for j in range(n)
+        ]
+        return ts, rows
+
+
+# ---------------------------------------------------------------------------
+# Request handling
+# ---------------------------------------------------------------------------
+
+def _int(params: Mapping[str, str], key: str) -> int | None:
+    val = params.get(key)
+    return int(val) if val not in (None, "") else None
+
+
+def _page(idx: np.ndarray, params: Mapping[str, str], route: str) -> tuple[np.ndarray, str]:
+    """Slice *idx* by ``cursor``/``limit``; cursors are opaque row offsets."""
+    limit = min(_int(params, "limit") or 100, MAX_LIMIT[route])
+    offset = int(params.get("cursor") or 0)
+    end = offset + limit
+    return idx[offset:end], (str(end) if end < len(idx) else "")
+
+
+class MockKalshiAPI:
+    """Request handler over a ``SyntheticUniverse``.
+
+    ``stats`` counts requests per route plus ``"429"`` responses and is safe
+    to read while worker threads are using the transport.
+    """
+
+    def __init__(self, config: MockConfig | None = None) -> None:
+        self.config = config or MockConfig()
+        self.universe = SyntheticUniverse(self.config)
+        self.stats: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)
+        self._tokens = self.config.rate_limit or 0.0
+        self._last_refill = time.monotonic()
+        logger.info(
+            "Mock API: %d events, %d markets, %d trades",
+            self.config.n_events, self.universe.n_markets, int(self.universe.trade_counts.sum()),
+        )
+
+    def _throttled(self) -> bool:
+        with self._lock:
+            if self.config.error_rate and self._rng.random() < self.config.error_rate:
+                return True
+            if self.config.rate_limit is None:
+                return False
+            now = time.monotonic()
+            self._tokens = min(
+                self.config.rate_limit,
+                self._tokens + (now - self._last_refill) * self.config.rate_limit,
+            )
+            self._last_refill = now
+            if self._tokens < 1.0:
+                return True
+            self._tokens -= 1.0
+            return False
+
+    def delay(self) -> float:
+        """Latency to apply to the next response, in seconds."""
+        jitter = self.config.latency_jitter_s
+        with self._lock:
+            extra = self._rng.uniform(0, jitter) if jitter else 0.0
+        return self.config.latency_s + extra
+
+    def handle(self, method: str, path: str, params: Mapping[str, str]) -> tuple[int, dict]:
+        """Route one request. Returns ``(status_code, json_body)``."""
+        route = path.removeprefix(API_PREFIX).rstrip("/") or "/"
+        candles = _CANDLES_ROUTE.match(route)
+        orderbook = _ORDERBOOK_ROUTE.match(route)
+        if candles:
+            route = "/historical/candlesticks" if candles[1] == "historical" else "/candlesticks"
+        elif orderbook:
+            route = "/orderbook"
+        with self._lock:
+            self.stats[route] += 1
+        if method != "GET" or (route not in MAX_LIMIT and not candles and not orderbook):
+            return 404, {"error": {"code": "not_found", "message": f"{method} {path}"}}
+        if self._throttled():
+            with self._lock:
+                self.stats["429"] += 1
+            return 429, {"error": {"code": "too_many_requests", "message": "rate limit exceeded"}}
+        try:
+            if route == "/markets":
+                return 200, self._markets(params)
+            if route == "/events":
+                return 200, self._events(params)
+            if route == "/series":
+                return 200, self._series(params)
+            if route == "/historical/markets":
+                return 200, self._markets(params, historical=True)
+            if route == "/historical/cutoff":
+                cutoff = self.config.historical_cutoff_ts or 0
+                return 200, {"market_settled_ts": cutoff, "trades_created_ts": cutoff, "orders_updated_ts": cutoff}
+            if candles:
+                return 200, self._candles(candles[2], params, historical=candles[1] == "historical")
+            if orderbook:
+                return self._orderbook(orderbook[1], params)
+            return self._trades(params, historical=route == "/historical/trades")
+        except ValueError as exc:
+            return 400, {"error": {"code": "bad_request", "message": str(exc)}}
+
+    def _markets(self, params: Mapping[str, str], historical: bool = False) -> dict:
+        u = self.universe
+        mask = np.ones(u.n_markets, dtype=bool)
+        if (cutoff := self.config.historical_cutoff_ts) is not None:
+            archived = u.close_ts < cutoff
+            mask &= archived if historical else ~archived
+        elif historical:
+            mask[:] = False
+        if params.get("mve_filter") == "only":
+            mask[:] = False  # the synthetic universe has no multivariate markets
+        if (min_close := _int(params, "min_close_ts")) is not None:
+            mask &= u.close_ts > min_close
+        if (max_close := _int(params, "max_close_ts")) is not None:
+            mask &= u.close_ts < max_close
+        if status := params.get("status"):
+            want = {"open": "active", "closed": "finalized", "settled": "finalized"}.get(status, status)
+            mask &= u.status(np.arange(u.n_markets)) == want
+        if event_ticker := params.get("event_ticker"):
+            e = u.parse_event_ticker(event_ticker)
+            mask &= u.market_event == (-1 if e is None else e)
+        if series_ticker := params.get("series_ticker"):
+            mask &= u.event_series[u.market_event] == u.parse_series_ticker(series_ticker)
+        idx, cursor = _page(np.flatnonzero(mask), params, "/historical/markets" if historical else "/markets")
+        return {"markets": u.markets(idx), "cursor": cursor}
+
+    def _events(self, params: Mapping[str, str]) -> dict:
+        u = self.universe
+        mask = np.ones(self.config.n_events, dtype=bool)
+        if (min_close := _int(params, "min_close_ts")) is not None:
+            mask &= u.event_close > min_close
+        if status := params.get("status"):
+            is_open = u.event_close > self.config.now_ts
+            mask &= is_open if status == "open" else ~is_open
+        if series_ticker := params.get("series_ticker"):
+            mask &= u.event_series == u.parse_series_ticker(series_ticker)
+        idx, cursor = _page(np.flatnonzero(mask), params, "/events")
+        nested = params.get("with_nested_markets", "").lower() == "true"
+        return {"events": u.events(idx, nested=nested), "cursor": cursor}
+
+    def _series(self, params: Mapping[str, str]) -> dict:
+        u = self.universe
+        idx = np.arange(len(u.series_category))
+        if category := params.get("category"):
+            idx = idx[np.asarray(CATEGORIES)[u.series_category] == category]
+        return {"series": u.series(idx)}
+
+    def _trades(self, params: Mapping[str, str], historical: bool = False) -> tuple[int, dict]:
+        u = self.universe
+        ticker = params.get("ticker")
+        if not ticker:
+            raise ValueError("the mock API only serves per-ticker trades; pass ticker=")
+        m = u.parse_market_ticker(ticker)
+        if m is None:
+            return 200, {"trades": [], "cursor": ""}
+        ts, rows = u.trades(m)
+        mask = np.ones(len(ts), dtype=bool)
+        if (cutoff := self.config.historical_cutoff_ts) is not None:
+            mask &= (ts < cutoff) if historical else (ts >= cutoff)
+        elif historical:
+            mask[:] = False
+        if (min_ts := _int(params, "min_ts")) is not None:
+            mask &= ts >= min_ts
+        if (max_ts := _int(params, "max_ts")) is not None:
+            mask &= ts <= max_ts
+        idx, cursor = _page(np.flatnonzero(mask), params, "/historical/trades" if historical else "/markets/trades")
+        return 200, {"trades": [rows[i] for i in idx.tolist()], "cursor": cursor}
+
+    def _candles(self, ticker: str, params: Mapping[str, str], historical: bool) -> dict:
+        u = self.universe
+        start, end, minutes = _int(params, "start_ts"), _int(params, "end_ts"), _int(params, "period_interval")
+        if start is None or end is None or minutes not in (1, 60, 1440):
+            raise ValueError("start_ts, end_ts and period_interval (1, 60 or 1440) are required")
+        period = minutes * 60
+        if (end - start) // period + 1 > MAX_CANDLES:
+            raise ValueError(f"range covers more than {MAX_CANDLES} periods")
+        m = u.parse_market_ticker(ticker)
+        cutoff = self.config.historical_cutoff_ts
+        archived = m is not None and cutoff is not None and u.close_ts[m] < cutoff
+        if m is None or archived != historical:
+            return {"ticker": ticker, "candlesticks": []}
+
+        ts, rows = u.trades(m)
+        if len(ts) == 0:
+            return {"ticker": ticker, "candlesticks": []}
+        # Chronological; a trade at t falls in the period ending at ceil(t / period)
+        ts = ts[::-1]
+        price = np.array([r["yes_price"] for r in reversed(rows)], dtype=np.float64)
+        count = np.array([r["count"] for r in reversed(rows)], dtype=np.int64)
+        period_end = -(-ts // period) * period
+        ends, first = np.unique(period_end, return_index=True)
+        last = np.append(first[1:], len(ts)) - 1
+        volume = np.add.reduceat(count, first)
+        mean = np.add.reduceat(price * count, first) / volume
+        high, low = np.maximum.reduceat(price, first), np.minimum.reduceat(price, first)
+        open_interest = np.cumsum(volume)
+        close = price[last]
+        previous = np.concatenate([[np.nan], close[:-1]])
+        spread = float(u.spread[m])
+        out = []
+        for j in np.flatnonzero((ends >= start) & (ends <= end)).tolist():
+            o, h, lo, c = float(price[first[j]]), float(high[j]), float(low[j]), float(close[j])
+            out.append({
+                "end_period_ts": int(ends[j]),
+                "price": {
+                    "open": o, "high": h, "low": lo, "close": c,
+                    "mean": round(float(mean[j]), 2),
+                    "previous": None if np.isnan(previous[j]) else float(previous[j]),
+                },
+                "yes_bid": {k: max(v - spread, 0.0) for k, v in (("open", o), ("high", h), ("low", lo), ("close", c))},
+                "yes_ask": {k: min(v + spread, 100.0) for k, v in (("open", o), ("high", h), ("low", lo), ("close", c))},
+                "volume": int(volume[j]),
+                "open_interest": int(open_interest[j]),
+            })
+        return {"ticker": ticker, "candlesticks": out}
+
+    def _orderbook(self, ticker: str, params: Mapping[str, str]) -> tuple[int, dict]:
+        u = self.universe
+        m = u.parse_market_ticker(ticker)
+        if m is None:
+            return 404, {"error": {"code": "not_found", "message": f"market {ticker} not found"}}
+        if u.close_ts[m] <= self.config.now_ts:
+            return 200, {"orderbook": {"yes": None, "no": None}}
+        rng = np.random.default_rng([self.config.seed, m, 1])
+        depth = _int(params, "depth") or 100
+        bid = int(u.yes_bid[m])
+        ask = min(99, bid + int(u.spread[m]))
+        # Bids thin out geometrically away from the touch, ascending by price
+        yes = [[p, int(q)] for p, q in zip(range(bid, 0, -1), rng.geometric(0.02, bid))][:depth][::-1]
+        no_top = 100 - ask
+        no = [[p, int(q)] for p, q in zip(range(no_top, 0, -1), rng.geometric(0.02, no_top))][:depth][::-1]
+        return 200, {"orderbook": {"yes": yes or None, "no": no or None}}
+
+    # -- adapters -----------------------------------------------------------
+
+    def transport(self) -> httpx.MockTransport:
+        """In-process ``httpx`` transport (latency applied with ``time.sleep``)."""
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            delay = self.delay()
+            if delay:
+                time.sleep(delay)
+            status, body = self.handle(request.method, request.url.path, dict(request.url.params))
+            return httpx.Response(status, json=body)
+
+        return httpx.MockTransport(_handler)
+
+    async def __call__(self, scope: dict, receive, send) -> None:
+        """ASGI entry point."""
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        delay = self.delay()
+        if delay:
+            await asyncio.sleep(delay)
+        params = dict(parse_qsl(scope.get("query_string", b"").decode()))
+        status, body = self.handle(scope["method"], scope["path"], params)
+        payload = json.dumps(body).encode()
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(payload)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": payload})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the mock Kalshi API over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--events", type=int, default=MockConfig.n_events)
+    parser.add_argument("--markets-per-event", type=int, default=MockConfig.markets_per_event)
+    parser.add_argument("--trades-per-market", type=int, default=MockConfig.trades_per_market)
+    parser.add_argument("--seed", type=int, default=MockConfig.seed)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered 429")
+    parser.add_argument("--rate-limit", type=float, default=None, help="Requests/s before answering 429")
+    parser.add_argument("--historical-cutoff-ts", type=int, default=None, help="Live/historical split (Unix ts)")
+    args = parser.parse_args()
+
+    try:
+        import uvicorn
+    except ImportError as exc:
+        raise RuntimeError("Serving the mock API over HTTP requires uvicorn (`uv add --dev uvicorn`)") from exc
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    api = MockKalshiAPI(MockConfig(
+        n_events=args.events,
+        markets_per_event=args.markets_per_event,
+        trades_per_market=args.trades_per_market,
+        seed=args.seed,
+        latency_s=args.latency_ms / 1000,
+        latency_jitter_s=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        historical_cutoff_ts=args.historical_cutoff_ts,
+    ))
+    print(f"Mock Kalshi API at http://{args.host}:{args.port}{API_PREFIX}")
+    uvicorn.run(api, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Record/replay ``httpx`` transports for API traffic.
+
+``RecordingTransport`` wraps a real transport and appends every exchange to
+a JSONL "cassette" (gzip-compressed if the path ends in ``.gz``);
+``ReplayTransport`` serves those responses back without the network, so a
+captured live crawl can be re-run as a benchmark or regression check:
+
+    with KalshiClient(transport=RecordingTransport("crawl.jsonl.gz")) as client:
+        pages = list(iter_all_markets(client))
+
+    with KalshiClient(transport=ReplayTransport("crawl.jsonl.gz"), auth=False) as client:
+        pages = list(iter_all_markets(client))
+
+Requests are matched on method, path and query string; auth headers are not
+recorded.  Repeated identical requests replay their recorded responses in
+order, cycling when exhausted.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import IO
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _request_key(method: str, path: str, params: list[tuple[str, str]]) -> str:
+    query = "&".join(f"{k}={v}" for k, v in sorted(params))
+    return f"{method} {path}?{query}"
+
+
+class RecordingTransport(httpx.BaseTransport):
+    """Forward requests to *inner* and append each exchange to *path*."""
+
+    def __init__(self, path: str | Path, inner: httpx.BaseTransport | None = None) -> None:
+        self._path = Path(path)
+        self._inner = inner or httpx.HTTPTransport()
+        self._file = _open(self._path, "a")
+        self._lock = threading.Lock()
+        self.recorded = 0
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._inner.handle_request(request)
+        content = response.read()
+        entry = {
+            "method": request.method,
+            "path": request.url.path,
+            "params": sorted(request.url.params.multi_items()),
+            "status": response.status_code,
+            "content_type": response.headers.get("content-type", "application/json"),
+            "body": content.decode("utf-8"),
+        }
+        with self._lock:
+            self._file.write(json.dumps(entry) + "\n")
+            self.recorded += 1
+        # Body is already decoded, so content-encoding headers no longer apply
+        return httpx.Response(
+            response.status_code,
+            headers={"content-type": entry["content_type"]},
+            content=content,
+            request=request,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+        self._inner.close()
+        logger.info("Recorded %d exchanges to %s", self.recorded, self._path)
+
+
+class ReplayTransport(httpx.BaseTransport):
+    """Serve responses from a cassette written by ``RecordingTransport``.
+
+    Parameters
+    ----------
+    path:
+        Cassette file (``.jsonl`` or ``.jsonl.gz``).
+    latency_s:
+        Delay added to every response, to model network round trips.
+    """
+
+    def __init__(self, path: str | Path, *, latency_s: float = 0.0) -> None:
+        self._responses: dict[str, deque[dict]] = defaultdict(deque)
+        with _open(Path(path), "r") as f:
+            for line in f:
+                entry = json.loads(line)
+                key = _request_key(entry["method"], entry["path"], [tuple(p) for p in entry["params"]])
+                self._responses[key].append(entry)
+        self._latency_s = latency_s
+        self._lock = threading.Lock()
+        logger.info("Loaded %d recorded requests from %s", len(self._responses), path)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key = _request_key(request.method, request.url.path, request.url.params.multi_items())
+        with self._lock:
+            queue = self._responses.get(key)
+            if not queue:
+                raise LookupError(f"No recorded response for {key}")
+            entry = queue[0]
+            queue.rotate(-1)
+        if self._latency_s:
+            time.sleep(self._latency_s)
+        return httpx.Response(
+            entry["status"],
+            headers={"content-type": entry["content_type"]},
+            content=entry["body"].encode("utf-8"),
+            request=request,
+        )
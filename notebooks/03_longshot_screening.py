@@ -65,15 +65,22 @@ def setup_and_imports():
     import altair as alt
     import pandas as pd
     import numpy as np
-    import math
 
+    import pyarrow as pa
+
+    from longshot.analytics.calibration import CalibrationModel
+    from longshot.portfolio.sizing import SizingLimits, size_candidates, size_positions
+    from longshot.screening import Screener
     from longshot.storage.athena import query
 
-    return alt, math, mo, np, pd, query
+    return (
+        CalibrationModel, Screener, SizingLimits, alt, mo, np, pa, pd, query,
+        size_candidates, size_positions,
+    )
 
 
 @app.cell
-def strategy_parameters(mo):
+def strategy_parameters(CalibrationModel, mo):
     # --- Snapshot parameters ---
     SNAPSHOT_DATE = "2025-01-01"
     SNAPSHOT_HOUR = 20
@@ -91,23 +98,25 @@ def strategy_parameters(mo):
     MAX_CATEGORY_PCT = 0.15
     MAX_DEPLOYED_PCT = 0.70
 
-    # --- Academic calibration (Becker 2026) ---
-    # Market price (cents) -> estimated true probability
-    ACADEMIC_CALIBRATION = {
-        1: 0.0043,
-        3: 0.020,
-        5: 0.0418,
-        10: 0.075,
-        15: 0.12,
-    }
+    # --- Calibration ---
+    # Market price (cents) -> estimated true probability.  Uses the model
+    # fitted by scripts/fit_calibration.py when one exists, else the five
+    # published academic points (Becker 2026)
+    CALIBRATION = CalibrationModel.load_or_academic()
+    _academic = CALIBRATION.meta.get("source") == "academic"
+    _cal_label = "Academic (Becker 2026)" if _academic else "Fitted"
+    _base_rates = "\n".join(
+        f"        | {_p}¢ | {_q:.2%} |"
+        for _p, _q in zip([1, 3, 5, 10, 15], CALIBRATION.true_prob([1, 3, 5, 10, 15]))
+    )
 
     mo.md(
         f"""
         # Longshot Screening — 2025-01-01T20:00Z Snapshot
 
         Screen the point-in-time snapshot for longshot-selling candidates using
-        **only information available at the snapshot time**. Academic calibration
-        from Becker (2026) provides the true-probability anchor.
+        **only information available at the snapshot time**. {_cal_label}
+        calibration provides the true-probability anchor.
 
         | Parameter | Value |
         |-----------|-------|
@@ -121,15 +130,11 @@ def strategy_parameters(mo):
         | Max category | {MAX_CATEGORY_PCT:.0%} |
         | Max deployed | {MAX_DEPLOYED_PCT:.0%} |
 
-        **Academic base rates (Becker 2026):**
+        **{_cal_label} base rates (pooled):**
 
         | Market Price | True Prob |
         |-------------|-----------|
-        | 1¢ | 0.43% |
-        | 3¢ | 2.00% |
-        | 5¢ | 4.18% |
-        | 10¢ | 7.50% |
-        | 15¢ | 12.00% |
+{_base_rates}
         """
     )
 
@@ -137,7 +142,7 @@ def strategy_parameters(mo):
         SNAPSHOT_DATE, SNAPSHOT_HOUR,
         YES_MIN, YES_MAX, MIN_TRADE_COUNT, MIN_REL_EDGE,
         BANKROLL, KELLY_FRAC, MAX_POSITION_PCT, MAX_CATEGORY_PCT, MAX_DEPLOYED_PCT,
-        ACADEMIC_CALIBRATION,
+        CALIBRATION,
     )
 
 
@@ -338,74 +343,27 @@ def screen_snapshot_candidates(
 
 @app.cell
 def score_and_rank_candidates(
-    ACADEMIC_CALIBRATION, MIN_REL_EDGE,
-    alt, mo, np, pd, screened,
+    CALIBRATION, MIN_REL_EDGE, Screener,
+    alt, mo, np, pa, pd, screened,
 ):
-    # Build interpolation from academic calibration
-    calib_prices = sorted(ACADEMIC_CALIBRATION.keys())
-    calib_probs = [ACADEMIC_CALIBRATION[p] for p in calib_prices]
-
-    def interpolate_true_prob(price_cents):
-        return float(np.interp(price_cents, calib_prices, calib_probs))
-
-    scored = screened.copy()
-    scored["est_true_prob"] = scored["price"].apply(interpolate_true_prob)
-    scored["implied_prob"] = scored["price"] / 100.0
-    scored["edge"] = scored["implied_prob"] - scored["est_true_prob"]
-    scored["relative_edge"] = scored["edge"] / scored["implied_prob"]
-
-    # Normalize components
-    tc_min = scored["total_contracts"].min()
-    tc_max = scored["total_contracts"].max()
-    tc_range = tc_max - tc_min if tc_max > tc_min else 1
-    scored["liquidity_norm"] = (scored["total_contracts"] - tc_min) / tc_range
-
-    # Time score: 1.0 if days_to_close in [7, 30], linear decay outside
-    def compute_time_score(d):
-        if d < 1:
-            return 0.0
-        elif d < 7:
-            return d / 7.0
-        elif d <= 30:
-            return 1.0
-        elif d <= 90:
-            return 1.0 - (d - 30) / 60.0
-        else:
-            return 0.0
-
-    scored["time_score"] = scored["days_to_close"].apply(compute_time_score)
-
-    scored["taker_flow_score"] = scored["yes_taker_pct"].fillna(0.5)
-
-    cat_counts = scored["category"].value_counts()
-    scored["diversification_score"] = scored["category"].map(
-        lambda c: 1.0 / cat_counts.get(c, 1)
-    )
-
-    # Normalize each component to [0, 1]
-    def norm_col(s):
-        smin, smax = s.min(), s.max()
-        return (s - smin) / (smax - smin) if smax > smin else pd.Series(0.5, index=s.index)
-
-    scored["edge_norm"] = norm_col(scored["edge"])
-    scored["liq_norm"] = norm_col(scored["liquidity_norm"])
-    scored["time_norm"] = norm_col(scored["time_score"])
-    scored["div_norm"] = norm_col(scored["diversification_score"])
-    scored["flow_norm"] = norm_col(scored["taker_flow_score"])
-
-    scored["composite_score"] = (
-        0.40 * scored["edge_norm"]
-        + 0.25 * scored["liq_norm"]
-        + 0.15 * scored["time_norm"]
-        + 0.10 * scored["div_norm"]
-        + 0.10 * scored["flow_norm"]
+    # Vectorized: price column (cents) -> estimated true probability
+    interpolate_true_prob = CALIBRATION.true_prob
+
+    # Edge, liquidity, time, diversification and taker-flow scores, each
+    # min-max normalised and weighted 40/25/15/10/10 (longshot.screening)
+    screener = Screener(calibration=CALIBRATION, min_rel_edge=MIN_REL_EDGE)
+    # Screener's liquidity input is trade volume ("volume"); the market's
+    # lifetime volume is carried through as "market_volume"
+    scored = screener.score(
+        pa.Table.from_pandas(
+            screened.rename(columns={"volume": "market_volume", "total_contracts": "volume"}),
+            preserve_index=False,
+        )
     )
-
-    # Filter by minimum relative edge
     ranked = (
-        scored[scored["relative_edge"] >= MIN_REL_EDGE]
-        .sort_values("composite_score", ascending=False)
-        .reset_index(drop=True)
+        screener.rank(scored)
+        .to_pandas()
+        .rename(columns={"volume": "total_contracts", "market_volume": "volume"})
     )
 
     ranked_display = ranked[
@@ -443,52 +401,22 @@ def score_and_rank_candidates(
 @app.cell
 def position_sizing(
     BANKROLL, KELLY_FRAC, MAX_POSITION_PCT, MAX_CATEGORY_PCT, MAX_DEPLOYED_PCT,
-    math, mo, pd, ranked,
+    SizingLimits, mo, pa, ranked, size_candidates,
 ):
-    portfolio = ranked.copy()
-
-    # Quarter-Kelly sizing
-    portfolio["kelly_raw"] = (
-        (portfolio["implied_prob"] - portfolio["est_true_prob"])
-        / portfolio["implied_prob"]
-    )
-    portfolio["quarter_kelly"] = KELLY_FRAC * portfolio["kelly_raw"]
-    portfolio["position_dollars"] = portfolio["quarter_kelly"].clip(upper=MAX_POSITION_PCT) * BANKROLL
-    portfolio["no_price_dollars"] = (100 - portfolio["price"]) / 100.0
-    portfolio["num_contracts"] = portfolio.apply(
-        lambda r: math.floor(r["position_dollars"] / r["no_price_dollars"])
-        if r["no_price_dollars"] > 0 else 0,
-        axis=1,
-    )
-    portfolio["actual_cost"] = portfolio["num_contracts"] * portfolio["no_price_dollars"]
-
-    # Category cap: scale down if any category exceeds MAX_CATEGORY_PCT of bankroll
-    cat_cap = MAX_CATEGORY_PCT * BANKROLL
-    cat_totals = portfolio.groupby("category")["actual_cost"].transform("sum")
-    portfolio["cat_scale"] = (cat_cap / cat_totals).clip(upper=1.0)
-    portfolio["actual_cost"] = portfolio["actual_cost"] * portfolio["cat_scale"]
-    portfolio["num_contracts"] = portfolio.apply(
-        lambda r: math.floor(r["actual_cost"] / r["no_price_dollars"])
-        if r["no_price_dollars"] > 0 else 0,
-        axis=1,
-    )
-    portfolio["actual_cost"] = portfolio["num_contracts"] * portfolio["no_price_dollars"]
-
-    # Total deployment cap
-    total_deployed = portfolio["actual_cost"].sum()
-    deploy_cap = MAX_DEPLOYED_PCT * BANKROLL
-    if total_deployed > deploy_cap:
-        deploy_scale = deploy_cap / total_deployed
-        portfolio["actual_cost"] = portfolio["actual_cost"] * deploy_scale
-        portfolio["num_contracts"] = portfolio.apply(
-            lambda r: math.floor(r["actual_cost"] / r["no_price_dollars"])
-            if r["no_price_dollars"] > 0 else 0,
-            axis=1,
-        )
-        portfolio["actual_cost"] = portfolio["num_contracts"] * portfolio["no_price_dollars"]
-
-    # Drop zero-contract positions
-    final_portfolio = portfolio[portfolio["num_contracts"] > 0].copy()
+    # Quarter-Kelly, then category and total deployment caps, each re-floored
+    # to whole contracts; zero-contract positions dropped (longshot.portfolio.sizing)
+    limits = SizingLimits(
+        bankroll=BANKROLL,
+        kelly_fraction=KELLY_FRAC,
+        max_position_pct=MAX_POSITION_PCT,
+        max_category_pct=MAX_CATEGORY_PCT,
+        max_deployed_pct=MAX_DEPLOYED_PCT,
+    )
+    final_portfolio = (
+        size_candidates(pa.Table.from_pandas(ranked, preserve_index=False), limits)
+        .to_pandas()
+        .rename(columns={"contracts": "num_contracts", "cost": "actual_cost"})
+    )
 
     portfolio_display = final_portfolio[
         ["ticker", "category", "price", "edge", "actual_cost", "num_contracts"]
@@ -590,34 +518,34 @@ def portfolio_summary_charts(BANKROLL, alt, final_portfolio, mo, pd):
 
 @app.cell
 def stricter_volume_filter(
-    ACADEMIC_CALIBRATION, BANKROLL, KELLY_FRAC, MAX_POSITION_PCT,
-    MIN_REL_EDGE, interpolate_true_prob, math, mo, np, pd, screened,
+    BANKROLL, KELLY_FRAC, MAX_POSITION_PCT, SizingLimits,
+    MIN_REL_EDGE, interpolate_true_prob, mo, np, pd, screened, size_positions,
 ):
     strict_screened = screened[
         (screened["total_contracts"].fillna(0) * screened["price"].fillna(0) / 100 >= 1000)
     ].copy()
 
     # Re-score strict candidates
-    strict_screened["est_true_prob_s"] = strict_screened["price"].apply(interpolate_true_prob)
+    strict_screened["est_true_prob_s"] = interpolate_true_prob(strict_screened["price"])
     strict_screened["implied_prob_s"] = strict_screened["price"] / 100.0
     strict_screened["edge_s"] = strict_screened["implied_prob_s"] - strict_screened["est_true_prob_s"]
     strict_screened["relative_edge_s"] = strict_screened["edge_s"] / strict_screened["implied_prob_s"]
     strict_filtered = strict_screened[strict_screened["relative_edge_s"] >= MIN_REL_EDGE].copy()
 
-    # Position sizing for strict filter
-    strict_filtered["kelly_s"] = (
-        (strict_filtered["implied_prob_s"] - strict_filtered["est_true_prob_s"])
-        / strict_filtered["implied_prob_s"]
-    )
-    strict_filtered["qk_s"] = KELLY_FRAC * strict_filtered["kelly_s"]
-    strict_filtered["pos_dollars_s"] = strict_filtered["qk_s"].clip(upper=MAX_POSITION_PCT) * BANKROLL
-    strict_filtered["no_price_s"] = (100 - strict_filtered["price"]) / 100.0
-    strict_filtered["contracts_s"] = strict_filtered.apply(
-        lambda r: math.floor(r["pos_dollars_s"] / r["no_price_s"])
-        if r["no_price_s"] > 0 else 0,
-        axis=1,
-    )
-    strict_filtered["cost_s"] = strict_filtered["contracts_s"] * strict_filtered["no_price_s"]
+    # Position sizing for strict filter (position cap only)
+    strict_sized = size_positions(
+        strict_filtered["price"].to_numpy(),
+        strict_filtered["est_true_prob_s"].to_numpy(),
+        limits=SizingLimits(
+            bankroll=BANKROLL,
+            kelly_fraction=KELLY_FRAC,
+            max_position_pct=MAX_POSITION_PCT,
+            max_category_pct=None,
+            max_deployed_pct=None,
+        ),
+    )
+    strict_filtered["contracts_s"] = strict_sized.column("contracts").to_numpy()
+    strict_filtered["cost_s"] = strict_sized.column("cost").to_numpy()
 
     strict_deployed = strict_filtered["cost_s"].sum()
     strict_avg_edge = strict_filtered["edge_s"].mean() if len(strict_filtered) > 0 else 0
@@ -635,7 +563,7 @@ def stricter_volume_filter(
     )
 
     base_avg_edge = (
-        (screened["price"] / 100.0 - screened["price"].apply(interpolate_true_prob)).mean()
+        (screened["price"] / 100.0 - interpolate_true_prob(screened["price"])).mean()
         if len(screened) > 0 else 0
     )
 
@@ -691,7 +619,7 @@ def stricter_volume_filter(
 @app.cell
 def expiry_deep_dive(alt, mo, pd, screened, interpolate_true_prob):
     expiry = screened.copy()
-    expiry["est_true_prob_e"] = expiry["price"].apply(interpolate_true_prob)
+    expiry["est_true_prob_e"] = interpolate_true_prob(expiry["price"])
     expiry["edge_e"] = expiry["price"] / 100.0 - expiry["est_true_prob_e"]
 
     def assign_expiry_bucket(d):
@@ -6,6 +6,7 @@
 #     "pandas",
 #     "altair",
 #     "numpy",
+#     "pyarrow",
 #     "python-dotenv",
 # ]
 # ///
@@ -23,9 +24,10 @@ def setup_and_imports():
     import pandas as pd
     import numpy as np
 
+    from longshot.analytics.open_counts import daily_grid, open_counts
     from longshot.storage.athena import query
 
-    return alt, mo, np, pd, query
+    return alt, daily_grid, mo, np, open_counts, pd, query
 
 
 @app.cell
@@ -50,35 +52,37 @@ def introduction(mo):
 
 
 @app.cell
-def daily_counts_query(mo, pd, query):
-    daily_counts = query("""
-        WITH date_series AS (
-            SELECT snapshot_date
-            FROM UNNEST(sequence(date '2025-01-01', date '2026-02-22', interval '1' day)) AS t(snapshot_date)
-        ),
-        snapshot_ts AS (
-            SELECT snapshot_date,
-                   date_format(cast(snapshot_date AS timestamp) + interval '20' hour,
-                               '%Y-%m-%dT%H:%i:%sZ') AS ts
-            FROM date_series
-        ),
-        relevant_markets AS (
-            SELECT m.open_time, m.close_time, m.last_price
-            FROM markets m
-            WHERE m.open_time <= '2026-02-22T20:00:00Z'
-              AND m.close_time > '2025-01-01T20:00:00Z'
-        )
-        SELECT cast(s.snapshot_date AS varchar) AS snapshot_date,
-               count(*) AS total_open,
-               count_if(rm.last_price >= 3 AND rm.last_price <= 15) AS longshot_count
-        FROM snapshot_ts s
-        CROSS JOIN relevant_markets rm
-        WHERE rm.open_time <= s.ts AND rm.close_time > s.ts
-        GROUP BY s.snapshot_date
-        ORDER BY s.snapshot_date
+def relevant_markets_query(daily_grid, query):
+    # One row per market — the per-day counting happens locally with a
+    # sweep over open/close times instead of a CROSS JOIN in Athena.
+    relevant_markets = query("""
+        SELECT m.open_time, m.close_time, m.last_price,
+               COALESCE(e.category, 'Unknown') AS category
+        FROM markets m
+        LEFT JOIN events e ON m.event_ticker = e.event_ticker
+        WHERE m.open_time <= '2026-02-22T20:00:00Z'
+          AND m.close_time > '2025-01-01T20:00:00Z'
     """)
 
-    daily_counts["snapshot_date"] = pd.to_datetime(daily_counts["snapshot_date"])
+    snapshot_grid_ts = daily_grid("2025-01-01", "2026-02-22", hour=20)
+    is_longshot = (
+        (relevant_markets["last_price"] >= 3) & (relevant_markets["last_price"] <= 15)
+    ).to_numpy()
+
+    return is_longshot, relevant_markets, snapshot_grid_ts
+
+
+@app.cell
+def daily_counts_query(is_longshot, mo, open_counts, pd, relevant_markets, snapshot_grid_ts):
+    daily_counts = open_counts(
+        relevant_markets["open_time"],
+        relevant_markets["close_time"],
+        snapshot_grid_ts,
+        filters={"longshot_count": is_longshot},
+    ).to_pandas()
+    daily_counts = daily_counts.rename(columns={"snapshot_ts": "snapshot_date"})
+
+    daily_counts["snapshot_date"] = pd.to_datetime(daily_counts["snapshot_date"].dt.date)
     daily_counts["longshot_pct"] = (
         daily_counts["longshot_count"] / daily_counts["total_open"] * 100
     )
@@ -143,38 +147,18 @@ def daily_charts(alt, daily_counts, mo):
 
 
 @app.cell
-def category_breakdown_query(mo, pd, query):
-    cat_daily = query("""
-        WITH date_series AS (
-            SELECT snapshot_date
-            FROM UNNEST(sequence(date '2025-01-01', date '2026-02-22', interval '1' day)) AS t(snapshot_date)
-        ),
-        snapshot_ts AS (
-            SELECT snapshot_date,
-                   date_format(cast(snapshot_date AS timestamp) + interval '20' hour,
-                               '%Y-%m-%dT%H:%i:%sZ') AS ts
-            FROM date_series
-        ),
-        relevant_markets AS (
-            SELECT m.open_time, m.close_time, m.last_price,
-                   COALESCE(e.category, 'Unknown') AS category
-            FROM markets m
-            LEFT JOIN events e ON m.event_ticker = e.event_ticker
-            WHERE m.open_time <= '2026-02-22T20:00:00Z'
-              AND m.close_time > '2025-01-01T20:00:00Z'
-        )
-        SELECT cast(s.snapshot_date AS varchar) AS snapshot_date,
-               rm.category,
-               count(*) AS total_open,
-               count_if(rm.last_price >= 3 AND rm.last_price <= 15) AS longshot_count
-        FROM snapshot_ts s
-        CROSS JOIN relevant_markets rm
-        WHERE rm.open_time <= s.ts AND rm.close_time > s.ts
-        GROUP BY s.snapshot_date, rm.category
-        ORDER BY s.snapshot_date, rm.category
-    """)
-
-    cat_daily["snapshot_date"] = pd.to_datetime(cat_daily["snapshot_date"])
+def category_breakdown_query(is_longshot, mo, open_counts, pd, relevant_markets, snapshot_grid_ts):
+    cat_daily = open_counts(
+        relevant_markets["open_time"],
+        relevant_markets["close_time"],
+        snapshot_grid_ts,
+        groups=relevant_markets["category"],
+        filters={"longshot_count": is_longshot},
+    ).to_pandas()
+    cat_daily = cat_daily.rename(columns={"snapshot_ts": "snapshot_date", "group": "category"})
+    # Match the GROUP BY output: only (day, category) pairs with open markets
+    cat_daily = cat_daily[cat_daily["total_open"] > 0].copy()
+    cat_daily["snapshot_date"] = pd.to_datetime(cat_daily["snapshot_date"].dt.date)
 
     # Identify top 6 categories by average longshot count
     cat_avg_longshot = (
@@ -4,7 +4,6 @@
 #     "marimo",
 #     "httpx",
 #     "pyarrow",
-#     "s3fs",
 #     "python-dotenv",
 #     "pandas",
 # ]
@@ -26,42 +25,39 @@ def setup_and_imports():
     import httpx
     import pyarrow as pa
     import pyarrow.parquet as pq
-    import s3fs
     import pandas as pd
 
     from longshot.api.client import KalshiClient
     from longshot.api.rate_limiter import TokenBucket
     from longshot.api.models import MarketsResponse
+    from longshot.storage.cdc import write_hourly_pull
     from longshot.storage.s3 import MARKETS_SCHEMA, _markets_to_table
-    from longshot.config import SETTINGS
 
     logging.basicConfig(level=logging.INFO)
     pull_logger = logging.getLogger("daily_pull")
 
     return (
-        MARKETS_SCHEMA, SETTINGS, MarketsResponse, TokenBucket,
-        KalshiClient, _markets_to_table, datetime, httpx, mo, pa, pd,
-        pq, pull_logger, s3fs, time, timezone,
+        MARKETS_SCHEMA, MarketsResponse, TokenBucket, KalshiClient,
+        _markets_to_table, datetime, httpx, mo, pa, pd, pq,
+        pull_logger, time, timezone, write_hourly_pull,
     )
 
 
 @app.cell
-def pull_params(SETTINGS, datetime, mo, timezone):
+def pull_params(datetime, mo, timezone):
     pull_now = datetime.now(timezone.utc)
     pull_date_str = pull_now.strftime("%Y-%m-%d")
     pull_hour = pull_now.hour
     pull_close_ts = int(pull_now.timestamp())
-    pull_s3_path = (
-        f"s3://{SETTINGS.s3_bucket}/{SETTINGS.s3_prefix}"
-        f"/markets/daily/date={pull_date_str}/hour={pull_hour:02d}/data.parquet"
-    )
+    pull_hour_ts = int(pull_now.replace(minute=0, second=0, microsecond=0).timestamp())
 
     mo.md(
         f"""
         # Daily Active Market Pull
 
         Pull all non-MVE markets from Kalshi with `close_time` in the future
-        and write to S3.
+        and write them to S3 as a base or CDC delta (`longshot.storage.cdc`),
+        refreshing `markets/latest`.
 
         | Parameter | Value |
         |-----------|-------|
@@ -69,18 +65,17 @@ def pull_params(SETTINGS, datetime, mo, timezone):
         | Date | `{pull_date_str}` |
         | Hour | `{pull_hour:02d}` |
         | min_close_ts | `{pull_close_ts}` |
-        | S3 path | `{pull_s3_path}` |
         """
     )
 
-    return pull_close_ts, pull_date_str, pull_hour, pull_now, pull_s3_path
+    return pull_close_ts, pull_date_str, pull_hour, pull_hour_ts, pull_now
 
 
 @app.cell
 def pull_and_write_markets(
-    KalshiClient, MARKETS_SCHEMA, MarketsResponse, SETTINGS, TokenBucket,
-    _markets_to_table, httpx, mo, pq, pull_close_ts, pull_logger, pull_s3_path,
-    s3fs, time,
+    KalshiClient, MARKETS_SCHEMA, MarketsResponse, TokenBucket,
+    _markets_to_table, httpx, mo, pull_close_ts, pull_hour_ts, pull_logger,
+    time, write_hourly_pull,
 ):
     mo.md("## Pulling markets from Kalshi API...")
 
@@ -128,15 +123,9 @@ def pull_and_write_markets(
     client.close()
     pull_total_markets = len(all_markets)
 
-    # Write single parquet file to S3
-    writer_fs = s3fs.S3FileSystem(
-        key=SETTINGS.aws_access_key_id,
-        secret=SETTINGS.aws_secret_access_key,
-        client_kwargs={"region_name": SETTINGS.aws_region},
-    )
+    # Write a base or delta through the CDC writer (also refreshes markets/latest)
     table = _markets_to_table(all_markets)
-    with writer_fs.open(pull_s3_path, "wb") as f_out:
-        pq.write_table(table, f_out)
+    pull_s3_path, pull_kind, pull_rows_written = write_hourly_pull(table, pull_hour_ts)
 
     pull_elapsed = time.time() - pull_start
 
@@ -145,25 +134,23 @@ def pull_and_write_markets(
         pull_total_markets, pull_pages, pull_elapsed, pull_filter_used,
     )
 
-    return pull_elapsed, pull_filter_used, pull_pages, pull_total_markets
+    return (
+        pull_elapsed, pull_filter_used, pull_kind, pull_pages,
+        pull_rows_written, pull_s3_path, pull_total_markets,
+    )
 
 
 @app.cell
 def results_summary(
-    SETTINGS, mo, pd, pull_elapsed, pull_filter_used,
-    pull_pages, pull_s3_path, pull_total_markets, s3fs,
+    mo, pd, pull_elapsed, pull_filter_used, pull_kind,
+    pull_pages, pull_rows_written, pull_s3_path, pull_total_markets,
 ):
     mo.md("## Results")
 
+    from longshot.storage.s3 import _get_fs
+
     # Get file size from S3
-    size_fs = s3fs.S3FileSystem(
-        key=SETTINGS.aws_access_key_id,
-        secret=SETTINGS.aws_secret_access_key,
-        client_kwargs={"region_name": SETTINGS.aws_region},
-    )
-    # s3fs paths without the s3:// prefix
-    s3_key = pull_s3_path.replace("s3://", "")
-    file_info = size_fs.info(s3_key)
+    file_info = _get_fs().info(pull_s3_path)
     file_size_mb = file_info["size"] / (1024 * 1024)
 
     markets_per_sec = pull_total_markets / pull_elapsed if pull_elapsed > 0 else 0
@@ -174,6 +161,7 @@ def results_summary(
         {"Metric": "Markets / sec", "Value": f"{markets_per_sec:,.0f}"},
         {"Metric": "API pages", "Value": f"{pull_pages:,}"},
         {"Metric": "Filter used", "Value": pull_filter_used},
+        {"Metric": "Written as", "Value": f"{pull_kind} ({pull_rows_written:,} rows)"},
         {"Metric": "S3 path", "Value": pull_s3_path},
         {"Metric": "File size", "Value": f"{file_size_mb:.2f} MB"},
     ])
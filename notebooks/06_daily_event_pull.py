@@ -30,12 +30,13 @@ def setup_and_imports():
     from longshot.api.client import KalshiClient
     from longshot.api.rate_limiter import TokenBucket
     from longshot.config import SETTINGS
+    from longshot.storage.s3 import _events_to_table as events_to_table
 
     logging.basicConfig(level=logging.INFO)
     evt_logger = logging.getLogger("daily_event_pull")
 
     return (
-        SETTINGS, TokenBucket, KalshiClient,
+        SETTINGS, TokenBucket, KalshiClient, events_to_table,
         evt_logger, httpx, mo, pa, pd, pq, s3fs,
     )
 
@@ -58,7 +59,7 @@ def event_pull_params(SETTINGS, mo):
         # Daily Event Pull (with Nested Markets)
 
         Pull all events from Kalshi with `close_time` in the future,
-        including nested markets as JSON.
+        including nested markets as a typed `list<struct>` column.
 
         | Parameter | Value |
         |-----------|-------|
@@ -75,12 +76,11 @@ def event_pull_params(SETTINGS, mo):
 
 @app.cell
 def pull_and_write_events(
-    KalshiClient, SETTINGS, TokenBucket,
+    KalshiClient, SETTINGS, TokenBucket, events_to_table,
     evt_close_ts, evt_logger, evt_s3_path,
     httpx, mo, pa, pq, s3fs,
 ):
     import time
-    import json
 
     mo.md("## Pulling events from Kalshi API...")
 
@@ -143,37 +143,8 @@ def pull_and_write_events(
     client.close()
     evt_total = len(all_events)
 
-    # Build table: event fields + markets_json
-    evt_schema = pa.schema([
-        pa.field("event_ticker", pa.string()),
-        pa.field("series_ticker", pa.string()),
-        pa.field("category", pa.string()),
-        pa.field("title", pa.string()),
-        pa.field("sub_title", pa.string()),
-        pa.field("mutually_exclusive", pa.bool_()),
-        pa.field("collateral_return_type", pa.string()),
-        pa.field("strike_date", pa.string()),
-        pa.field("strike_period", pa.string()),
-        pa.field("markets_json", pa.string()),
-    ])
-
-    table = pa.table(
-        {
-            "event_ticker": [e["event_ticker"] for e in all_events],
-            "series_ticker": [e.get("series_ticker") for e in all_events],
-            "category": [e.get("category") for e in all_events],
-            "title": [e.get("title") for e in all_events],
-            "sub_title": [e.get("sub_title") for e in all_events],
-            "mutually_exclusive": [e.get("mutually_exclusive") for e in all_events],
-            "collateral_return_type": [e.get("collateral_return_type") for e in all_events],
-            "strike_date": [e.get("strike_date") for e in all_events],
-            "strike_period": [e.get("strike_period") for e in all_events],
-            "markets_json": [
-                json.dumps(e.get("markets", [])) for e in all_events
-            ],
-        },
-        schema=evt_schema,
-    )
+    # Build table: event fields + typed nested markets (list<struct>)
+    table = events_to_table(all_events, nested_markets=True)
 
     # Write single parquet to S3
     writer_fs = s3fs.S3FileSystem(
@@ -199,6 +170,8 @@ def event_results_summary(
     SETTINGS, evt_elapsed, evt_filter_used, evt_pages,
     evt_s3_path, evt_total, mo, pd, pq, s3fs,
 ):
+    import pyarrow.compute as pc
+
     mo.md("## Results")
 
     # Get file size from S3
@@ -213,11 +186,10 @@ def event_results_summary(
 
     events_per_sec = evt_total / evt_elapsed if evt_elapsed > 0 else 0
 
-    # Read back to check markets_json
+    # Read back to check nested markets
     with size_fs.open(s3_key, "rb") as f_in:
         read_table = pq.read_table(f_in)
-    markets_col = read_table.column("markets_json").to_pylist()
-    has_nested = sum(1 for m in markets_col if m and m != "[]")
+    has_nested = pc.sum(pc.greater(pc.list_value_length(read_table.column("markets")), 0)).as_py() or 0
 
     summary_data = pd.DataFrame([
         {"Metric": "Total events", "Value": f"{evt_total:,}"},
@@ -29,10 +29,10 @@ def setup():
 def find_partitions(mo, query):
     partition_info = query("""
         SELECT
-            'daily_markets' AS tbl,
+            'latest_markets' AS tbl,
             max(date) AS latest_date,
             max(hour) AS latest_hour
-        FROM daily_markets
+        FROM latest_markets
         UNION ALL
         SELECT
             'daily_events' AS tbl,
@@ -41,7 +41,7 @@ def find_partitions(mo, query):
         FROM daily_events
     """)
 
-    mkt_row = partition_info[partition_info["tbl"] == "daily_markets"].iloc[0]
+    mkt_row = partition_info[partition_info["tbl"] == "latest_markets"].iloc[0]
     evt_row = partition_info[partition_info["tbl"] == "daily_events"].iloc[0]
     mkt_date = mkt_row["latest_date"]
     mkt_hour = str(int(mkt_row["latest_hour"]))
@@ -56,7 +56,7 @@ def find_partitions(mo, query):
 
         | Table | Date | Hour (UTC) |
         |-------|------|------------|
-        | daily_markets | {mkt_date} | {mkt_hour} |
+        | latest_markets | {mkt_date} | {mkt_hour} |
         | daily_events | {evt_date} | {evt_hour} |
         """
     )
@@ -72,7 +72,7 @@ def daily_overview(mo, query):
             count(DISTINCT e.category)          AS categories,
             sum(m.volume)                       AS total_volume,
             avg(m.open_interest)                AS avg_open_interest
-        FROM daily_markets m
+        FROM latest_markets m
         LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
     """)
 
@@ -99,7 +99,7 @@ def days_to_expiry_dist(alt, mo, query, mkt_date):
         WITH dte AS (
             SELECT
                 date_diff('day', date('{mkt_date}'), date(from_iso8601_timestamp(close_time))) AS raw_dte
-            FROM daily_markets
+            FROM latest_markets
             WHERE close_time IS NOT NULL
               AND close_time != ''
               AND date_diff('day', date('{mkt_date}'), date(from_iso8601_timestamp(close_time))) >= 1
@@ -157,7 +157,7 @@ def dte_volume_dist(alt, mo, query, mkt_date):
             SELECT
                 date_diff('day', date('{mkt_date}'), date(from_iso8601_timestamp(close_time))) AS raw_dte,
                 volume_24h
-            FROM daily_markets
+            FROM latest_markets
             WHERE close_time IS NOT NULL
               AND close_time != ''
               AND date_diff('day', date('{mkt_date}'), date(from_iso8601_timestamp(close_time))) >= 1
@@ -215,7 +215,7 @@ def midpoint_price_dist(alt, mo, query):
         WITH priced AS (
             SELECT
                 (yes_bid + yes_ask) / 2.0 AS midpoint
-            FROM daily_markets
+            FROM latest_markets
             WHERE yes_bid IS NOT NULL
               AND yes_ask IS NOT NULL
         )
@@ -267,7 +267,7 @@ def category_dist(alt, mo, query):
         SELECT
             COALESCE(e.category, 'Unknown') AS category_name,
             count(*) AS market_count
-        FROM daily_markets m
+        FROM latest_markets m
         LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
         GROUP BY COALESCE(e.category, 'Unknown')
         ORDER BY count(*) DESC
@@ -331,7 +331,7 @@ def longshot_overview(mo, query):
             sum(m.volume)                       AS ls_volume,
             avg(m.open_interest)                AS ls_avg_oi,
             avg(m.last_price)                   AS ls_avg_price
-        FROM daily_markets m
+        FROM latest_markets m
         LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
         WHERE m.last_price >= 3
           AND m.last_price <= 15
@@ -373,7 +373,7 @@ def longshot_dte_dist(alt, mo, query, mkt_date):
         WITH ls_dte AS (
             SELECT
                 date_diff('day', date('{mkt_date}'), date(from_iso8601_timestamp(close_time))) AS raw_dte
-            FROM daily_markets
+            FROM latest_markets
             WHERE close_time IS NOT NULL
               AND close_time != ''
               AND last_price >= 3
@@ -433,7 +433,7 @@ def longshot_dte_volume_dist(alt, mo, query, mkt_date):
             SELECT
                 date_diff('day', date('{mkt_date}'), date(from_iso8601_timestamp(close_time))) AS raw_dte,
                 volume_24h
-            FROM daily_markets
+            FROM latest_markets
             WHERE close_time IS NOT NULL
               AND close_time != ''
               AND last_price >= 3
@@ -493,7 +493,7 @@ def longshot_midprice_dist(alt, mo, query):
         WITH ls_priced AS (
             SELECT
                 (yes_bid + yes_ask) / 2.0 AS ls_midpoint
-            FROM daily_markets
+            FROM latest_markets
             WHERE yes_bid IS NOT NULL
               AND yes_ask IS NOT NULL
               AND last_price >= 3
@@ -548,7 +548,7 @@ def longshot_category_dist(alt, mo, query):
         SELECT
             COALESCE(e.category, 'Unknown') AS ls_category,
             count(*) AS ls_cat_count
-        FROM daily_markets m
+        FROM latest_markets m
         LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
         WHERE m.last_price >= 3
           AND m.last_price <= 15
@@ -30,10 +30,10 @@ def dd_setup():
 def dd_partitions(mo, query):
     dd_partition_info = query("""
         SELECT
-            'daily_markets' AS tbl,
+            'latest_markets' AS tbl,
             max(date) AS latest_date,
             max(hour) AS latest_hour
-        FROM daily_markets
+        FROM latest_markets
         UNION ALL
         SELECT
             'daily_events' AS tbl,
@@ -42,7 +42,7 @@ def dd_partitions(mo, query):
         FROM daily_events
     """)
 
-    mkt_part = dd_partition_info[dd_partition_info["tbl"] == "daily_markets"].iloc[0]
+    mkt_part = dd_partition_info[dd_partition_info["tbl"] == "latest_markets"].iloc[0]
     evt_part = dd_partition_info[dd_partition_info["tbl"] == "daily_events"].iloc[0]
     snap_date = mkt_part["latest_date"]
     snap_hour = str(int(mkt_part["latest_hour"]))
@@ -67,7 +67,7 @@ def dd_partitions(mo, query):
 
         | Table | Date | Hour (UTC) |
         |-------|------|------------|
-        | daily_markets | {snap_date} | {snap_hour} |
+        | latest_markets | {snap_date} | {snap_hour} |
         | daily_events | {evt_snap_date} | {evt_snap_hour} |
         """
     )
@@ -90,7 +90,7 @@ def dd_cohort_overview(mo, query, snap_date):
                 m.last_price,
                 m.yes_bid,
                 m.yes_ask
-            FROM daily_markets m
+            FROM latest_markets m
             WHERE m.close_time IS NOT NULL
               AND m.close_time != ''
               AND m.last_price >= 3
@@ -145,7 +145,7 @@ def dd_dte_distribution(alt, mo, query, snap_date):
             SELECT
                 date_diff('day', date('{snap_date}'), date(from_iso8601_timestamp(close_time))) AS dte_day_val,
                 volume_24h
-            FROM daily_markets
+            FROM latest_markets
             WHERE close_time IS NOT NULL
               AND close_time != ''
               AND last_price >= 3
@@ -241,7 +241,7 @@ def dd_category_count(alt, mo, query, snap_date):
                 ELSE '2-week'
             END AS cat_cohort_count,
             count(*) AS cat_mkt_count
-        FROM daily_markets m
+        FROM latest_markets m
         LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
         WHERE m.close_time IS NOT NULL
           AND m.close_time != ''
@@ -292,7 +292,7 @@ def dd_category_volume(alt, mo, query, snap_date):
                 ELSE '2-week'
             END AS cat_cohort_vol,
             sum(m.volume_24h) AS cat_total_vol_24h
-        FROM daily_markets m
+        FROM latest_markets m
         LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
         WHERE m.close_time IS NOT NULL
           AND m.close_time != ''
@@ -372,7 +372,7 @@ def dd_top_events_1w(mo, query, snap_date):
             sum(m.volume_24h) AS evt1w_vol_24h,
             sum(m.open_interest) AS evt1w_total_oi,
             avg(m.last_price) AS evt1w_avg_price
-        FROM daily_markets m
+        FROM latest_markets m
         LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
         WHERE m.close_time IS NOT NULL
           AND m.close_time != ''
@@ -401,7 +401,7 @@ def dd_top_events_2w(mo, query, snap_date):
             sum(m.volume_24h) AS evt2w_vol_24h,
             sum(m.open_interest) AS evt2w_total_oi,
             avg(m.last_price) AS evt2w_avg_price
-        FROM daily_markets m
+        FROM latest_markets m
         LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
         WHERE m.close_time IS NOT NULL
           AND m.close_time != ''
@@ -457,7 +457,7 @@ def dd_top_markets_1w(mo, query, snap_date):
             m.volume_24h AS mkt1w_vol_24h,
             m.open_interest AS mkt1w_oi,
             date_diff('day', date('{snap_date}'), date(from_iso8601_timestamp(m.close_time))) AS mkt1w_dte
-        FROM daily_markets m
+        FROM latest_markets m
         LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
         WHERE m.close_time IS NOT NULL
           AND m.close_time != ''
@@ -486,7 +486,7 @@ def dd_top_markets_2w(mo, query, snap_date):
             m.volume_24h AS mkt2w_vol_24h,
             m.open_interest AS mkt2w_oi,
             date_diff('day', date('{snap_date}'), date(from_iso8601_timestamp(m.close_time))) AS mkt2w_dte
-        FROM daily_markets m
+        FROM latest_markets m
         LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
         WHERE m.close_time IS NOT NULL
           AND m.close_time != ''
@@ -535,7 +535,7 @@ def dd_price_distribution(alt, mo, query, snap_date):
                 ELSE '2-week'
             END AS price_cohort_name,
             count(*) AS price_bin_count
-        FROM daily_markets
+        FROM latest_markets
         WHERE close_time IS NOT NULL
           AND close_time != ''
           AND last_price >= 3
@@ -586,7 +586,7 @@ def dd_spread_distribution(alt, mo, query, snap_date):
                 ELSE '2-week'
             END AS spread_cohort_name,
             count(*) AS spread_bin_count
-        FROM daily_markets
+        FROM latest_markets
         WHERE close_time IS NOT NULL
           AND close_time != ''
           AND last_price >= 3
@@ -667,7 +667,7 @@ def dd_volume_concentration(alt, mo, pd, query, snap_date):
                     ELSE '2-week'
                 END AS conc_cohort,
                 sum(m.volume_24h) AS conc_vol_24h
-            FROM daily_markets m
+            FROM latest_markets m
             LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
             WHERE m.close_time IS NOT NULL
               AND m.close_time != ''
@@ -776,7 +776,7 @@ def dd_day14_drilldown(mo, query, snap_date):
             sum(m.open_interest) AS d14_total_oi,
             avg(m.last_price) AS d14_avg_price,
             avg(m.yes_ask - m.yes_bid) AS d14_avg_spread
-        FROM daily_markets m
+        FROM latest_markets m
         WHERE m.close_time IS NOT NULL
           AND m.close_time != ''
           AND m.last_price >= 3
@@ -794,7 +794,7 @@ def dd_day14_drilldown(mo, query, snap_date):
             sum(m.volume_24h) AS d14_evt_vol_24h,
             sum(m.open_interest) AS d14_evt_total_oi,
             avg(m.last_price) AS d14_evt_avg_price
-        FROM daily_markets m
+        FROM latest_markets m
         LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
         WHERE m.close_time IS NOT NULL
           AND m.close_time != ''
@@ -816,7 +816,7 @@ def dd_day14_drilldown(mo, query, snap_date):
             m.yes_ask AS d14_mkt_ask,
             m.volume_24h AS d14_mkt_vol_24h,
             m.open_interest AS d14_mkt_oi
-        FROM daily_markets m
+        FROM latest_markets m
         LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
         WHERE m.close_time IS NOT NULL
           AND m.close_time != ''
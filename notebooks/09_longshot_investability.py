@@ -30,10 +30,10 @@ def inv_setup():
 def inv_partitions(mo, query):
     inv_partition_info = query("""
         SELECT
-            'daily_markets' AS tbl,
+            'latest_markets' AS tbl,
             max(date) AS latest_date,
             max(hour) AS latest_hour
-        FROM daily_markets
+        FROM latest_markets
         UNION ALL
         SELECT
             'daily_events' AS tbl,
@@ -42,7 +42,7 @@ def inv_partitions(mo, query):
         FROM daily_events
     """)
 
-    inv_mkt_part = inv_partition_info[inv_partition_info["tbl"] == "daily_markets"].iloc[0]
+    inv_mkt_part = inv_partition_info[inv_partition_info["tbl"] == "latest_markets"].iloc[0]
     inv_evt_part = inv_partition_info[inv_partition_info["tbl"] == "daily_events"].iloc[0]
     inv_snap_date = inv_mkt_part["latest_date"]
     inv_snap_hour = str(int(inv_mkt_part["latest_hour"]))
@@ -69,7 +69,7 @@ def inv_partitions(mo, query):
 
         | Table | Date | Hour (UTC) |
         |-------|------|------------|
-        | daily_markets | {inv_snap_date} | {inv_snap_hour} |
+        | latest_markets | {inv_snap_date} | {inv_snap_hour} |
         | daily_events | {inv_evt_snap_date} | {inv_evt_snap_hour} |
         """
     )
@@ -95,7 +95,7 @@ def inv_survival_by_cohort(query, inv_snap_date):
                     WHEN date_diff('day', date('{inv_snap_date}'), date(from_iso8601_timestamp(m.close_time))) BETWEEN 8 AND 14 THEN '2-week'
                 END AS surv_cohort,
                 m.volume_24h
-            FROM daily_markets m
+            FROM latest_markets m
             WHERE m.close_time IS NOT NULL
               AND m.close_time != ''
               AND m.last_price >= 3
@@ -133,7 +133,7 @@ def inv_survival_by_category(query, inv_snap_date):
                     WHEN date_diff('day', date('{inv_snap_date}'), date(from_iso8601_timestamp(m.close_time))) BETWEEN 8 AND 14 THEN '2-week'
                 END AS surv_cat_cohort,
                 m.volume_24h
-            FROM daily_markets m
+            FROM latest_markets m
             LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
             WHERE m.close_time IS NOT NULL
               AND m.close_time != ''
@@ -231,7 +231,7 @@ def inv_dollar_vol_by_cohort(query, inv_snap_date):
                 END AS dv_cohort,
                 CAST(m.volume_24h AS DOUBLE) * CAST(m.last_price AS DOUBLE) / 100.0 AS dv_dollar_vol,
                 CAST(m.volume_24h AS DOUBLE) * CAST(m.last_price AS DOUBLE) / 100.0 * 0.02 AS dv_investable
-            FROM daily_markets m
+            FROM latest_markets m
             WHERE m.close_time IS NOT NULL
               AND m.close_time != ''
               AND m.last_price >= 3
@@ -272,7 +272,7 @@ def inv_dollar_vol_by_category(query, inv_snap_date):
                 END AS dvc_cohort,
                 CAST(m.volume_24h AS DOUBLE) * CAST(m.last_price AS DOUBLE) / 100.0 AS dvc_dollar_vol,
                 CAST(m.volume_24h AS DOUBLE) * CAST(m.last_price AS DOUBLE) / 100.0 * 0.02 AS dvc_investable
-            FROM daily_markets m
+            FROM latest_markets m
             LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
             WHERE m.close_time IS NOT NULL
               AND m.close_time != ''
@@ -372,7 +372,7 @@ def inv_per_market_bins(query, inv_snap_date):
                     WHEN date_diff('day', date('{inv_snap_date}'), date(from_iso8601_timestamp(m.close_time))) BETWEEN 8 AND 14 THEN '2-week'
                 END AS bin_cohort,
                 CAST(m.volume_24h AS DOUBLE) * CAST(m.last_price AS DOUBLE) / 100.0 * 0.02 AS bin_investable
-            FROM daily_markets m
+            FROM latest_markets m
             WHERE m.close_time IS NOT NULL
               AND m.close_time != ''
               AND m.last_price >= 3
@@ -454,7 +454,7 @@ def inv_top_markets(query, inv_snap_date):
             CAST(m.volume_24h AS DOUBLE) * CAST(m.last_price AS DOUBLE) / 100.0 AS top_inv_dollar_vol,
             CAST(m.volume_24h AS DOUBLE) * CAST(m.last_price AS DOUBLE) / 100.0 * 0.02 AS top_inv_investable,
             date_diff('day', date('{inv_snap_date}'), date(from_iso8601_timestamp(m.close_time))) AS top_inv_dte
-        FROM daily_markets m
+        FROM latest_markets m
         LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
         WHERE m.close_time IS NOT NULL
           AND m.close_time != ''
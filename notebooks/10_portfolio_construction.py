@@ -28,18 +28,20 @@ def pc_setup():
 
     from longshot.storage.athena import query
     from longshot.config import SETTINGS
+    from longshot.analytics.calibration import CalibrationModel
+    from longshot.portfolio.collateral import event_collateral
 
-    return SETTINGS, alt, mo, pa, pd, pq, query, s3fs
+    return CalibrationModel, SETTINGS, alt, event_collateral, mo, pa, pd, pq, query, s3fs
 
 
 @app.cell
 def pc_partitions(mo, query):
     pc_partition_info = query("""
         SELECT
-            'daily_markets' AS tbl,
+            'latest_markets' AS tbl,
             max(date) AS latest_date,
             max(hour) AS latest_hour
-        FROM daily_markets
+        FROM latest_markets
         UNION ALL
         SELECT
             'daily_events' AS tbl,
@@ -48,7 +50,7 @@ def pc_partitions(mo, query):
         FROM daily_events
     """)
 
-    pc_mkt_part = pc_partition_info[pc_partition_info["tbl"] == "daily_markets"].iloc[0]
+    pc_mkt_part = pc_partition_info[pc_partition_info["tbl"] == "latest_markets"].iloc[0]
     pc_evt_part = pc_partition_info[pc_partition_info["tbl"] == "daily_events"].iloc[0]
     pc_snap_date = pc_mkt_part["latest_date"]
     pc_snap_hour = str(int(pc_mkt_part["latest_hour"]))
@@ -76,7 +78,7 @@ def pc_partitions(mo, query):
 
         | Table | Date | Hour (UTC) |
         |-------|------|------------|
-        | daily_markets | {pc_snap_date} | {pc_snap_hour} |
+        | latest_markets | {pc_snap_date} | {pc_snap_hour} |
         | daily_events | {pc_evt_snap_date} | {pc_evt_snap_hour} |
         """
     )
@@ -84,38 +86,48 @@ def pc_partitions(mo, query):
 
 
 @app.cell
-def pc_key_findings(mo):
+def pc_key_findings(
+    mo, pc_1w_me_pct, pc_2w_me_pct, pc_avg_cluster_markets, pc_cal_label,
+    pc_edge_cents, pc_largest_clusters_text, pc_me_pct, pc_n_events,
+    pc_n_markets, pc_n_me_clusters, pc_n_spread_cats, pc_n_wide_cats,
+    pc_pnl_95th_low, pc_total_expected_pnl,
+):
     mo.md(
-        r"""
+        rf"""
         ### Key Findings
 
-        1. **Portfolio of 374 markets across 227 events** — after removing
-           Financials (wide spreads, no edge) and capping non-ME events at 3
-           markets each. Total capital required: **\$278** effective collateral
-           (1 No contract per market).
-
-        2. **44% of investable longshots are in mutually exclusive events** —
-           higher in the 1-week cohort (53%) than 2-week (31%). Weather
-           (70% ME) and Entertainment (61% ME) contribute the most ME
-           structure, not Sports (only 41% ME, since spread/points markets
-           aren't ME).
-
-        3. **Collateral efficiency is concentrated, not broad.** The 33 ME
-           clusters average just 3.2 markets. Two outliers drive most
-           savings: NASCAR (18.5x efficiency) and Bitcoin range (11.7x).
-           Category-level efficiency: Crypto 6.3x, Sports 6.1x, Weather
-           2.3x. Total portfolio savings: 20% (\$68 on \$346 nominal).
-
-        4. **Expected edge is thin: +\$4.56 across 374 contracts** (~1.2
-           cents per contract, Becker calibration). This is smaller than
-           the average bid-ask spread in every category except Weather.
-           Execution quality — not market selection — will determine
-           whether this strategy is profitable.
-
-        5. **The portfolio is a variance bet.** With 95th-percentile loss
-           at -\$3.06, even a correctly-calibrated FLB edge can produce
-           losses over a 1-2 week test window. The purpose is to validate
-           fills and execution, not to prove profitability in one round.
+        1. **Portfolio of {pc_n_markets:,} markets across {pc_n_events:,} events**
+           — after removing Financials (wide spreads, no edge) and capping
+           non-ME events at 3 markets each, at 1 No contract per market. The
+           capital required is the exact worst-case collateral shown in
+           Section 5.
+
+        2. **{pc_me_pct:.0f}% of investable longshots are in mutually exclusive
+           events** — {pc_1w_me_pct:.0f}% in the 1-week cohort and
+           {pc_2w_me_pct:.0f}% in the 2-week cohort. Per-category ME shares
+           are in Section 4.
+
+        3. **Collateral savings are concentrated, not broad.** The
+           {pc_n_me_clusters:,} ME clusters average just
+           {pc_avg_cluster_markets:.1f} markets. Under the exact worst-case
+           rule, each ME cluster risks only its cost minus the payout of the
+           legs that still pay, so the largest clusters
+           ({pc_largest_clusters_text}) lock the least net collateral per
+           market. Two- and three-market clusters save much less.
+           Per-cluster and per-category figures are in Section 3.
+
+        4. **Expected edge is thin: \${pc_total_expected_pnl:,.2f} across
+           {pc_n_markets:,} contracts** (~{pc_edge_cents:.1f} cents per
+           contract, {pc_cal_label} calibration). This is smaller than the
+           average bid-ask spread in {pc_n_wide_cats} of the portfolio's
+           {pc_n_spread_cats} categories. Execution quality — not market
+           selection — will determine whether this strategy is profitable.
+
+        5. **The portfolio is a variance bet.** With 95th-percentile P&L
+           at \${pc_pnl_95th_low:,.2f}, even a correctly-calibrated FLB edge
+           can produce losses over a 1-2 week test window. The purpose is to
+           validate fills and execution, not to prove profitability in one
+           round.
         """
     )
     return ()
@@ -136,7 +148,7 @@ def pc_universe_query(mo, query, pc_snap_date):
                 CASE WHEN e.mutually_exclusive = true THEN 'ME' ELSE 'Non-ME' END AS pc_me_label,
                 m.volume_24h,
                 CAST(m.volume_24h AS DOUBLE) * CAST(m.last_price AS DOUBLE) / 100.0 AS pc_dollar_vol
-            FROM daily_markets m
+            FROM latest_markets m
             LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
             WHERE m.close_time IS NOT NULL
               AND m.close_time != ''
@@ -174,10 +186,19 @@ def pc_universe_commentary(mo, pc_universe_summary):
     # Per-cohort ME breakdown
     pc_1w = pc_universe_summary[pc_universe_summary["pc_cohort"] == "1-week"]
     pc_1w_total = int(pc_1w["pc_market_count"].sum())
-    pc_1w_me = int(pc_1w[pc_1w["pc_me_label"] == "ME"]["pc_market_count"].sum()) if len(pc_1w[pc_1w["pc_me_label"] == "ME"]) > 0 else 0
+    pc_1w_me = int(pc_1w[pc_1w["pc_me_label"] == "ME"]["pc_market_count"].sum())
+    pc_1w_me_pct = pc_1w_me * 100 / pc_1w_total if pc_1w_total else 0
     pc_2w = pc_universe_summary[pc_universe_summary["pc_cohort"] == "2-week"]
     pc_2w_total = int(pc_2w["pc_market_count"].sum())
-    pc_2w_me = int(pc_2w[pc_2w["pc_me_label"] == "ME"]["pc_market_count"].sum()) if len(pc_2w[pc_2w["pc_me_label"] == "ME"]) > 0 else 0
+    pc_2w_me = int(pc_2w[pc_2w["pc_me_label"] == "ME"]["pc_market_count"].sum())
+    pc_2w_me_pct = pc_2w_me * 100 / pc_2w_total if pc_2w_total else 0
+
+    _cohort_note = (
+        "The 1-week cohort's higher ME fraction is a pleasant surprise: the "
+        "diverse, higher-edge cohort also has more collateral-efficient structure."
+        if pc_1w_me_pct > pc_2w_me_pct
+        else "The 2-week cohort carries more of the collateral-efficient ME structure."
+    )
 
     mo.md(
         f"""
@@ -187,16 +208,14 @@ def pc_universe_commentary(mo, pc_universe_summary):
         Of these, **{pc_me_mkts}** ({pc_me_pct:.0f}%) are in mutually exclusive
         events and **{pc_nonme_mkts}** ({100 - pc_me_pct:.0f}%) are non-ME.
 
-        The ME fraction differs sharply by cohort:
-        - **1-week**: {pc_1w_total} markets, {pc_1w_me} ME ({pc_1w_me*100//pc_1w_total if pc_1w_total else 0}%) — Weather (70% ME) and Entertainment (61% ME) drive this
-        - **2-week**: {pc_2w_total} markets, {pc_2w_me} ME ({pc_2w_me*100//pc_2w_total if pc_2w_total else 0}%) — most Sports markets are Non-ME (spread bets, point totals, goalscorer props aren't mutually exclusive)
+        The ME fraction by cohort (per-category ME shares are in Section 4):
+        - **1-week**: {pc_1w_total} markets, {pc_1w_me} ME ({pc_1w_me_pct:.0f}%)
+        - **2-week**: {pc_2w_total} markets, {pc_2w_me} ME ({pc_2w_me_pct:.0f}%)
 
-        The 1-week cohort's higher ME fraction is a pleasant surprise: the
-        diverse, higher-edge cohort also has more collateral-efficient
-        structure.
+        {_cohort_note}
         """
     )
-    return ()
+    return pc_1w_me_pct, pc_2w_me_pct, pc_me_pct
 
 
 # ── Section 2: Event Structure Analysis ────────────────────────────────────
@@ -213,7 +232,7 @@ def pc_event_structure_query(query, pc_snap_date):
                 CASE WHEN e.mutually_exclusive = true THEN 'ME' ELSE 'Non-ME' END AS pe_me_label,
                 count(*) AS pe_longshot_count,
                 sum(m.volume_24h) AS pe_total_vol_24h
-            FROM daily_markets m
+            FROM latest_markets m
             LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
             WHERE m.close_time IS NOT NULL
               AND m.close_time != ''
@@ -255,7 +274,7 @@ def pc_event_structure_query(query, pc_snap_date):
             CASE WHEN e.mutually_exclusive = true THEN 'ME' ELSE 'Non-ME' END AS tle_me_label,
             count(*) AS tle_longshot_count,
             sum(m.volume_24h) AS tle_total_vol_24h
-        FROM daily_markets m
+        FROM latest_markets m
         LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
         WHERE m.close_time IS NOT NULL
           AND m.close_time != ''
@@ -306,23 +325,34 @@ def pc_event_structure_viz(alt, mo, pc_event_buckets, pc_top_longshot_events):
 
 
 @app.cell
-def pc_event_commentary(mo):
+def pc_event_commentary(mo, pc_event_buckets, pc_top_longshot_events):
+    def _events(me_label, buckets):
+        _rows = pc_event_buckets[
+            (pc_event_buckets["pe_me_label"] == me_label)
+            & pc_event_buckets["pe_bucket"].isin(buckets)
+        ]
+        return int(_rows["pe_event_count"].sum())
+
+    _largest_me = pc_top_longshot_events[pc_top_longshot_events["tle_me_label"] == "ME"].head(2)
+    _largest_text = " and ".join(
+        f"**{_r.tle_event_title}** ({_r.tle_longshot_count} markets)"
+        for _r in _largest_me.itertuples()
+    ) or "none"
+
     mo.md(
-        """
-        Most ME events are **small clusters**: 81 ME events have just 1
-        investable longshot, and 31 have 2-5. Only 2 ME events have 10+
-        longshot markets — the **NASCAR Autotrader 400** (19 runners, the
-        largest cluster by far) and the **Bitcoin price range** event (12
-        range buckets). Non-ME events show a similar pattern but include
-        more mid-sized clusters: 5 events with 6-10 markets (NBA spreads,
-        SOTU mentions) and 1 with 11-20 (Bitcoin directional).
-
-        The top events table reveals the building blocks for portfolio
-        construction: NASCAR provides the single largest anti-correlated
-        cluster, while crypto range markets and weather temperature buckets
-        provide smaller but numerous ME clusters. Non-ME multi-market
-        events (EPL goalscorers, SOTU attendance, NBA spreads) need to be
-        capped to limit correlated exposure.
+        f"""
+        Most ME events are **small clusters**: {_events("ME", ["1"])} ME events
+        have just 1 investable longshot, and {_events("ME", ["2-5"])} have 2-5.
+        Only {_events("ME", ["11-20", "20+"])} ME events have more than 10
+        longshot markets; the largest ME clusters are {_largest_text}.
+        Non-ME events have {_events("Non-ME", ["6-10"])} events with 6-10
+        markets and {_events("Non-ME", ["11-20", "20+"])} with more than 10.
+
+        The top events table shows the building blocks for portfolio
+        construction: a few large ME events provide the biggest
+        anti-correlated clusters, while many small ME clusters add breadth.
+        Non-ME multi-market events need to be capped to limit correlated
+        exposure.
         """
     )
     return ()
@@ -332,42 +362,65 @@ def pc_event_commentary(mo):
 
 
 @app.cell
-def pc_collateral_query(query, pc_snap_date):
-    pc_me_clusters = query(f"""
-        WITH investable AS (
-            SELECT
-                m.event_ticker AS cl_event_ticker,
-                COALESCE(e.category, 'Unknown') AS cl_category,
-                e.title AS cl_event_title,
-                m.last_price AS cl_yes_price,
-                (100 - m.last_price) AS cl_no_price,
-                m.volume_24h AS cl_vol_24h
-            FROM daily_markets m
-            LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
-            WHERE m.close_time IS NOT NULL
-              AND m.close_time != ''
-              AND m.last_price >= 3
-              AND m.last_price <= 15
-              AND m.volume_24h >= 100
-              AND e.mutually_exclusive = true
-              AND date_diff('day', date('{pc_snap_date}'), date(from_iso8601_timestamp(m.close_time))) BETWEEN 1 AND 14
-        )
+def pc_collateral_query(event_collateral, pd, query, pc_snap_date):
+    pc_me_investable = query(f"""
         SELECT
-            cl_event_ticker,
-            cl_category,
-            cl_event_title,
-            count(*) AS cl_n_markets,
-            avg(cl_no_price) AS cl_avg_no_price,
-            sum(cl_no_price) AS cl_nominal_cost,
-            max(cl_no_price) AS cl_effective_cost,
-            CAST(sum(cl_no_price) AS DOUBLE) / NULLIF(CAST(max(cl_no_price) AS DOUBLE), 0) AS cl_efficiency_ratio,
-            sum(cl_yes_price) AS cl_total_yes_premium,
-            sum(cl_vol_24h) AS cl_total_vol_24h
-        FROM investable
-        GROUP BY cl_event_ticker, cl_category, cl_event_title
-        HAVING count(*) >= 2
-        ORDER BY count(*) DESC
+            m.ticker AS cl_ticker,
+            m.event_ticker AS cl_event_ticker,
+            COALESCE(e.category, 'Unknown') AS cl_category,
+            e.title AS cl_event_title,
+            m.last_price AS cl_yes_price,
+            (100 - m.last_price) AS cl_no_price,
+            m.volume_24h AS cl_vol_24h
+        FROM latest_markets m
+        LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
+        WHERE m.close_time IS NOT NULL
+          AND m.close_time != ''
+          AND m.last_price >= 3
+          AND m.last_price <= 15
+          AND m.volume_24h >= 100
+          AND e.mutually_exclusive = true
+          AND date_diff('day', date('{pc_snap_date}'), date(from_iso8601_timestamp(m.close_time))) BETWEEN 1 AND 14
     """)
+
+    # Exact worst-case collateral of 1 No contract per market: the cluster
+    # loses at most one leg, so collateral = cost - (n - 1) payouts
+    # (longshot.portfolio.collateral)
+    cl_exact = event_collateral(
+        pc_me_investable["cl_event_ticker"],
+        pc_me_investable["cl_no_price"],
+        None,
+        [True] * len(pc_me_investable),
+        markets=pc_me_investable["cl_ticker"],
+    ).to_pandas()
+
+    pc_me_clusters = (
+        pc_me_investable.groupby(["cl_event_ticker", "cl_category", "cl_event_title"], dropna=False)
+        .agg(
+            cl_n_markets=("cl_ticker", "count"),
+            cl_avg_no_price=("cl_no_price", "mean"),
+            cl_nominal_cost=("cl_no_price", "sum"),
+            cl_total_yes_premium=("cl_yes_price", "sum"),
+            cl_total_vol_24h=("cl_vol_24h", "sum"),
+        )
+        .reset_index()
+        .merge(
+            pd.DataFrame({
+                "cl_event_ticker": cl_exact["event_ticker"],
+                "cl_effective_cost": cl_exact["collateral"] * 100,  # cents
+            }),
+            on="cl_event_ticker",
+        )
+    )
+    pc_me_clusters["cl_efficiency_ratio"] = (
+        pc_me_clusters["cl_nominal_cost"]
+        / pc_me_clusters["cl_effective_cost"].where(pc_me_clusters["cl_effective_cost"] > 0)
+    )
+    pc_me_clusters = (
+        pc_me_clusters[pc_me_clusters["cl_n_markets"] >= 2]
+        .sort_values("cl_n_markets", ascending=False)
+        .reset_index(drop=True)
+    )
     return (pc_me_clusters,)
 
 
@@ -385,7 +438,8 @@ def pc_collateral_viz(alt, mo, pd, pc_me_clusters):
         .reset_index()
     )
     pc_cat_collateral["cl_cat_efficiency"] = (
-        pc_cat_collateral["cl_cat_nominal"] / pc_cat_collateral["cl_cat_effective"]
+        pc_cat_collateral["cl_cat_nominal"]
+        / pc_cat_collateral["cl_cat_effective"].where(pc_cat_collateral["cl_cat_effective"] > 0)
     )
     pc_cat_collateral = pc_cat_collateral.sort_values("cl_cat_efficiency", ascending=False)
 
@@ -420,39 +474,67 @@ def pc_collateral_viz(alt, mo, pd, pc_me_clusters):
         mo.md("### Collateral Efficiency by Category"),
         mo.ui.altair_chart(pc_eff_chart),
     ]))
-    return ()
+    return (pc_cat_collateral,)
 
 
 @app.cell
-def pc_collateral_commentary(mo):
+def pc_collateral_commentary(mo, pc_cat_collateral, pc_me_clusters):
+    pc_n_me_clusters = len(pc_me_clusters)
+    pc_avg_cluster_markets = pc_me_clusters["cl_n_markets"].mean() if pc_n_me_clusters else 0.0
+    pc_largest_clusters_text = ", ".join(
+        f"{_r.cl_event_title} with {_r.cl_n_markets} markets"
+        for _r in pc_me_clusters.head(2).itertuples()
+    ) or "none"
+
+    def _ratio(value):
+        return "no net collateral" if value != value else f"{value:.1f}x"
+
+    if pc_n_me_clusters:
+        _top = pc_me_clusters.iloc[0]
+        _example = (
+            f"**Largest cluster — {_top['cl_event_title']}** "
+            f"({_top['cl_n_markets']} longshot markets): nominal cost is "
+            f"{_top['cl_n_markets']} markets × avg {_top['cl_avg_no_price']:.0f}¢ No "
+            f"= \\${_top['cl_nominal_cost'] / 100:,.2f}, exact worst-case collateral is "
+            f"\\${_top['cl_effective_cost'] / 100:,.2f} ({_ratio(_top['cl_efficiency_ratio'])}), "
+            f"and the yes premiums collected total "
+            f"\\${_top['cl_total_yes_premium'] / 100:,.2f} if all resolve No."
+        )
+    else:
+        _example = "No ME event has two or more investable longshots."
+
+    _categories = "\n".join(
+        f"        | {_r.cl_category} | {_ratio(_r.cl_cat_efficiency)} "
+        f"| {_r.cl_cat_events} | {_r.cl_cat_total_markets} |"
+        for _r in pc_cat_collateral.itertuples()
+    )
+    _median = pc_me_clusters["cl_efficiency_ratio"].median()
+
     mo.md(
-        r"""
+        rf"""
         **How ME collateral works**: In a mutually exclusive event, at most
-        one market resolves YES. When you buy No on multiple outcomes, Kalshi
-        only requires collateral equal to the **max single No position cost**,
-        not the sum. This reduces capital requirements for multi-market ME
-        clusters.
-
-        **Actual top cluster — NASCAR Autotrader 400** (19 longshot runners):
-        - Nominal cost = 19 runners × avg 95¢ No price = \$17.99
-        - Effective cost = max(97¢) = \$0.97
-        - **Efficiency ratio = 18.5x**
-        - Total yes premiums collected = \$1.01 if all resolve No
-
-        **Category-level efficiency**:
-        - **Crypto**: 6.3x — driven by the 12-market Bitcoin range cluster
-        - **Sports**: 6.1x — driven almost entirely by the NASCAR event
-        - **Entertainment**: 2.7x — small clusters (4 markets each)
-        - **Weather**: 2.3x — many 2-3 market clusters, consistent but modest
-
-        The efficiency gains are concentrated in a few large clusters. The
-        33 ME cluster events average just 3.2 markets each. Outside of
-        NASCAR and Bitcoin range, efficiency ratios are typically 2-3x.
-        Still valuable — but the collateral story is driven by a handful
-        of large events, not a broad structural advantage.
+        one market resolves YES. When you buy No on multiple outcomes, every
+        No except the one on the winner still pays \$1, so the capital at
+        risk is the **worst-case loss** — total cost minus the payout when
+        the largest leg loses — not the sum of No costs. The tables above use
+        this exact rule (`longshot.portfolio.collateral`).
+
+        {_example}
+
+        **Category-level efficiency** (nominal / exact collateral):
+
+        | Category | Efficiency | Clusters | Markets |
+        |----------|------------|----------|---------|
+{_categories}
+
+        The {pc_n_me_clusters:,} ME cluster events average
+        {pc_avg_cluster_markets:.1f} markets each, and the median cluster's
+        efficiency ratio is {_ratio(_median)}. The collateral story is
+        driven by a handful of large events, not a broad structural
+        advantage.
         """
     )
-    return ()
+    return pc_avg_cluster_markets, pc_largest_clusters_text, pc_n_me_clusters
 
 
 # ── Section 4: Category-Level Portfolio Heuristics ─────────────────────────
@@ -474,7 +556,7 @@ def pc_cat_profile_query(query, pc_snap_date):
                 m.yes_bid AS cp_yes_bid,
                 m.yes_ask AS cp_yes_ask,
                 m.volume_24h AS cp_vol_24h
-            FROM daily_markets m
+            FROM latest_markets m
             LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
             WHERE m.close_time IS NOT NULL
               AND m.close_time != ''
@@ -583,7 +665,7 @@ def pc_heuristic_rules(mo):
 
 
 @app.cell
-def pc_build_portfolio(pd, query, pc_snap_date):
+def pc_build_portfolio(CalibrationModel, pd, query, pc_snap_date):
     # Pull full investable universe at market level
     pc_raw_universe = query(f"""
         SELECT
@@ -603,7 +685,7 @@ def pc_build_portfolio(pd, query, pc_snap_date):
             (m.yes_ask - m.yes_bid) AS pf_spread,
             m.volume_24h AS pf_vol_24h,
             date_diff('day', date('{pc_snap_date}'), date(from_iso8601_timestamp(m.close_time))) AS pf_dte
-        FROM daily_markets m
+        FROM latest_markets m
         LEFT JOIN daily_events e ON m.event_ticker = e.event_ticker
         WHERE m.close_time IS NOT NULL
           AND m.close_time != ''
@@ -632,23 +714,31 @@ def pc_build_portfolio(pd, query, pc_snap_date):
 
     # 4. Combine
     pc_portfolio = pd.concat([pc_me_markets, pc_nonme_markets], ignore_index=True)
+    pc_n_universe = len(pc_raw_universe)
+    pc_n_financials = pc_n_universe - len(pc_filtered)
+    pc_n_capped = len(pc_filtered) - len(pc_portfolio)
 
     # 5. Add computed columns
     pc_portfolio["pf_no_cost_cents"] = 100 - pc_portfolio["pf_last_price"]
     pc_portfolio["pf_position_size"] = 1  # 1 No contract
     pc_portfolio["pf_nominal_collateral"] = pc_portfolio["pf_no_cost_cents"] / 100.0  # dollars
-    # Becker calibration: 5¢ market → 4.18% true prob → ratio 0.836
-    pc_portfolio["pf_true_prob"] = (pc_portfolio["pf_last_price"] / 100.0) * 0.836
+    # Fitted calibration model (per category) when one exists, else the
+    # academic curve
+    pc_calibration = CalibrationModel.load_or_academic()
+    pc_cal_label = "academic" if pc_calibration.meta.get("source") == "academic" else "fitted"
+    pc_portfolio["pf_true_prob"] = pc_calibration.true_prob(
+        pc_portfolio["pf_last_price"].to_numpy(dtype=float), pc_portfolio["pf_category"]
+    )
     # E[P&L] per No contract = (yes_price - 100 * true_prob) / 100 in dollars
     pc_portfolio["pf_expected_pnl"] = (
         (pc_portfolio["pf_last_price"] - 100 * pc_portfolio["pf_true_prob"]) / 100.0
     )
 
-    return (pc_portfolio,)
+    return pc_cal_label, pc_n_capped, pc_n_financials, pc_n_universe, pc_portfolio
 
 
 @app.cell
-def pc_portfolio_summary(alt, mo, pd, pc_portfolio):
+def pc_portfolio_summary(alt, event_collateral, mo, pd, pc_cal_label, pc_portfolio):
     import math
 
     pc_n_markets = len(pc_portfolio)
@@ -659,15 +749,15 @@ def pc_portfolio_summary(alt, mo, pd, pc_portfolio):
     # Nominal collateral = sum of no_cost for all positions
     pc_nominal_total = pc_portfolio["pf_nominal_collateral"].sum()
 
-    # Effective collateral (ME events: max no_cost per event; non-ME: sum)
-    pc_me_effective = (
-        pc_portfolio[pc_portfolio["pf_me"] == 1]
-        .groupby("pf_event_ticker")["pf_no_cost_cents"]
-        .max()
-        .sum() / 100.0
-    )
-    pc_nonme_effective = pc_portfolio[pc_portfolio["pf_me"] == 0]["pf_nominal_collateral"].sum()
-    pc_effective_total = pc_me_effective + pc_nonme_effective
+    # Effective collateral: exact worst-case loss per event (ME events lose
+    # at most one leg; non-ME events can lose every leg)
+    pc_effective_total = event_collateral(
+        pc_portfolio["pf_event_ticker"],
+        pc_portfolio["pf_no_cost_cents"],
+        pc_portfolio["pf_position_size"],
+        pc_portfolio["pf_me"] == 1,
+        markets=pc_portfolio["pf_ticker"],
+    ).column("collateral").to_numpy().sum()
     pc_collateral_savings = pc_nominal_total - pc_effective_total
 
     # Expected P&L
@@ -736,7 +826,7 @@ def pc_portfolio_summary(alt, mo, pd, pc_portfolio):
             | Nominal collateral (1 contract each) | \\${pc_nominal_total:,.2f} |
             | Effective collateral (after ME returns) | \\${pc_effective_total:,.2f} |
             | Collateral savings from ME | \\${pc_collateral_savings:,.2f} |
-            | Expected P&L (Becker calibration) | \\${pc_total_expected_pnl:,.2f} |
+            | Expected P&L ({pc_cal_label} calibration) | \\${pc_total_expected_pnl:,.2f} |
             | 95th percentile loss | \\${pc_pnl_95th_low:,.2f} |
             """
         ),
@@ -748,7 +838,46 @@ def pc_portfolio_summary(alt, mo, pd, pc_portfolio):
         mo.md("### Top 10 Events by Market Count"),
         mo.ui.table(pc_top_port_events, label="Top Events in Portfolio"),
     ]))
-    return ()
+    return (
+        pc_effective_total, pc_n_events, pc_n_markets, pc_n_me_markets,
+        pc_n_nonme_markets, pc_nominal_total, pc_pnl_95th_low, pc_total_expected_pnl,
+    )
+
+
+@app.cell
+def pc_portfolio_stats(pc_n_markets, pc_portfolio, pc_total_expected_pnl):
+    # Figures quoted in the Key Findings and Findings cells
+    pc_edge_cents = 100 * pc_total_expected_pnl / max(pc_n_markets, 1)
+
+    pc_cat_share = pc_portfolio["pf_category"].value_counts(normalize=True) * 100
+    _top = pc_cat_share.head(6)
+    pc_cat_mix_text = ", ".join(f"{_cat} {_pct:.0f}%" for _cat, _pct in _top.items())
+    if len(pc_cat_share) > len(_top):
+        pc_cat_mix_text += f", other {pc_cat_share.iloc[len(_top):].sum():.0f}%"
+
+    _cohorts = pc_portfolio["pf_cohort"].value_counts()
+    pc_cohort_text = ", ".join(
+        f"{100 * _cohorts.get(_c, 0) / max(pc_n_markets, 1):.0f}% {_c} ({_cohorts.get(_c, 0):,} markets)"
+        for _c in ("1-week", "2-week")
+    )
+
+    # Average quoted spread (cents) per category vs the expected edge
+    pc_cat_spread = pc_portfolio.groupby("pf_category")["pf_spread"].mean().dropna().sort_values()
+    pc_spread_text = ", ".join(f"{_cat} {_sp:.1f}¢" for _cat, _sp in pc_cat_spread.items())
+    pc_n_wide_cats = int((pc_cat_spread > pc_edge_cents).sum())
+    pc_n_spread_cats = len(pc_cat_spread)
+
+    _top_cat = pc_cat_share.index[0] if len(pc_cat_share) else "n/a"
+    _cat_events = pc_portfolio[pc_portfolio["pf_category"] == _top_cat]["pf_event_ticker"].value_counts()
+    pc_top_cat_text = (
+        f"{_top_cat} is {pc_cat_share.iloc[0]:.0f}% of the portfolio; its largest "
+        f"event alone is {_cat_events.iloc[0]} markets"
+        if len(_cat_events) else "no category concentration"
+    )
+    return (
+        pc_cat_mix_text, pc_cohort_text, pc_edge_cents, pc_n_spread_cats,
+        pc_n_wide_cats, pc_spread_text, pc_top_cat_text,
+    )
 
 
 @app.cell
@@ -770,46 +899,52 @@ def pc_portfolio_detail(mo, pc_portfolio):
 
 
 @app.cell
-def pc_findings(mo):
+def pc_findings(
+    mo, pc_cal_label, pc_cat_mix_text, pc_cohort_text, pc_edge_cents,
+    pc_effective_total, pc_largest_clusters_text, pc_n_capped, pc_n_events,
+    pc_n_financials, pc_n_markets, pc_n_me_markets, pc_n_nonme_markets,
+    pc_n_spread_cats, pc_n_universe, pc_n_wide_cats, pc_nominal_total,
+    pc_pnl_95th_low, pc_spread_text, pc_top_cat_text, pc_total_expected_pnl,
+):
     mo.md(
-        r"""
+        rf"""
         ---
         ## Findings & Next Steps
 
         ### Portfolio Composition
-        - **374 markets** selected from 425 investable (removed 5 Financials,
-          capped 46 non-ME markets exceeding the 3-per-event limit)
-        - **227 distinct events** — good diversification, average 1.6 markets
-          per event
-        - **184 ME + 190 Non-ME** — roughly balanced, with ME providing
-          anti-correlation and Non-ME providing breadth
-        - **Category mix**: Sports 42%, Weather 25%, Crypto 11%,
-          Entertainment 9%, Politics 5%, Mentions 3%, other 5%
-        - **Cohort split**: 61% 1-week (227 markets), 39% 2-week (147)
+        - **{pc_n_markets:,} markets** selected from {pc_n_universe:,} investable
+          (removed {pc_n_financials:,} Financials, capped {pc_n_capped:,} non-ME
+          markets exceeding the 3-per-event limit)
+        - **{pc_n_events:,} distinct events** — average
+          {pc_n_markets / max(pc_n_events, 1):.1f} markets per event
+        - **{pc_n_me_markets:,} ME + {pc_n_nonme_markets:,} Non-ME** — ME
+          providing anti-correlation and Non-ME providing breadth
+        - **Category mix**: {pc_cat_mix_text}
+        - **Cohort split**: {pc_cohort_text}
 
         ### Collateral & Expected P&L
-        - Nominal collateral (1 contract each): **\$346**
-        - Effective collateral (after ME returns): **\$278** — a 20% savings
-        - The savings are modest because most ME clusters are small (2-4
-          markets). The big efficiency gains concentrate in NASCAR (18.5x)
-          and Bitcoin range (11.7x)
-        - Expected P&L (Becker calibration): **+\$4.56** across 374
-          contracts — an edge of ~1.2 cents per contract
-        - 95th percentile loss: **-\$3.06** — the portfolio can lose money
-          even if the FLB is real, due to variance across hundreds of
-          low-probability events
+        - Nominal collateral (1 contract each): **\${pc_nominal_total:,.2f}**
+        - Effective collateral, the exact worst-case loss per event:
+          **\${pc_effective_total:,.2f}**. Non-ME events still need their
+          full nominal cost.
+        - The savings come mostly from the largest ME clusters
+          ({pc_largest_clusters_text}). Most ME clusters are small and save
+          much less.
+        - Expected P&L ({pc_cal_label} calibration): **\${pc_total_expected_pnl:,.2f}**
+          across {pc_n_markets:,} contracts — an edge of ~{pc_edge_cents:.1f}
+          cents per contract
+        - 95th percentile P&L: **\${pc_pnl_95th_low:,.2f}** — the portfolio
+          can lose money even if the FLB is real, due to variance across
+          hundreds of low-probability events
 
         ### Key Risks
-        - **Sports concentration**: 42% of portfolio in Sports, creating
-          implicit correlation to a few sporting events (NASCAR alone is
-          19 markets)
-        - **Thin liquidity in edge categories**: Weather has tight 2¢
-          spreads, but Crypto (3.4¢), Entertainment (5.4¢), and especially
-          Sports (10.9¢) have spreads that eat into the ~1.2¢ per-contract
-          edge
-        - **Spread costs dominate**: The 1.2¢ expected edge per contract is
-          smaller than the average spread in most categories. Execution at
-          mid or better is critical
+        - **Category concentration**: {pc_top_cat_text}, creating implicit
+          correlation to a few events
+        - **Spread costs dominate**: average quoted spreads by category are
+          {pc_spread_text}. The ~{pc_edge_cents:.1f}¢ expected edge per
+          contract is smaller than the average spread in {pc_n_wide_cats} of
+          {pc_n_spread_cats} categories, so execution at mid or better is
+          critical
         - **Single-snapshot bias**: Portfolio composition changes daily as
           events resolve and new ones open
 
@@ -819,7 +954,7 @@ def pc_findings(mo):
         2. **Track fills**: Monitor execution quality — what fraction of
            limit orders fill? Average slippage vs quoted prices?
         3. **Monitor resolutions**: Track outcomes over 2-4 weeks to measure
-           realized edge vs the +\$4.56 Becker-calibrated expectation
+           realized edge vs the \${pc_total_expected_pnl:,.2f} calibrated expectation
         4. **Refine**: If edge materializes, concentrate on categories with
            positive realized returns and increase to 5-10 contracts per
            market
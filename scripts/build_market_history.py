@@ -0,0 +1,60 @@
+"""CLI: fold hourly market pulls into the SCD-2 market history table.
+
+Reads every markets/daily/date=.../hour=... partition newer than the
+history's high-water mark and appends new versions to
+markets/history/data.parquet. Safe to re-run; already-folded hours are
+skipped.
+
+Usage:
+    uv run python scripts/build_market_history.py
+    uv run python scripts/build_market_history.py --as-of 1735768800 --ticker KXHIGHNY-25JAN01-B55
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+
+from longshot.storage.history import compact_hourly_into_history, market_state_as_of
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Fold hourly market pulls into the SCD-2 history table."
+    )
+    parser.add_argument(
+        "--as-of",
+        type=int,
+        default=None,
+        help="After compacting, print the market state at this Unix timestamp",
+    )
+    parser.add_argument(
+        "--ticker",
+        action="append",
+        default=None,
+        help="Restrict --as-of output to this ticker (repeatable)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    summary = compact_hourly_into_history()
+
+    print("\n=== Market History Compaction Complete ===")
+    print(f"  Hourly pulls folded : {summary['pulls_folded']}")
+    print(f"  Rows read           : {summary['rows_in']}")
+    print(f"  History rows        : {summary['history_rows']}")
+    print(f"  Through ts          : {summary['through_ts']}")
+    print(f"  History path        : {summary['history_path']}")
+
+    if args.as_of is not None:
+        state = market_state_as_of(args.as_of, tickers=args.ticker)
+        print(f"\n=== Market state as of {args.as_of}: {state.num_rows} markets ===")
+        print(state.select(["ticker", "status", "yes_bid", "yes_ask", "last_price", "volume"]).to_pandas())
+
+
+if __name__ == "__main__":
+    main()
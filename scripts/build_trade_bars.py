@@ -0,0 +1,47 @@
+"""CLI: rebuild trade bars (OHLCV, VWAP, taker-side volume) from the trades dataset.
+
+Incremental snapshot runs keep the 1-minute bars current; use this after a
+backfill, a historical crawl or a ``--full-trades`` run, or to build another
+interval.  Reads every live and historical trades partition, deduplicated by
+``trade_id``.
+
+Usage:
+    uv run python scripts/build_trade_bars.py
+    uv run python scripts/build_trade_bars.py --interval 3600
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+
+from longshot.storage.bars import BASE_INTERVAL, rebuild_trade_bars
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rebuild trade bars from the trades dataset."
+    )
+    parser.add_argument(
+        "--interval",
+        type=int,
+        default=BASE_INTERVAL,
+        help=f"Bar width in seconds (default: {BASE_INTERVAL})",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    path, trade_count = rebuild_trade_bars(args.interval)
+
+    print("\n=== Trade Bars Rebuilt ===")
+    print(f"  Interval          : {args.interval}s")
+    print(f"  Trades            : {trade_count}")
+    print(f"  Path              : {path}")
+
+
+if __name__ == "__main__":
+    main()
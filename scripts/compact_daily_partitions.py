@@ -0,0 +1,76 @@
+"""CLI: compact completed days of hourly partitions into per-day parquet files.
+
+By default compacts every completed day with hourly files not yet covered by
+a manifest, for all hourly datasets.
+
+Usage:
+    uv run python scripts/compact_daily_partitions.py
+    uv run python scripts/compact_daily_partitions.py --dataset events/daily --date 2026-02-20
+    uv run python scripts/compact_daily_partitions.py --delete-hourly
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+
+from longshot.storage.compaction import (
+    DATASET_SORT_KEYS,
+    TARGET_FILE_BYTES,
+    compact_day,
+    uncompacted_days,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compact hourly daily_markets / daily_events partitions into per-day files."
+    )
+    parser.add_argument(
+        "--dataset",
+        choices=sorted(DATASET_SORT_KEYS),
+        action="append",
+        default=None,
+        help="Dataset to compact (repeatable; default: all)",
+    )
+    parser.add_argument(
+        "--date",
+        default=None,
+        help="Compact only this day (YYYY-MM-DD); default: every uncompacted completed day",
+    )
+    parser.add_argument(
+        "--target-file-mb",
+        type=int,
+        default=TARGET_FILE_BYTES // (1024 * 1024),
+        help="In-memory MB per output file before compression (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--delete-hourly",
+        action="store_true",
+        help="Delete the hourly source files after the manifest is committed",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    for dataset in args.dataset or sorted(DATASET_SORT_KEYS):
+        days = [args.date] if args.date else uncompacted_days(dataset)
+        print(f"\n=== {dataset}: {len(days)} day(s) to compact ===")
+        for day in days:
+            manifest = compact_day(
+                dataset,
+                day,
+                target_file_bytes=args.target_file_mb * 1024 * 1024,
+                delete_hourly=args.delete_hourly,
+            )
+            print(
+                f"  {day}: {len(manifest['hours'])} hours, {manifest['rows']:,} rows "
+                f"→ {len(manifest['files'])} file(s) (gen={manifest['generation']})"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""CLI: fit the price → true-probability calibration model from settled data.
+
+Each trade's ``yes_price`` is paired with its market's final ``result``
+(live and historical tiers), fitted per category, and written to
+``calibration/{name}.json``, where screening and portfolio code load it with
+``CalibrationModel.load(name)``.
+
+Usage:
+    uv run python scripts/fit_calibration.py
+    uv run python scripts/fit_calibration.py --method isotonic --group-by series_ticker --name by_series
+    uv run python scripts/fit_calibration.py --by-contracts --min-count 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+
+import numpy as np
+
+from longshot.analytics.calibration import CALIBRATION_METHODS, CalibrationModel
+from longshot.storage.s3 import read_markets_unified, read_trades_unified
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Fit the calibration model from settled trades."
+    )
+    parser.add_argument("--name", default="default", help="Model name (default: default)")
+    parser.add_argument(
+        "--method",
+        choices=CALIBRATION_METHODS,
+        default="logistic",
+        help="Curve family (default: logistic)",
+    )
+    parser.add_argument(
+        "--group-by",
+        default="series_category",
+        help="Markets column to fit per group ('none' for pooled only; default: series_category)",
+    )
+    parser.add_argument(
+        "--min-count",
+        type=int,
+        default=500,
+        help="Trades a group needs for its own curve (default: 500)",
+    )
+    parser.add_argument(
+        "--by-contracts",
+        action="store_true",
+        help="Weight each trade by its contract count",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    group_by = None if args.group_by == "none" else args.group_by
+    model = CalibrationModel.fit_trades(
+        read_trades_unified(),
+        read_markets_unified(),
+        group_by=group_by,
+        by_contracts=args.by_contracts,
+        method=args.method,
+        min_count=args.min_count,
+    )
+    path = model.save(args.name)
+
+    prices = np.array([3.0, 5.0, 10.0, 15.0])
+    print("\n=== Calibration Fit Complete ===")
+    print(f"  Method            : {args.method}")
+    print(f"  Trades            : {model.meta['n_obs']['*']:,}")
+    print(f"  Groups            : {len(model.categories)} (+ pooled)")
+    print(f"  Path              : {path}")
+    print("  Pooled true prob  : " + ", ".join(
+        f"{p:.0f}¢ → {q:.2%}" for p, q in zip(prices, model.true_prob(prices))
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""CLI: ingest Kalshi candlesticks (OHLC) into the candle store.
+
+Fetches candles for every market open at some point in ``[--start, --end]``
+(live and historical tiers) and merges them into
+``candles/interval={1m,1h,1d}/``.  Read them back with
+``longshot.storage.candles.candles(ticker, start, end, interval)``.
+
+Usage:
+    uv run python scripts/ingest_candles.py --start 1735689600 --end 1738368000 --interval 1h
+    uv run python scripts/ingest_candles.py --start 1735689600 --end 1735776000 --interval 1m --ticker KXHIGHNY-25JAN01-B45
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+
+from longshot.ingestion.candles import run_candles
+from longshot.storage.candles import INTERVALS
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Ingest Kalshi candlesticks into the candle store."
+    )
+    parser.add_argument("--start", type=int, required=True, help="Range start (Unix ts)")
+    parser.add_argument("--end", type=int, required=True, help="Range end (Unix ts, inclusive)")
+    parser.add_argument(
+        "--interval",
+        choices=sorted(INTERVALS),
+        default="1h",
+        help="Candle interval (default: 1h)",
+    )
+    parser.add_argument(
+        "--ticker",
+        action="append",
+        default=None,
+        help="Only this market (repeatable; default: all markets open in the range)",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=8,
+        help="Concurrent per-market fetches (default: 8)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    summary = run_candles(
+        args.start, args.end, args.interval, tickers=args.ticker, max_workers=args.max_workers,
+    )
+
+    print("\n=== Candle Ingestion Complete ===")
+    print(f"  Interval          : {summary['interval']}")
+    print(f"  Range             : {summary['start_ts']} .. {summary['end_ts']}")
+    print(f"  Markets           : {summary['market_count']}")
+    print(f"  Candles           : {summary['candle_count']}")
+    print(f"  Shards written    : {len(summary['shard_paths'])}")
+
+
+if __name__ == "__main__":
+    main()
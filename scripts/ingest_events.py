@@ -10,41 +10,18 @@ from __future__ import annotations
 
 import logging
 
-import pyarrow as pa
 import pyarrow.parquet as pq
-import s3fs
 
 from longshot.api.client import KalshiClient
 from longshot.api.rate_limiter import TokenBucket
-from longshot.config import SETTINGS
+from longshot.storage.s3 import _base_path, _events_to_table, _get_fs
+from longshot.storage.writer import atomic_open
 
 logger = logging.getLogger(__name__)
 
-EVENTS_SCHEMA = pa.schema(
-    [
-        pa.field("event_ticker", pa.string()),
-        pa.field("series_ticker", pa.string()),
-        pa.field("category", pa.string()),
-        pa.field("title", pa.string()),
-        pa.field("sub_title", pa.string()),
-        pa.field("mutually_exclusive", pa.bool_()),
-        pa.field("collateral_return_type", pa.string()),
-        pa.field("strike_date", pa.string()),
-        pa.field("strike_period", pa.string()),
-    ]
-)
-
-
-def _get_fs() -> s3fs.S3FileSystem:
-    return s3fs.S3FileSystem(
-        key=SETTINGS.aws_access_key_id,
-        secret=SETTINGS.aws_secret_access_key,
-        client_kwargs={"region_name": SETTINGS.aws_region},
-    )
-
 
 def _events_path() -> str:
-    return f"s3://{SETTINGS.s3_bucket}/{SETTINGS.s3_prefix}/events/all/data.parquet"
+    return f"{_base_path()}/events/all/data.parquet"
 
 
 def run() -> None:
@@ -72,25 +49,12 @@ def run() -> None:
                 break
 
     # Build table
-    table = pa.table(
-        {
-            "event_ticker": [e["event_ticker"] for e in events],
-            "series_ticker": [e.get("series_ticker") for e in events],
-            "category": [e.get("category") for e in events],
-            "title": [e.get("title") for e in events],
-            "sub_title": [e.get("sub_title") for e in events],
-            "mutually_exclusive": [e.get("mutually_exclusive") for e in events],
-            "collateral_return_type": [e.get("collateral_return_type") for e in events],
-            "strike_date": [e.get("strike_date") for e in events],
-            "strike_period": [e.get("strike_period") for e in events],
-        },
-        schema=EVENTS_SCHEMA,
-    )
+    table = _events_to_table(events)
 
     # Write to S3
     fs = _get_fs()
     path = _events_path()
-    with fs.open(path, "wb") as f:
+    with atomic_open(path, fs=fs) as f:
         pq.write_table(table, f)
 
     print(f"\nDone: {len(events):,} events written to {path}")
@@ -0,0 +1,64 @@
+"""CLI: ingest Kalshi's historical tier (archived markets and trades) into S3.
+
+Markets settled before the historical cutoff and trades older than it are no
+longer served by the live endpoints.  This crawls ``/historical/markets``
+and ``/historical/trades`` into the same markets/trades datasets; both steps
+resume where an interrupted run stopped.
+
+Usage:
+    uv run python scripts/ingest_historical.py
+    uv run python scripts/ingest_historical.py --skip-trades
+    uv run python scripts/ingest_historical.py --restart      # recrawl markets from the first page
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+
+from longshot.ingestion.historical import run_historical
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Ingest Kalshi historical-tier markets+trades into S3."
+    )
+    parser.add_argument(
+        "--skip-trades",
+        action="store_true",
+        help="Skip historical trades (markets only)",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore the markets crawl checkpoint and start from the first page",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=8,
+        help="Concurrent per-ticker trade fetches (default: 8)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    summary = run_historical(
+        skip_trades=args.skip_trades, restart=args.restart, max_workers=args.max_workers,
+    )
+    cutoff, markets, trades = summary["cutoff"], summary["markets"], summary["trades"]
+
+    print("\n=== Historical Ingestion Complete ===")
+    print(f"  Markets cutoff    : {cutoff['market_settled_ts']}")
+    print(f"  Trades cutoff     : {cutoff['trades_created_ts']}")
+    print(f"  Markets           : {markets['rows']} ({markets['fetched']} this run, {len(markets['parts'])} part(s))")
+    if trades is not None:
+        print(f"  Trade tickers     : {trades['tickers_complete']}/{trades['tickers']} complete")
+        print(f"  Trades this run   : {trades['trade_count']} ({len(trades['paths'])} part(s))")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,36 +16,26 @@ import logging
 
 import pyarrow as pa
 import pyarrow.parquet as pq
-import s3fs
+from fsspec import AbstractFileSystem
 
 from longshot.api.client import KalshiClient
 from longshot.api.models import MarketsResponse
 from longshot.api.rate_limiter import TokenBucket
-from longshot.config import SETTINGS
-from longshot.storage.s3 import MARKETS_SCHEMA, _markets_to_table
+from longshot.storage.s3 import MARKETS_SCHEMA, _base_path, _get_fs, _markets_to_table
+from longshot.storage.writer import atomic_open
 
 logger = logging.getLogger(__name__)
 
 
-def _get_fs() -> s3fs.S3FileSystem:
-    return s3fs.S3FileSystem(
-        key=SETTINGS.aws_access_key_id,
-        secret=SETTINGS.aws_secret_access_key,
-        client_kwargs={"region_name": SETTINGS.aws_region},
-    )
-
-
 def _chunk_path(chunk_num: int) -> str:
-    return (
-        f"s3://{SETTINGS.s3_bucket}/{SETTINGS.s3_prefix}"
-        f"/markets/all/chunk_{chunk_num:04d}.parquet"
-    )
+    return f"{_base_path()}/markets/all/chunk_{chunk_num:04d}.parquet"
 
 
-def write_chunk(fs: s3fs.S3FileSystem, table: pa.Table, chunk_num: int) -> str:
+def write_chunk(fs: AbstractFileSystem, table: pa.Table, chunk_num: int) -> str:
     path = _chunk_path(chunk_num)
-    with fs.open(path, "wb") as f:
-        pq.write_table(table, f)
+    with atomic_open(path, fs=fs) as f:
+        # One row group per chunk
+        pq.write_table(table, f, row_group_size=max(table.num_rows, 1), compression="zstd")
     logger.info("Wrote chunk %d (%d rows) → %s", chunk_num, table.num_rows, path)
     return path
 
@@ -0,0 +1,42 @@
+"""CLI: ingest Kalshi series metadata into the series dimension table.
+
+Series are few (a few thousand rows), so each run replaces
+``series/data.parquet`` wholesale and refreshes the local cache that
+``longshot.storage.series.read_series`` serves from.
+
+Usage:
+    uv run python scripts/ingest_series.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+
+from longshot.ingestion.series import run_series
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Ingest Kalshi series metadata into S3."
+    )
+    parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    summary = run_series()
+
+    print("\n=== Series Ingestion Complete ===")
+    print(f"  Series            : {summary['series_count']}")
+    print(f"  Elapsed           : {summary['elapsed_s']}s")
+    print(f"  Path              : {summary['path']}")
+    print("  Categories:")
+    for category, count in summary["category_counts"].items():
+        print(f"    {category:<24}: {count:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,12 @@
-"""CLI: ingest a single snapshot from Kalshi into S3.
+"""CLI: ingest a single snapshot (or a backfill range) from Kalshi into S3.
+
+A backfill crawls the market universe and fetches trades once, then splits
+them into one partition per snapshot.
 
 Usage:
     uv run python scripts/ingest_snapshot.py --snapshot-ts 1735768800
+    uv run python scripts/ingest_snapshot.py --start 1704139200 --end 1735761600
+    uv run python scripts/ingest_snapshot.py --start 1704139200 --end 1735761600 --step 604800
 """
 
 from __future__ import annotations
@@ -9,32 +14,61 @@ from __future__ import annotations
 import argparse
 import logging
 
-from longshot.ingestion.snapshot import run_snapshot
+from longshot.ingestion.snapshot import run_backfill, run_snapshot
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Ingest a Kalshi markets+trades snapshot into S3."
     )
-    parser.add_argument(
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument(
         "--snapshot-ts",
         type=int,
-        required=True,
         help="Unix timestamp for the snapshot (e.g. 1735768800 = 2025-01-01T20:00:00Z)",
     )
+    mode.add_argument(
+        "--start",
+        type=int,
+        help="Backfill: first snapshot Unix timestamp (requires --end)",
+    )
+    parser.add_argument(
+        "--end",
+        type=int,
+        help="Backfill: last snapshot Unix timestamp (inclusive)",
+    )
+    parser.add_argument(
+        "--step",
+        type=int,
+        default=86_400,
+        help="Backfill: seconds between snapshots (default: 86400)",
+    )
     parser.add_argument(
         "--skip-trades",
         action="store_true",
         help="Skip trades ingestion (markets only)",
     )
+    parser.add_argument(
+        "--full-trades",
+        action="store_true",
+        help="Ignore trade watermarks: refetch each ticker's full history and overwrite the trades partition",
+    )
     args = parser.parse_args()
+    if args.start is not None and args.end is None:
+        parser.error("--start requires --end")
 
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s %(levelname)s %(name)s: %(message)s",
     )
 
-    summary = run_snapshot(args.snapshot_ts, skip_trades=args.skip_trades)
+    if args.start is not None:
+        _backfill(args)
+        return
+
+    summary = run_snapshot(
+        args.snapshot_ts, skip_trades=args.skip_trades, incremental=not args.full_trades,
+    )
 
     print("\n=== Snapshot Ingestion Complete ===")
     print(f"  Snapshot TS       : {summary['snapshot_ts']}")
@@ -44,6 +78,25 @@ def main() -> None:
     print(f"  All markets path  : {summary['all_markets_path']}")
     print(f"  Snapshot path     : {summary['snapshot_markets_path']}")
     print(f"  Trades path       : {summary['trades_path']}")
+    print("  Markets stream stages (busy / idle / blocked s):")
+    for st in summary["markets_stream_stages"]:
+        print(f"    {st['name']:<7}: {st['busy_s']:.2f} / {st['idle_s']:.2f} / {st['blocked_s']:.2f}")
+
+
+def _backfill(args: argparse.Namespace) -> None:
+    summary = run_backfill(args.start, args.end, args.step, skip_trades=args.skip_trades)
+
+    print("\n=== Snapshot Backfill Complete ===")
+    print(f"  Range             : {summary['start_ts']} .. {summary['end_ts']} every {summary['step']}s")
+    print(f"  Snapshots         : {len(summary['snapshots'])}")
+    print(f"  All markets       : {summary['all_market_count']}")
+    print(f"  Union markets     : {summary['union_market_count']}")
+    print(f"  Trades fetched    : {summary['fetched_trade_count']}")
+    print(f"  Trades written    : {summary['partition_trade_count']}")
+    print(f"  All markets path  : {summary['all_markets_path']}")
+    print(f"  {'snapshot_ts':>12}{'markets':>10}{'trades':>12}")
+    for snap in summary["snapshots"]:
+        print(f"  {snap['snapshot_ts']:>12}{snap['snapshot_market_count']:>10}{snap['trade_count']:>12}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,81 @@
+"""CLI: snapshot orderbook depth for the investable longshot universe.
+
+The universe (3-15 cents, 1-14 days to close, volume_24h >= 100) comes from
+the latest full market pull (``scripts/ingest_snapshot.py``).  Books are
+stored as 101-slot price-indexed arrays; query them with
+``longshot.analytics.orderbook.cost_to_buy_no``.
+
+Usage:
+    uv run python scripts/snapshot_orderbooks.py
+    uv run python scripts/snapshot_orderbooks.py --contracts 50
+    uv run python scripts/snapshot_orderbooks.py --ticker KXHIGHNY-25JAN01-B45
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from longshot.analytics.orderbook import cost_to_buy_no
+from longshot.ingestion.orderbooks import run_orderbook_snapshot
+from longshot.storage.orderbooks import read_orderbooks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Snapshot Kalshi orderbooks for the investable longshot universe."
+    )
+    parser.add_argument(
+        "--ticker",
+        action="append",
+        default=None,
+        help="Only this market (repeatable; default: investable longshot universe)",
+    )
+    parser.add_argument(
+        "--depth",
+        type=int,
+        default=None,
+        help="Price levels per side to request (default: full book)",
+    )
+    parser.add_argument(
+        "--contracts",
+        type=int,
+        default=10,
+        help="Report the cost of buying this many No contracts per market (default: 10)",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=8,
+        help="Concurrent orderbook fetches (default: 8)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    summary = run_orderbook_snapshot(tickers=args.ticker, depth=args.depth, max_workers=args.max_workers)
+    books = read_orderbooks(summary["snapshot_ts"])
+    if args.ticker:
+        # The hour's partition also holds books from other runs
+        books = books.filter(pc.is_in(books.column("ticker"), value_set=pa.array(args.ticker)))
+    costs = cost_to_buy_no(books, args.contracts)
+    fully = pc.sum(pc.equal(costs.column("filled"), args.contracts)).as_py() or 0
+
+    print("\n=== Orderbook Snapshot Complete ===")
+    print(f"  Snapshot TS       : {summary['snapshot_ts']}")
+    print(f"  Markets           : {summary['market_count']}")
+    print(f"  Books stored      : {summary['book_count']}")
+    print(f"  Path              : {summary['path']}")
+    print(f"  Full {args.contracts}-No fills : {fully}/{costs.num_rows} markets")
+    if costs.num_rows:
+        print(f"  Median slippage   : {pc.approximate_median(costs.column('slippage')).as_py()} cents")
+
+
+if __name__ == "__main__":
+    main()